@@ -0,0 +1,232 @@
+import threading
+import numpy as np
+import pandas as pd
+from sqlalchemy import Float, String, select, type_coerce
+from models import db, ActivityDailyRollup, CostDailyRollup, ActivityType, CostType, Lab, Project, Personnel
+from data_version import get_data_version
+
+# pandas 분석 엔진 (교차표/추이 리포트)
+# 일별 집계 테이블을 pd.read_sql로 읽어 categorical 위주의 작은 DataFrame으로 보관하고
+# (활동/비용 데이터 버전이 같으면 재사용) 리포트는 groupby / pivot_table로 벡터화 계산한다.
+# 리포트 함수는 DataFrame만 받으므로 DB 없이 생성한 데이터로도 실행 가능 (analytics_benchmark.py)
+
+ANALYTICS_TABLES = ('activities', 'costs')
+
+_frames = {}  # 'version' → 데이터 버전, 'activities'/'costs' → DataFrame
+_frames_lock = threading.Lock()
+
+# Enum 컬럼은 DB에 이름(OWN/ACTUAL 등)으로 저장되므로 값(own/actual)으로 바꾼 고정 categorical로 변환
+def _enum_categorical(values, enum_class):
+    dtype = pd.CategoricalDtype([member.value for member in enum_class])
+    return values.map({member.name: member.value for member in enum_class}).astype(dtype)
+
+# 활동 사실 (일 × 랩 × 프로젝트 × 인원 × 유형)
+#  activity_date: datetime64, lab_id/project_id/personnel_id: category (project_id 0 = 미상),
+#  activity_type: category, hours: float64, activity_count: int32
+def load_activity_frame(connection):
+    table = ActivityDailyRollup.__table__
+    stmt = select(
+        type_coerce(table.c.activity_date, String).label('activity_date'),
+        table.c.lab_id, table.c.project_id, table.c.personnel_id,
+        type_coerce(table.c.activity_type, String).label('activity_type'),
+        table.c.total_hours.label('hours'),
+        table.c.activity_count,
+    )
+    frame = pd.read_sql(stmt, connection)
+    frame['activity_date'] = pd.to_datetime(frame['activity_date'], format='%Y-%m-%d')
+    for column in ('lab_id', 'project_id', 'personnel_id'):
+        frame[column] = frame[column].astype('category')
+    frame['activity_type'] = _enum_categorical(frame['activity_type'], ActivityType)
+    frame['hours'] = frame['hours'].astype('float64')
+    frame['activity_count'] = frame['activity_count'].astype('int32')
+    return frame
+
+# 비용 사실 (일 × 랩 × 프로젝트 × 비용유형 × 카테고리)
+def load_cost_frame(connection):
+    table = CostDailyRollup.__table__
+    stmt = select(
+        type_coerce(table.c.cost_date, String).label('cost_date'),
+        table.c.lab_id, table.c.project_id,
+        type_coerce(table.c.cost_type, String).label('cost_type'),
+        table.c.category,
+        type_coerce(table.c.total_amount, Float).label('amount'),
+        table.c.cost_count,
+    )
+    frame = pd.read_sql(stmt, connection)
+    frame['cost_date'] = pd.to_datetime(frame['cost_date'], format='%Y-%m-%d')
+    for column in ('lab_id', 'project_id', 'category'):
+        frame[column] = frame[column].astype('category')
+    frame['cost_type'] = _enum_categorical(frame['cost_type'], CostType)
+    frame['amount'] = frame['amount'].astype('float64')
+    frame['cost_count'] = frame['cost_count'].astype('int32')
+    return frame
+
+# (활동, 비용) DataFrame — 데이터 버전이 바뀌었을 때만 다시 읽음 (쿼리 1회로 버전 확인)
+def get_frames():
+    version = get_data_version(*ANALYTICS_TABLES)
+    with _frames_lock:
+        if _frames.get('version') != version:
+            connection = db.session.connection()
+            _frames.update(version=version, activities=load_activity_frame(connection), costs=load_cost_frame(connection))
+        return _frames['activities'], _frames['costs']
+
+def filter_period(frame, date_column, start_date=None, end_date=None):
+    mask = np.ones(len(frame), dtype=bool)
+    if start_date:
+        mask &= (frame[date_column] >= pd.Timestamp(start_date)).to_numpy()
+    if end_date:
+        mask &= (frame[date_column] <= pd.Timestamp(end_date)).to_numpy()
+    return frame if mask.all() else frame[mask]
+
+def _actual(costs):
+    return costs[costs['cost_type'] == CostType.ACTUAL.value]
+
+# 랩 × 프로젝트 활동 시간 (프로젝트 0 = 미상)
+def lab_project_hours(activities):
+    return activities.pivot_table(
+        index='lab_id', columns='project_id', values='hours',
+        aggfunc='sum', fill_value=0.0, observed=True
+    )
+
+# 인원 × 랩 활동 비중 (인원별 전체 시간 대비, total_hours 컬럼에 인원별 합계)
+def personnel_lab_utilization(activities):
+    hours = activities.pivot_table(
+        index='personnel_id', columns='lab_id', values='hours',
+        aggfunc='sum', fill_value=0.0, observed=True
+    )
+    total = hours.sum(axis=1)
+    shares = hours.div(total.where(total > 0), axis=0)
+    shares['total_hours'] = total
+    return shares
+
+# 랩별 시간당 비용 (실제 비용 ÷ 활동 시간, 시간이 없으면 NaN)
+def cost_per_hour(activities, costs):
+    hours = activities.groupby('lab_id', observed=True)['hours'].sum()
+    actual = _actual(costs).groupby('lab_id', observed=True)['amount'].sum()
+    report = pd.concat({'hours': hours, 'actual_cost': actual}, axis=1).fillna(0.0)
+    report.index = report.index.astype('int64')
+    report['cost_per_hour'] = report['actual_cost'] / report['hours'].where(report['hours'] > 0)
+    return report.sort_index()
+
+# 랩 × 월 합계 (행: 랩 id, 열: 월 Period)
+def _monthly(frame, date_column, value):
+    month = frame[date_column].dt.to_period('M').rename('month')
+    monthly = frame.groupby(['lab_id', month], observed=True)[value].sum().unstack('month')
+    monthly.index = monthly.index.astype('int64')
+    return monthly
+
+# 랩 × 월 활동 시간/실제 비용과 전월 대비 증감 (delta: 차이, change: 증감률)
+# 랩의 첫 활동/비용 월부터 전체 마지막 월까지 연속된 월로 채워 비교 (빈 월은 0)
+MONTH_OVER_MONTH_COLUMNS = ['hours', 'hours_delta', 'hours_change', 'actual_cost', 'actual_cost_delta', 'actual_cost_change']
+
+def month_over_month(activities, costs):
+    measures = {
+        'hours': _monthly(activities, 'activity_date', 'hours'),
+        'actual_cost': _monthly(_actual(costs), 'cost_date', 'amount'),
+    }
+    months = measures['hours'].columns.union(measures['actual_cost'].columns)
+    if months.empty:
+        empty_index = pd.MultiIndex.from_arrays([[], []], names=['lab_id', 'month'])
+        return pd.DataFrame(columns=MONTH_OVER_MONTH_COLUMNS, index=empty_index, dtype='float64')
+    labs = measures['hours'].index.union(measures['actual_cost'].index).rename('lab_id')
+    months = pd.period_range(months.min(), months.max(), freq='M', name='month')
+    measures = {name: monthly.reindex(index=labs, columns=months).fillna(0.0) for name, monthly in measures.items()}
+    started = ((measures['hours'] > 0) | (measures['actual_cost'] > 0)).cummax(axis=1)
+
+    columns = {}
+    for name, monthly in measures.items():
+        previous = monthly.shift(1, axis=1)
+        columns[name] = monthly
+        columns[f'{name}_delta'] = monthly - previous
+        columns[f'{name}_change'] = columns[f'{name}_delta'] / previous.where(previous > 0)
+    # (지표, 월) 열 → (랩, 월) 행, 시작 전 월은 제외
+    report = pd.concat({name: frame.where(started) for name, frame in columns.items()}, axis=1)
+    report = report.stack('month').dropna(subset=['hours', 'actual_cost'])[MONTH_OVER_MONTH_COLUMNS]
+    report.index = report.index.set_levels(report.index.levels[1].strftime('%Y-%m'), level='month')
+    return report
+
+# 랩(또는 랩 × 프로젝트)별 예산 대비 실제 비용 (variance = 예산 - 실제, execution_rate = 실제 ÷ 예산)
+def budget_vs_actual(costs, by_project=False):
+    index = ['lab_id', 'project_id'] if by_project else ['lab_id']
+    report = costs.pivot_table(
+        index=index, columns='cost_type', values='amount',
+        aggfunc='sum', fill_value=0.0, observed=False
+    )
+    report = report.reindex(columns=[CostType.BUDGET.value, CostType.ACTUAL.value], fill_value=0.0)
+    report.columns = ['budget', 'actual']
+    report = report[(report['budget'] != 0) | (report['actual'] != 0)].copy()
+    report['variance'] = report['budget'] - report['actual']
+    report['execution_rate'] = report['actual'] / report['budget'].where(report['budget'] > 0)
+    return report
+
+# 리포트 이름 → (계산 함수(활동, 비용, 옵션), 행 기준 라벨 종류, 열 기준 라벨 종류)
+PIVOT_REPORTS = {
+    'lab-project-hours': (lambda a, c, options: lab_project_hours(a), ('labs',), 'projects'),
+    'personnel-lab-utilization': (lambda a, c, options: personnel_lab_utilization(a), ('personnel',), 'labs'),
+    'cost-per-hour': (lambda a, c, options: cost_per_hour(a, c), ('labs',), None),
+    'month-over-month': (lambda a, c, options: month_over_month(a, c), ('labs', None), None),
+    'budget-vs-actual': (lambda a, c, options: budget_vs_actual(c, options.get('by_project', False)), ('labs', 'projects'), None),
+}
+
+def _json_value(value):
+    if isinstance(value, (np.integer, np.floating)):
+        value = value.item()
+    if isinstance(value, float) and not np.isfinite(value):
+        return None
+    return value
+
+# 프로젝트 id 0(미상)은 None으로
+def _label_key(value, kind):
+    value = _json_value(value)
+    return None if kind == 'projects' and value == 0 else value
+
+# DataFrame → {index_names, index, columns, data} (pandas orient='split'과 같은 배열 구조, NaN/inf는 null)
+def frame_payload(frame, index_kinds=(), column_kind=None):
+    if isinstance(frame.index, pd.MultiIndex):
+        index = [[_label_key(value, kind) for value, kind in zip(row, index_kinds)] for row in frame.index]
+    else:
+        kind = index_kinds[0] if index_kinds else None
+        index = [_label_key(value, kind) for value in frame.index]
+    values = frame.to_numpy(dtype='float64', na_value=np.nan)
+    return {
+        'index_names': [str(name) for name in frame.index.names],
+        'index': index,
+        'columns': [_label_key(column, column_kind) for column in frame.columns],
+        'data': [[None if np.isnan(value) else value for value in row] for row in values.tolist()],
+    }
+
+# 리포트 행/열에 나오는 id (라벨 종류별, 프로젝트 0(미상) 제외)
+def frame_label_ids(frame, index_kinds=(), column_kind=None):
+    ids = {}
+    for level, kind in enumerate(index_kinds[:frame.index.nlevels]):
+        if kind:
+            ids.setdefault(kind, set()).update(frame.index.get_level_values(level).tolist())
+    if column_kind:
+        ids.setdefault(column_kind, set()).update(frame.columns.tolist())
+    # 정수 id만 (personnel-lab-utilization의 total_hours 같은 합계 열 제외)
+    return {
+        kind: sorted(int(value) for value in values if isinstance(value, (int, np.integer)) and value)
+        for kind, values in ids.items()
+    }
+
+# id → 이름 (응답에 포함된 id만)
+def lookup_labels(ids_by_kind):
+    models = {'labs': Lab, 'projects': Project, 'personnel': Personnel}
+    labels = {}
+    for kind, ids in sorted(ids_by_kind.items()):
+        model = models[kind]
+        labels[kind] = dict(db.session.query(model.id, model.name).filter(model.id.in_(ids))) if ids else {}
+    return labels
+
+def run_pivot_report(name, start_date=None, end_date=None, **options):
+    if name not in PIVOT_REPORTS:
+        raise ValueError(f"지원하지 않는 리포트입니다: {name} (가능: {', '.join(PIVOT_REPORTS)})")
+    compute, index_kinds, column_kind = PIVOT_REPORTS[name]
+    activities, costs = get_frames()
+    activities = filter_period(activities, 'activity_date', start_date, end_date)
+    costs = filter_period(costs, 'cost_date', start_date, end_date)
+    frame = compute(activities, costs, options)
+    payload = frame_payload(frame, index_kinds, column_kind)
+    payload['report'] = name
+    payload['labels'] = lookup_labels(frame_label_ids(frame, index_kinds, column_kind))
+    return payload
@@ -0,0 +1,169 @@
+import argparse
+import math
+import time
+from collections import defaultdict
+import numpy as np
+import pandas as pd
+from models import ActivityType, CostType
+from analytics import lab_project_hours, personnel_lab_utilization, cost_per_hour, month_over_month, budget_vs_actual
+
+# pandas 분석 엔진 벤치마크
+# 생성한 대용량 활동/비용 데이터로 analytics.py 리포트(벡터화)와 같은 계산을 행 단위 Python 루프로 한 결과의
+# 실행 시간을 비교하고 값이 일치하는지 확인한다. DB를 사용하지 않는다.
+
+def generate_frames(rows, cost_rows, labs, projects, personnel, days, seed):
+    rng = np.random.default_rng(seed)
+    start = np.datetime64('2024-01-01')
+    activity_types = [member.value for member in ActivityType]
+    activities = pd.DataFrame({
+        'activity_date': start + rng.integers(0, days, rows).astype('timedelta64[D]'),
+        'lab_id': pd.Categorical(rng.integers(1, labs + 1, rows)),
+        'project_id': pd.Categorical(rng.integers(0, projects + 1, rows)),
+        'personnel_id': pd.Categorical(rng.integers(1, personnel + 1, rows)),
+        'activity_type': pd.Categorical.from_codes(rng.integers(0, len(activity_types), rows), activity_types),
+        'hours': rng.integers(1, 17, rows) / 2,
+        'activity_count': np.ones(rows, dtype='int32'),
+    })
+    cost_types = [member.value for member in CostType]
+    costs = pd.DataFrame({
+        'cost_date': start + rng.integers(0, days, cost_rows).astype('timedelta64[D]'),
+        'lab_id': pd.Categorical(rng.integers(1, labs + 1, cost_rows)),
+        'project_id': pd.Categorical(rng.integers(0, projects + 1, cost_rows)),
+        'cost_type': pd.Categorical.from_codes(rng.integers(0, len(cost_types), cost_rows), cost_types),
+        'category': pd.Categorical.from_codes(rng.integers(0, 4, cost_rows), ['인건비', '장비비', '재료비', '기타']),
+        'amount': np.round(rng.uniform(1e4, 5e6, cost_rows), 2),
+        'cost_count': np.ones(cost_rows, dtype='int32'),
+    })
+    return activities, costs
+
+# 쿼리 결과(.all())와 같은 (date, ...) 튜플 목록
+def to_rows(frame, columns):
+    values = []
+    for column in columns:
+        series = frame[column]
+        if pd.api.types.is_datetime64_any_dtype(series):
+            values.append(series.dt.date.tolist())
+        elif isinstance(series.dtype, pd.CategoricalDtype):
+            values.append(series.astype(series.cat.categories.dtype).tolist())
+        else:
+            values.append(series.tolist())
+    return list(zip(*values))
+
+# --- 행 단위 Python 루프 구현 (결과는 {키: 값} dict) ---
+
+def loop_lab_project_hours(activity_rows):
+    totals = defaultdict(float)
+    for activity_date, lab_id, project_id, personnel_id, activity_type, hours in activity_rows:
+        totals[(lab_id, project_id)] += hours
+    return totals
+
+def loop_personnel_lab_utilization(activity_rows):
+    by_lab = defaultdict(float)
+    totals = defaultdict(float)
+    for activity_date, lab_id, project_id, personnel_id, activity_type, hours in activity_rows:
+        by_lab[(personnel_id, lab_id)] += hours
+        totals[personnel_id] += hours
+    return {key: hours / totals[key[0]] for key, hours in by_lab.items() if totals[key[0]] > 0}
+
+def loop_cost_per_hour(activity_rows, cost_rows):
+    hours_by_lab = defaultdict(float)
+    actual_by_lab = defaultdict(float)
+    for activity_date, lab_id, project_id, personnel_id, activity_type, hours in activity_rows:
+        hours_by_lab[lab_id] += hours
+    for cost_date, lab_id, project_id, cost_type, amount in cost_rows:
+        if cost_type == CostType.ACTUAL.value:
+            actual_by_lab[lab_id] += amount
+    return {lab_id: actual_by_lab[lab_id] / hours for lab_id, hours in hours_by_lab.items() if hours > 0}
+
+def loop_month_over_month(activity_rows, cost_rows):
+    monthly = defaultdict(float)
+    for activity_date, lab_id, project_id, personnel_id, activity_type, hours in activity_rows:
+        monthly[(lab_id, f'{activity_date:%Y-%m}')] += hours
+    deltas = {}
+    for lab_id, month in sorted(monthly):
+        year, number = map(int, month.split('-'))
+        previous = f'{year - (number == 1)}-{12 if number == 1 else number - 1:02d}'
+        if (lab_id, previous) in monthly:
+            deltas[(lab_id, month)] = monthly[(lab_id, month)] - monthly[(lab_id, previous)]
+    return deltas
+
+def loop_budget_vs_actual(cost_rows):
+    totals = defaultdict(lambda: [0.0, 0.0])
+    for cost_date, lab_id, project_id, cost_type, amount in cost_rows:
+        totals[lab_id][0 if cost_type == CostType.BUDGET.value else 1] += amount
+    return {lab_id: budget - actual for lab_id, (budget, actual) in totals.items()}
+
+# --- 벡터화 결과 → 루프 결과와 같은 dict ---
+
+def vector_lab_project_hours(activities, costs):
+    return lab_project_hours(activities).stack().to_dict()
+
+def vector_personnel_lab_utilization(activities, costs):
+    return personnel_lab_utilization(activities).drop(columns='total_hours').stack().to_dict()
+
+def vector_cost_per_hour(activities, costs):
+    return cost_per_hour(activities, costs)['cost_per_hour'].dropna().to_dict()
+
+def vector_month_over_month(activities, costs):
+    return month_over_month(activities, costs)['hours_delta'].dropna().to_dict()
+
+def vector_budget_vs_actual(activities, costs):
+    return budget_vs_actual(costs)['variance'].to_dict()
+
+BENCHMARKS = [
+    ('lab-project-hours', vector_lab_project_hours, lambda a, c: loop_lab_project_hours(a)),
+    ('personnel-lab-utilization', vector_personnel_lab_utilization, lambda a, c: loop_personnel_lab_utilization(a)),
+    ('cost-per-hour', vector_cost_per_hour, loop_cost_per_hour),
+    ('month-over-month', vector_month_over_month, loop_month_over_month),
+    ('budget-vs-actual', vector_budget_vs_actual, lambda a, c: loop_budget_vs_actual(c)),
+]
+
+# 루프 결과의 모든 키가 벡터화 결과와 일치하는지 (벡터화 결과의 나머지 값은 0)
+def results_match(vector, loop):
+    if any(not math.isclose(vector.get(key, 0.0), value, rel_tol=1e-9, abs_tol=1e-6) for key, value in loop.items()):
+        return False
+    return all(math.isclose(value, 0.0, abs_tol=1e-6) for key, value in vector.items() if key not in loop)
+
+def best_of(repeat, function, *args):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function(*args)
+        timings.append(time.perf_counter() - started)
+    return min(timings), result
+
+def main():
+    parser = argparse.ArgumentParser(description='pandas 분석 엔진 vs 행 단위 Python 루프 벤치마크')
+    parser.add_argument('--rows', type=int, default=1000000, help='활동 행 수')
+    parser.add_argument('--cost-rows', type=int, help='비용 행 수 (기본: 활동 행 수의 1/5)')
+    parser.add_argument('--labs', type=int, default=20)
+    parser.add_argument('--projects', type=int, default=40)
+    parser.add_argument('--personnel', type=int, default=300)
+    parser.add_argument('--days', type=int, default=730, help='데이터 기간(일)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수 (최솟값 사용)')
+    args = parser.parse_args()
+
+    activities, costs = generate_frames(
+        args.rows, args.cost_rows or args.rows // 5,
+        args.labs, args.projects, args.personnel, args.days, args.seed
+    )
+    activity_rows = to_rows(activities, ['activity_date', 'lab_id', 'project_id', 'personnel_id', 'activity_type', 'hours'])
+    cost_rows = to_rows(costs, ['cost_date', 'lab_id', 'project_id', 'cost_type', 'amount'])
+    print(f"활동 {len(activities):,}행 ({activities.memory_usage(deep=True).sum() / 2**20:.1f}MiB), "
+          f"비용 {len(costs):,}행 ({costs.memory_usage(deep=True).sum() / 2**20:.1f}MiB)")
+
+    print(f"{'리포트':<28}{'루프(ms)':>12}{'pandas(ms)':>12}{'배수':>8}  일치")
+    mismatched = []
+    for name, vector, loop in BENCHMARKS:
+        loop_time, loop_result = best_of(args.repeat, loop, activity_rows, cost_rows)
+        vector_time, vector_result = best_of(args.repeat, vector, activities, costs)
+        match = results_match(vector_result, loop_result)
+        if not match:
+            mismatched.append(name)
+        print(f"{name:<28}{loop_time * 1000:>12.1f}{vector_time * 1000:>12.1f}{loop_time / vector_time:>7.1f}x  {'OK' if match else '불일치'}")
+    if mismatched:
+        raise SystemExit(1)
+
+if __name__ == '__main__':
+    main()
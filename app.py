@@ -1,14 +1,34 @@
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, Response, request, jsonify, send_file, send_from_directory, stream_with_context
 from flask_cors import CORS
 from models import db, Lab, Project, Personnel, Activity, Cost, LabSupportRelation
 from models import ActivityType, ProjectStatus, CostType
+from models import ActivityDailyRollup, CostDailyRollup
+from rollups import SUPPORT_HOURS_EPSILON, apply_activity_rollup, apply_cost_rollup, apply_support_relation
+from chat_schema import get_schema
+from chat_cache import normalize_question, cache_key, sql_cache, summary_cache
+from data_version import bump_data_version, get_data_version
+from http_cache import etag_versioned
+from json_provider import init_json
+from dashboard_cache import DASHBOARD_WINDOWS, DEFAULT_WINDOW, get_dashboard
+from llm_client import LLMClient, LLMError
+from sql_sandbox import SQLSandboxError, execute_readonly
+from sqlite_engine import configure_sqlite, create_readonly_engine
+from metrics import init_metrics, instrument_engine, metrics, render_prometheus
+from result_digest import compact_result
+from data_export import EXPORT_BATCH_SIZE, EXPORT_FORMATS, ExportError, arrow_schema, export_table, get_table, iter_arrow_stream
+from bulk_import import BulkImportError, MAX_REPORTED_ERRORS, detect_format, parse_rows, import_activities
+from utilization import UTILIZATION_DAILY_CAPACITY, UTILIZATION_GAP_DAYS, UTILIZATION_MAX_DETAILS, UTILIZATION_WEEKLY_CAPACITY, compute_utilization
+from migrations import check_schema, run_migrations
 from datetime import datetime, date
 import os
-from sqlalchemy import func, and_, or_
+import tempfile
+import threading
+import time
+from sqlalchemy import func, and_, or_, type_coerce, Float
+from sqlalchemy.orm import joinedload, selectinload
 from decimal import Decimal
-import requests
-import sqlite3
 import re
+import json
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -17,141 +37,138 @@ app = Flask(__name__, static_folder="frontend/build")
 
 # 데이터베이스 설정
 basedir = os.path.abspath(os.path.dirname(__file__))
-app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{os.path.join(basedir, "future_labs.db")}'
+DB_PATH = os.path.abspath(os.environ.get('DATABASE_PATH', os.path.join(basedir, "future_labs.db")))
+app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{DB_PATH}'
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 app.config['SECRET_KEY'] = 'your-secret-key-here'
 
 # CORS 설정 (React 앱과 통신)
 CORS(app, origins=['http://localhost:3000'])
 
-# 데이터베이스 초기화
+# 데이터베이스 초기화 (모든 연결에 WAL/busy_timeout 등 PRAGMA 적용, SQL 실행 시간 계측)
 db.init_app(app)
+with app.app_context():
+    configure_sqlite(db.engine)
+    instrument_engine(db.engine, 'main')
 
-# JSON Encoder 커스터마이징 (날짜, Decimal 처리)
-class CustomJSONEncoder:
-    @staticmethod
-    def default(obj):
-        if isinstance(obj, date):
-            return obj.isoformat()
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        if isinstance(obj, Decimal):
-            return float(obj)
-        raise TypeError(f'Object of type {type(obj)} is not JSON serializable')
+# 스키마 버전 확인 (gunicorn app:app 등 __main__ 이외의 기동 경로 포함)
+#  - fail(기본): 대기 중인 마이그레이션이 있으면 기동 중단 (python upgrade_db.py 실행 필요)
+#  - migrate: 대기 중인 마이그레이션을 적용한 뒤 기동 (python app.py, 단일 프로세스 또는 gunicorn --preload)
+#  - off: 확인하지 않음 (DB를 생성/업그레이드하는 스크립트용)
+SCHEMA_CHECK = 'migrate' if __name__ == '__main__' else os.environ.get('SCHEMA_CHECK', 'fail')
+if SCHEMA_CHECK not in ('fail', 'migrate', 'off'):
+    raise ValueError(f'SCHEMA_CHECK 값이 올바르지 않습니다: {SCHEMA_CHECK} (fail/migrate/off)')
+with app.app_context():
+    if SCHEMA_CHECK == 'migrate':
+        run_migrations(db.engine, progress=print)
+    elif SCHEMA_CHECK == 'fail':
+        check_schema(db.engine)
 
-app.json_encoder = CustomJSONEncoder
+# 챗봇 SQL 실행용 읽기 전용 연결 풀 (같은 DB 파일, mode=ro)
+chat_engine = create_readonly_engine(DB_PATH)
+
+# JSON 직렬화 (orjson, 날짜/Decimal/Enum 처리)
+init_json(app)
+
+# 라우트별 응답 시간/SQL/응답 크기 계측 (GET /api/_metrics)
+init_metrics(app)
 
 # Claude Sonnet 4 API 설정
+# 클라이언트는 첫 챗봇 호출 시 생성 (LLM_API_KEY 없이도 챗봇 외 API/스크립트는 동작)
 LLM_API_URL = os.environ.get('LLM_API_URL', 'https://api.anthropic.com/v1/messages')
-LLM_API_KEY = os.environ['LLM_API_KEY']
-DB_PATH = './future_labs.db'
-
-# DB 스키마 추출
-def get_db_schema():
-    with sqlite3.connect(DB_PATH) as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-        tables = [row[0] for row in cursor.fetchall()]
-        schema_lines = []
-        for table in tables:
-            cursor.execute(f"PRAGMA table_info({table});")
-            columns = [f"{row[1]} ({row[2]})" for row in cursor.fetchall()]
-            schema_lines.append(f"{table}: " + ", ".join(columns))
-    return schema_lines
+llm = None
+_llm_lock = threading.Lock()
+
+def get_llm():
+    global llm
+    if llm is None:
+        with _llm_lock:
+            if llm is None:
+                api_key = os.environ.get('LLM_API_KEY')
+                if not api_key:
+                    raise LLMError('LLM_API_KEY가 설정되지 않아 챗봇을 사용할 수 없습니다.')
+                llm = LLMClient(LLM_API_URL, api_key)
+    return llm
 
 # 자연어→SQL 변환
+# 스키마 설명 + 지시문은 고정 system 프롬프트(prefix 캐시 대상), 질문만 user 메시지로 전달
 def get_sql_from_llm(nl_query):
-    schema_info = "[DB 스키마 정보]\n" + "\n".join(get_db_schema())
-    prompt = (
+    schema_info, _ = get_schema()
+    system_prompt = (
         f"{schema_info}\n"
-        "위 DB 스키마를 참고해서, 아래 자연어 질문을 SQLite에서 실행 가능한 SQL SELECT 쿼리문(세미콜론 포함)만 반환해줘. "
-        "설명이나 자연어는 절대 포함하지 마. 오직 SQL 쿼리문만 출력해. "
-        f"질문: {nl_query}"
+        "위 DB 스키마를 참고해서, 사용자의 자연어 질문을 SQLite에서 실행 가능한 SQL SELECT 쿼리문(세미콜론 포함)만 반환해줘. "
+        "설명이나 자연어는 절대 포함하지 마. 오직 SQL 쿼리문만 출력해."
     )
     payload = {
-        "model": "claude-sonnet-4-20250514",
-        "max_tokens": 1024,
+        "system": [
+            {"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}
+        ],
         "messages": [
-            {"role": "user", "content": prompt}
+            {"role": "user", "content": f"질문: {nl_query}"}
         ]
     }
-    headers = {
-        "x-api-key": LLM_API_KEY,
-        "anthropic-version": "2023-06-01",
-        "content-type": "application/json"
-    }
-    response = requests.post(LLM_API_URL, json=payload, headers=headers)
-    text = response.json()['content'][0]['text']
-    match = re.search(r'(SELECT[\s\S]+?;)', text, re.IGNORECASE)
+    text = get_llm().complete(payload, label='sql')
+    # 코드 블록(```sql) 표시를 제거하고 첫 SELECT/WITH 문을 추출 (CTE 포함)
+    text = re.sub(r'```(?:sql)?', '', text, flags=re.IGNORECASE)
+    match = re.search(r'\b((?:WITH|SELECT)\b[\s\S]+?;)', text, re.IGNORECASE)
     if match:
         sql = match.group(1)
     else:
         sql = text.strip()
     return sql
 
-# 쿼리 결과 요약
-def summarize_with_llm(result, nl_query):
+# 쿼리 결과 요약 요청 본문
+def summary_payload(result, nl_query):
     prompt = (
         f"사용자 질문: {nl_query}\n"
         "아래 SQL 쿼리 결과를 참고해서, 사용자의 질문에 대해 친근하고 자연스러운 한국어로 간단히 답변해줘. "
         "불필요한 설명이나 'SQL 쿼리 결과에 따르면' 같은 문구는 빼고, 마치 사람이 대화하듯 답해줘.\n"
-        f"쿼리 결과: {result}"
+        f"쿼리 결과 (첫 줄은 행 수, 이어서 CSV 또는 컬럼별 통계와 샘플):\n{result}"
     )
-    payload = {
-        "model": "claude-sonnet-4-20250514",
-        "max_tokens": 1024,
+    return {
         "messages": [
             {"role": "user", "content": prompt}
         ]
     }
-    headers = {
-        "x-api-key": LLM_API_KEY,
-        "anthropic-version": "2023-06-01",
-        "content-type": "application/json"
-    }
-    response = requests.post(LLM_API_URL, json=payload, headers=headers)
-    summary = response.json()['content'][0]['text']
+
+# 쿼리 결과 요약
+def summarize_with_llm(result, nl_query):
+    summary = get_llm().complete(summary_payload(result, nl_query), label='summary')
     return summary.strip()
 
+# 쿼리 결과 요약 (스트리밍, 텍스트 조각 단위)
+def stream_summary_with_llm(result, nl_query):
+    return get_llm().stream(summary_payload(result, nl_query), label='summary')
+
 # API 라우트들
 
 # 대시보드 데이터
 @app.route('/api/dashboard', methods=['GET'])
+@etag_versioned('labs', 'projects', 'personnel', 'activities', 'costs', daily=True)
 def get_dashboard_data():
     try:
-        # 전체 랩 수
-        total_labs = Lab.query.filter_by(is_active=True).count()
-        
-        # 전체 프로젝트 수
-        total_projects = Project.query.count()
-        
-        # 총 투입 시간 (최근 30일)
-        from datetime import timedelta
-        thirty_days_ago = date.today() - timedelta(days=30)
-        total_hours = db.session.query(func.sum(Activity.hours)).filter(
-            Activity.activity_date >= thirty_days_ago
-        ).scalar() or 0
-        
-        # 활성 인원 수
-        active_personnel = Personnel.query.filter_by(is_active=True).count()
-        
-        # 총 비용 (최근 30일)
-        total_cost = db.session.query(func.sum(Cost.amount)).filter(
-            and_(Cost.cost_date >= thirty_days_ago, Cost.cost_type == CostType.ACTUAL)
-        ).scalar() or 0
-        
+        # 기간 창(일): 7/30/90/365 등 DASHBOARD_WINDOWS 중 선택, 기본 30일
+        window = request.args.get('window', DEFAULT_WINDOW, type=int)
+        if window not in DASHBOARD_WINDOWS:
+            return jsonify({'error': f'window는 {", ".join(map(str, DASHBOARD_WINDOWS))} 중 하나여야 합니다.'}), 400
+
+        # 랩/프로젝트/인원 수 + 기간별 투입 시간/실제 비용 (일별 집계 기준, 날짜+데이터 버전 캐시)
+        data = get_dashboard()
         return jsonify({
-            'total_labs': total_labs,
-            'total_projects': total_projects,
-            'total_hours': float(total_hours),
-            'active_personnel': active_personnel,
-            'total_cost': float(total_cost)
+            'total_labs': data['total_labs'],
+            'total_projects': data['total_projects'],
+            'total_hours': data['windows'][str(window)]['total_hours'],
+            'active_personnel': data['active_personnel'],
+            'total_cost': data['windows'][str(window)]['total_cost'],
+            'window': window,
+            'windows': data['windows']
         })
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 # 랩 관련 API
 @app.route('/api/labs', methods=['GET'])
+@etag_versioned('labs')
 def get_labs():
     try:
         labs = Lab.query.filter_by(is_active=True).all()
@@ -176,6 +193,7 @@ def create_lab():
             description=data.get('description', '')
         )
         db.session.add(lab)
+        bump_data_version('labs')
         db.session.commit()
         return jsonify({'message': '랩이 성공적으로 생성되었습니다.', 'id': lab.id}), 201
     except Exception as e:
@@ -190,6 +208,7 @@ def update_lab(lab_id):
         lab.code = data.get('code', lab.code)
         lab.name = data.get('name', lab.name)
         lab.description = data.get('description', lab.description)
+        bump_data_version('labs')
         db.session.commit()
         return jsonify({'message': '랩이 수정되었습니다.'})
     except Exception as e:
@@ -201,6 +220,7 @@ def delete_lab(lab_id):
     try:
         lab = Lab.query.get_or_404(lab_id)
         db.session.delete(lab)
+        bump_data_version('labs')
         db.session.commit()
         return jsonify({'message': '랩이 삭제되었습니다.'})
     except Exception as e:
@@ -209,9 +229,14 @@ def delete_lab(lab_id):
 
 # 프로젝트 관련 API
 @app.route('/api/projects', methods=['GET'])
+@etag_versioned('projects', 'labs')
 def get_projects():
     try:
-        projects = Project.query.all()
+        # 주도랩은 JOIN, 참여랩(N:M)은 IN 쿼리 1회로 일괄 로딩
+        projects = Project.query.options(
+            joinedload(Project.lead_lab),
+            selectinload(Project.labs)
+        ).all()
         result = []
         for project in projects:
             result.append({
@@ -246,6 +271,7 @@ def create_project():
         if 'lab_ids' in data:
             project.labs = Lab.query.filter(Lab.id.in_(data['lab_ids'])).all()
         db.session.add(project)
+        bump_data_version('projects')
         db.session.commit()
         return jsonify({'message': '프로젝트가 성공적으로 생성되었습니다.', 'id': project.id}), 201
     except Exception as e:
@@ -267,6 +293,7 @@ def update_project(project_id):
             project.lead_lab_id = data['lead_lab_id']
         if 'lab_ids' in data:
             project.labs = Lab.query.filter(Lab.id.in_(data['lab_ids'])).all()
+        bump_data_version('projects')
         db.session.commit()
         return jsonify({'message': '프로젝트가 수정되었습니다.'})
     except Exception as e:
@@ -278,6 +305,7 @@ def delete_project(project_id):
     try:
         project = Project.query.get_or_404(project_id)
         db.session.delete(project)
+        bump_data_version('projects')
         db.session.commit()
         return jsonify({'message': '프로젝트가 삭제되었습니다.'})
     except Exception as e:
@@ -286,9 +314,10 @@ def delete_project(project_id):
 
 # 인적자원 관련 API
 @app.route('/api/personnel', methods=['GET'])
+@etag_versioned('personnel', 'labs')
 def get_personnel():
     try:
-        personnel = Personnel.query.filter_by(is_active=True).all()
+        personnel = Personnel.query.options(selectinload(Personnel.labs)).filter_by(is_active=True).all()
         return jsonify([{
             'id': person.id,
             'employee_id': person.employee_id,
@@ -315,6 +344,7 @@ def create_personnel():
         if 'lab_ids' in data:
             person.labs = Lab.query.filter(Lab.id.in_(data['lab_ids'])).all()
         db.session.add(person)
+        bump_data_version('personnel')
         db.session.commit()
         return jsonify({'message': '인적자원이 성공적으로 등록되었습니다.', 'id': person.id}), 201
     except Exception as e:
@@ -333,21 +363,148 @@ def update_personnel(person_id):
         person.position = data.get('position', person.position)
         if 'lab_ids' in data:
             person.labs = Lab.query.filter(Lab.id.in_(data['lab_ids'])).all()
+        bump_data_version('personnel')
         db.session.commit()
         return jsonify({'message': '인적자원이 수정되었습니다.'})
     except Exception as e:
         db.session.rollback()
         return jsonify({'error': str(e)}), 500
 
+# 인원별 가동률 / 과다 배정·공백 감지 (일별 집계 기준, 기본 최근 90일)
+# capacity/weekly_capacity: 1일/1주 기준 시간, gap_days: 활동 없는 기간이 이 일수 이상이면 공백
+# flagged_only=1: 과다 배정 또는 공백이 있는 인원만, limit: 상세 목록 종류별 최대 건수
+@app.route('/api/personnel/utilization', methods=['GET'])
+@etag_versioned('activities', 'personnel', 'labs', daily=True)
+def get_personnel_utilization():
+    try:
+        start_date = request.args.get('start_date')
+        end_date = request.args.get('end_date')
+        return jsonify(compute_utilization(
+            datetime.strptime(start_date, '%Y-%m-%d').date() if start_date else None,
+            datetime.strptime(end_date, '%Y-%m-%d').date() if end_date else None,
+            daily_capacity=request.args.get('capacity', UTILIZATION_DAILY_CAPACITY, type=float),
+            weekly_capacity=request.args.get('weekly_capacity', UTILIZATION_WEEKLY_CAPACITY, type=float),
+            gap_days=request.args.get('gap_days', UTILIZATION_GAP_DAYS, type=int),
+            personnel_id=request.args.get('personnel_id', type=int),
+            lab_id=request.args.get('lab_id', type=int),
+            flagged_only=bool(request.args.get('flagged_only')),
+            limit=request.args.get('limit', UTILIZATION_MAX_DETAILS, type=int)
+        ))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+# 목록 API 페이지네이션/스트리밍 설정
+MAX_PAGE_LIMIT = 5000
+STREAM_BATCH_SIZE = 1000
+
+# 키셋 커서 ("YYYY-MM-DD:id") 파싱 — 형식/날짜가 잘못되면 항상 같은 메시지로 400
+CURSOR_PATTERN = re.compile(r'(\d{4}-\d{2}-\d{2}):(\d{1,18})')
+INVALID_CURSOR = 'invalid cursor'
+
+def parse_cursor(cursor):
+    match = CURSOR_PATTERN.fullmatch(cursor)
+    if not match:
+        raise ValueError(INVALID_CURSOR)
+    try:
+        return datetime.strptime(match.group(1), '%Y-%m-%d').date(), int(match.group(2))
+    except ValueError:
+        raise ValueError(INVALID_CURSOR) from None
+
+# (날짜, id) 기준 정렬 + 커서 이후 행만 조회
+def apply_keyset(query, date_column, id_column, cursor):
+    if cursor:
+        cursor_date, cursor_id = parse_cursor(cursor)
+        query = query.filter(or_(
+            date_column > cursor_date,
+            and_(date_column == cursor_date, id_column > cursor_id)
+        ))
+    return query.order_by(date_column, id_column)
+
+# limit+1개 조회 → (행 목록, 다음 페이지 커서)
+def fetch_page(query, limit, date_attr):
+    limit = min(int(limit), MAX_PAGE_LIMIT)
+    if limit <= 0:
+        raise ValueError('limit은 1 이상이어야 합니다.')
+    rows = query.limit(limit + 1).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = f"{getattr(last, date_attr).isoformat()}:{last.id}"
+    return rows, next_cursor
+
+def paginated_response(query, limit, serialize, date_attr):
+    rows, next_cursor = fetch_page(query, limit, date_attr)
+    return jsonify({'items': [serialize(row) for row in rows], 'next_cursor': next_cursor})
+
+# 컬럼형 응답 {columns, data[, next_cursor]} — 행 튜플을 dict 변환 없이 그대로 직렬화
+# extra_columns/extend: 행 튜플 뒤에 덧붙일 파생 컬럼 (이름 매핑 등)
+def columnar_response(query, limit=None, date_attr=None, extra_columns=(), extend=None):
+    columns = [column['name'] for column in query.column_descriptions] + list(extra_columns)
+    if limit:
+        rows, next_cursor = fetch_page(query, limit, date_attr)
+    else:
+        rows, next_cursor = query.all(), None
+    data = [tuple(row) + extend(row) for row in rows] if extend else [tuple(row) for row in rows]
+    body = {'columns': columns, 'data': data}
+    if limit:
+        body['next_cursor'] = next_cursor
+    return jsonify(body)
+
+# 행 단위 스트리밍 응답 (ndjson: 줄 단위 JSON, json: 청크 단위 JSON 배열)
+def streaming_response(query, serialize, fmt):
+    if fmt not in ('ndjson', 'json'):
+        raise ValueError(f'지원하지 않는 stream 형식입니다: {fmt}')
+
+    def generate():
+        if fmt == 'json':
+            yield '['
+        first = True
+        chunk = []
+        for row in query.yield_per(STREAM_BATCH_SIZE):
+            item = app.json.dumps(serialize(row))
+            if fmt == 'ndjson':
+                chunk.append(item + '\n')
+            else:
+                chunk.append(item if first else ',' + item)
+            first = False
+            if len(chunk) >= STREAM_BATCH_SIZE:
+                yield ''.join(chunk)
+                chunk = []
+        if chunk:
+            yield ''.join(chunk)
+        if fmt == 'json':
+            yield ']'
+
+    mimetype = 'application/x-ndjson' if fmt == 'ndjson' else 'application/json'
+    return Response(stream_with_context(generate()), mimetype=mimetype)
+
 # 활동 관련 API
 @app.route('/api/activities', methods=['GET'])
+@etag_versioned('activities', 'labs', 'personnel', 'projects')
 def get_activities():
     try:
         start_date = request.args.get('start_date')
         end_date = request.args.get('end_date')
         lab_id = request.args.get('lab_id')
+        limit = request.args.get('limit')
+        cursor = request.args.get('cursor')
+        stream = request.args.get('stream')
         
-        query = Activity.query
+        # ORM 객체/관계 lazy 로딩 없이 필요한 컬럼만 조회
+        query = db.session.query(
+            Activity.id,
+            Activity.personnel_id,
+            Activity.lab_id,
+            Activity.project_id,
+            Activity.activity_date,
+            Activity.hours,
+            Activity.activity_type,
+            Activity.supported_lab_id,
+            Activity.description
+        )
         
         if start_date:
             query = query.filter(Activity.activity_date >= datetime.strptime(start_date, '%Y-%m-%d').date())
@@ -355,23 +512,59 @@ def get_activities():
             query = query.filter(Activity.activity_date <= datetime.strptime(end_date, '%Y-%m-%d').date())
         if lab_id:
             query = query.filter(Activity.lab_id == lab_id)
-            
-        activities = query.all()
         
-        return jsonify([{
-            'id': activity.id,
-            'personnel_id': activity.personnel_id,
-            'lab_id': activity.lab_id,
-            'project_id': activity.project_id,
-            'personnel_name': activity.personnel.name,
-            'lab_name': activity.lab.name,
-            'project_name': activity.project.name if activity.project else '미상',
-            'activity_date': activity.activity_date,
-            'hours': float(activity.hours),
-            'activity_type': activity.activity_type.value,
-            'supported_lab_name': activity.supported_lab.name if activity.supported_lab else None,
-            'description': activity.description
-        } for activity in activities])
+        # 이름 매핑 (요청당 1회씩 조회)
+        lab_map = dict(db.session.query(Lab.id, Lab.name).all())
+        personnel_map = dict(db.session.query(Personnel.id, Personnel.name).all())
+        project_map = dict(db.session.query(Project.id, Project.name).all())
+        
+        # 컬럼형: 행 튜플 + 이름 컬럼
+        if request.args.get('format') == 'columnar':
+            if stream:
+                raise ValueError('format=columnar는 stream과 함께 사용할 수 없습니다.')
+            if limit or cursor:
+                query = apply_keyset(query, Activity.activity_date, Activity.id, cursor)
+            return columnar_response(
+                query, limit, 'activity_date',
+                extra_columns=('personnel_name', 'lab_name', 'project_name', 'supported_lab_name'),
+                extend=lambda row: (
+                    personnel_map.get(row[1]),
+                    lab_map.get(row[2]),
+                    project_map.get(row[3], '미상'),
+                    lab_map.get(row[7])
+                )
+            )
+        
+        # 날짜/Enum 변환은 JSON provider가 처리, 행은 이름 조회 대신 튜플 언패킹 (행당 속성 조회 비용 제거)
+        def serialize(row):
+            (activity_id, personnel_id, lab_id, project_id, activity_date,
+             hours, activity_type, supported_lab_id, description) = row
+            return {
+                'id': activity_id,
+                'personnel_id': personnel_id,
+                'lab_id': lab_id,
+                'project_id': project_id,
+                'personnel_name': personnel_map.get(personnel_id),
+                'lab_name': lab_map.get(lab_id),
+                'project_name': project_map.get(project_id, '미상'),
+                'activity_date': activity_date,
+                'hours': hours,
+                'activity_type': activity_type,
+                'supported_lab_name': lab_map.get(supported_lab_id),
+                'description': description
+            }
+        
+        # 커서 기반 페이지네이션 / 스트리밍 (미지정 시 기존처럼 전체 목록)
+        if limit or cursor or stream:
+            query = apply_keyset(query, Activity.activity_date, Activity.id, cursor)
+        if stream:
+            return streaming_response(query, serialize, stream)
+        if limit:
+            return paginated_response(query, limit, serialize, 'activity_date')
+        
+        return jsonify([serialize(activity) for activity in query.all()])
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -391,119 +584,206 @@ def create_activity():
         )
         db.session.add(activity)
         
-        # 지원 관계 업데이트
-        if activity.activity_type == ActivityType.SUPPORT and activity.supported_lab_id:
-            relation = LabSupportRelation.query.filter_by(
-                supporting_lab_id=activity.lab_id,
-                supported_lab_id=activity.supported_lab_id
-            ).first()
-            
-            if relation:
-                relation.total_hours += activity.hours
-                relation.last_activity_date = activity.activity_date
-            else:
-                relation = LabSupportRelation(
-                    supporting_lab_id=activity.lab_id,
-                    supported_lab_id=activity.supported_lab_id,
-                    total_hours=activity.hours,
-                    last_activity_date=activity.activity_date
-                )
-                db.session.add(relation)
+        # 일별 집계 / 지원 관계 반영 (원자적 UPSERT)
+        apply_activity_rollup(activity)
+        apply_support_relation(activity)
         
+        bump_data_version('activities')
         db.session.commit()
         return jsonify({'message': '활동이 성공적으로 등록되었습니다.', 'id': activity.id}), 201
     except Exception as e:
         db.session.rollback()
         return jsonify({'error': str(e)}), 500
 
+# 활동 대량 등록 (JSON 배열 / CSV / NDJSON 본문 또는 file 업로드)
+@app.route('/api/activities/bulk', methods=['POST'])
+def bulk_create_activities():
+    try:
+        upload = request.files.get('file')
+        if upload:
+            fmt = request.args.get('format') or detect_format(upload.filename, upload.content_type)
+            rows = parse_rows(upload.read(), fmt)
+        else:
+            fmt = request.args.get('format') or detect_format(content_type=request.content_type)
+            rows = parse_rows(request.get_data(), fmt)
+        inserted = import_activities(rows)
+        return jsonify({'message': f'활동 {inserted}건이 등록되었습니다.', 'inserted': inserted}), 201
+    except BulkImportError as e:
+        return jsonify({'error': str(e), 'errors': e.errors[:MAX_REPORTED_ERRORS]}), 400
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/activities/<int:activity_id>', methods=['PUT'])
+def update_activity(activity_id):
+    try:
+        data = request.get_json()
+        activity = Activity.query.get_or_404(activity_id)
+        
+        # 기존 값 집계/지원 관계에서 제거 후 수정된 값 반영
+        apply_activity_rollup(activity, -1)
+        apply_support_relation(activity, -1)
+        activity.personnel_id = data.get('personnel_id', activity.personnel_id)
+        activity.lab_id = data.get('lab_id', activity.lab_id)
+        activity.project_id = data.get('project_id', activity.project_id)
+        activity.activity_date = datetime.strptime(data['activity_date'], '%Y-%m-%d').date() if data.get('activity_date') else activity.activity_date
+        activity.hours = float(data['hours']) if 'hours' in data else activity.hours
+        activity.activity_type = ActivityType(data['activity_type']) if data.get('activity_type') else activity.activity_type
+        activity.supported_lab_id = data.get('supported_lab_id', activity.supported_lab_id)
+        activity.description = data.get('description', activity.description)
+        apply_activity_rollup(activity)
+        apply_support_relation(activity)
+        
+        bump_data_version('activities')
+        db.session.commit()
+        return jsonify({'message': '활동이 수정되었습니다.'})
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/activities/<int:activity_id>', methods=['DELETE'])
+def delete_activity(activity_id):
+    try:
+        activity = Activity.query.get_or_404(activity_id)
+        apply_activity_rollup(activity, -1)
+        apply_support_relation(activity, -1)
+        db.session.delete(activity)
+        bump_data_version('activities')
+        db.session.commit()
+        return jsonify({'message': '활동이 삭제되었습니다.'})
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+# 랩별 통계 일괄 계산 (일별 집계 테이블에서 활동 1회 + 비용 1회 GROUP BY 쿼리)
+def compute_lab_stats(lab_ids, start_date=None, end_date=None, project_id=None):
+    start = datetime.strptime(start_date, '%Y-%m-%d').date() if start_date else None
+    end = datetime.strptime(end_date, '%Y-%m-%d').date() if end_date else None
+    project_id = int(project_id) if project_id else None
+    
+    stats = {lab_id: {'total_hours': 0.0, 'participant_count': 0, 'total_cost': 0.0} for lab_id in lab_ids}
+    
+    # 투입 시간 / 참여 인원수(중복 제외)
+    activity_query = db.session.query(
+        ActivityDailyRollup.lab_id,
+        func.sum(ActivityDailyRollup.total_hours),
+        func.count(func.distinct(ActivityDailyRollup.personnel_id))
+    ).filter(ActivityDailyRollup.lab_id.in_(lab_ids))
+    if start:
+        activity_query = activity_query.filter(ActivityDailyRollup.activity_date >= start)
+    if end:
+        activity_query = activity_query.filter(ActivityDailyRollup.activity_date <= end)
+    if project_id:
+        activity_query = activity_query.filter(ActivityDailyRollup.project_id == project_id)
+    for lab_id, total_hours, participant_count in activity_query.group_by(ActivityDailyRollup.lab_id):
+        stats[lab_id]['total_hours'] = float(total_hours or 0)
+        stats[lab_id]['participant_count'] = participant_count
+    
+    # 비용 합계
+    cost_query = db.session.query(
+        CostDailyRollup.lab_id,
+        func.sum(CostDailyRollup.total_amount)
+    ).filter(CostDailyRollup.lab_id.in_(lab_ids))
+    if start:
+        cost_query = cost_query.filter(CostDailyRollup.cost_date >= start)
+    if end:
+        cost_query = cost_query.filter(CostDailyRollup.cost_date <= end)
+    if project_id:
+        cost_query = cost_query.filter(CostDailyRollup.project_id == project_id)
+    for lab_id, total_cost in cost_query.group_by(CostDailyRollup.lab_id):
+        stats[lab_id]['total_cost'] = float(total_cost or 0)
+    
+    return stats
+
 # 랩별 통계 API (프로젝트/기간 필터 지원)
 @app.route('/api/labs/<int:lab_id>/stats', methods=['GET'])
+@etag_versioned('activities', 'costs', 'labs')
 def get_lab_stats(lab_id):
     try:
-        start_date = request.args.get('start_date')
-        end_date = request.args.get('end_date')
-        project_id = request.args.get('project_id')
-        
-        # 기본 통계
-        query = Activity.query.filter_by(lab_id=lab_id)
-        if start_date:
-            query = query.filter(Activity.activity_date >= datetime.strptime(start_date, '%Y-%m-%d').date())
-        if end_date:
-            query = query.filter(Activity.activity_date <= datetime.strptime(end_date, '%Y-%m-%d').date())
-        if project_id:
-            query = query.filter(Activity.project_id == int(project_id))
-        
-        total_hours = db.session.query(func.sum(Activity.hours)).filter_by(lab_id=lab_id)
-        if start_date:
-            total_hours = total_hours.filter(Activity.activity_date >= datetime.strptime(start_date, '%Y-%m-%d').date())
-        if end_date:
-            total_hours = total_hours.filter(Activity.activity_date <= datetime.strptime(end_date, '%Y-%m-%d').date())
-        if project_id:
-            total_hours = total_hours.filter(Activity.project_id == int(project_id))
-        total_hours = total_hours.scalar() or 0
-        
-        participant_count = query.distinct(Activity.personnel_id).count()
-        
-        # 비용 통계
-        cost_query = Cost.query.filter_by(lab_id=lab_id)
-        if start_date:
-            cost_query = cost_query.filter(Cost.cost_date >= datetime.strptime(start_date, '%Y-%m-%d').date())
-        if end_date:
-            cost_query = cost_query.filter(Cost.cost_date <= datetime.strptime(end_date, '%Y-%m-%d').date())
-        if project_id:
-            cost_query = cost_query.filter(Cost.project_id == int(project_id))
-        total_cost = db.session.query(func.sum(Cost.amount)).filter_by(lab_id=lab_id)
-        if start_date:
-            total_cost = total_cost.filter(Cost.cost_date >= datetime.strptime(start_date, '%Y-%m-%d').date())
-        if end_date:
-            total_cost = total_cost.filter(Cost.cost_date <= datetime.strptime(end_date, '%Y-%m-%d').date())
-        if project_id:
-            total_cost = total_cost.filter(Cost.project_id == int(project_id))
-        total_cost = total_cost.scalar() or 0
-        
-        return jsonify({
-            'total_hours': float(total_hours),
-            'participant_count': participant_count,
-            'total_cost': float(total_cost)
-        })
+        stats = compute_lab_stats(
+            [lab_id],
+            request.args.get('start_date'),
+            request.args.get('end_date'),
+            request.args.get('project_id')
+        )
+        return jsonify(stats[lab_id])
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+# 여러 랩 통계 일괄 API (lab_ids 미지정 시 활성 랩 전체)
+@app.route('/api/labs/stats', methods=['GET'])
+@etag_versioned('activities', 'costs', 'labs')
+def get_labs_stats():
+    try:
+        lab_ids = request.args.get('lab_ids')
+        if lab_ids:
+            lab_ids = [int(x) for x in lab_ids.split(',') if x]
+        else:
+            lab_ids = [lab_id for (lab_id,) in db.session.query(Lab.id).filter_by(is_active=True)]
+        stats = compute_lab_stats(
+            lab_ids,
+            request.args.get('start_date'),
+            request.args.get('end_date'),
+            request.args.get('project_id')
+        )
+        return jsonify([{'lab_id': lab_id, **stats[lab_id]} for lab_id in lab_ids])
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 # 랩간 연결성 데이터 API (기간/프로젝트 필터 지원)
 @app.route('/api/lab-connections', methods=['GET'])
+@etag_versioned('activities', 'labs')
 def get_lab_connections():
     try:
         start_date = request.args.get('start_date')
         end_date = request.args.get('end_date')
         project_id = request.args.get('project_id')
         
+        # 랩명 매핑
+        lab_map = dict(db.session.query(Lab.id, Lab.name).all())
+        
+        # 필터가 없으면 지원 관계 테이블(랩 쌍 단위)에서 바로 응답
+        if not (start_date or end_date or project_id):
+            relations = db.session.query(
+                LabSupportRelation.supporting_lab_id,
+                LabSupportRelation.supported_lab_id,
+                LabSupportRelation.total_hours,
+                LabSupportRelation.last_activity_date
+            ).filter(
+                LabSupportRelation.total_hours > SUPPORT_HOURS_EPSILON
+            ).order_by(LabSupportRelation.supporting_lab_id, LabSupportRelation.supported_lab_id).all()
+            return jsonify([{
+                'supporting_lab': lab_map.get(row.supporting_lab_id, 'Unknown'),
+                'supported_lab': lab_map.get(row.supported_lab_id, 'Unknown'),
+                'total_hours': float(row.total_hours or 0),
+                'last_activity_date': row.last_activity_date
+            } for row in relations])
+        
         query = db.session.query(
-            Activity.lab_id.label('supporting_lab_id'),
-            Activity.supported_lab_id.label('supported_lab_id'),
-            func.sum(Activity.hours).label('total_hours'),
-            func.max(Activity.activity_date).label('last_activity_date')
+            ActivityDailyRollup.lab_id.label('supporting_lab_id'),
+            ActivityDailyRollup.supported_lab_id.label('supported_lab_id'),
+            func.sum(ActivityDailyRollup.total_hours).label('total_hours'),
+            func.max(ActivityDailyRollup.activity_date).label('last_activity_date')
         ).filter(
-            func.upper(Activity.activity_type) == 'SUPPORT',
-            Activity.supported_lab_id.isnot(None)
+            ActivityDailyRollup.activity_type == ActivityType.SUPPORT,
+            ActivityDailyRollup.supported_lab_id != 0
         )
         if start_date:
-            query = query.filter(Activity.activity_date >= datetime.strptime(start_date, '%Y-%m-%d').date())
+            query = query.filter(ActivityDailyRollup.activity_date >= datetime.strptime(start_date, '%Y-%m-%d').date())
         if end_date:
-            query = query.filter(Activity.activity_date <= datetime.strptime(end_date, '%Y-%m-%d').date())
+            query = query.filter(ActivityDailyRollup.activity_date <= datetime.strptime(end_date, '%Y-%m-%d').date())
         if project_id:
-            query = query.filter(Activity.project_id == int(project_id))
-        query = query.group_by(Activity.lab_id, Activity.supported_lab_id)
+            query = query.filter(ActivityDailyRollup.project_id == int(project_id))
+        query = query.group_by(ActivityDailyRollup.lab_id, ActivityDailyRollup.supported_lab_id)
         
         results = query.all()
-        print('lab-connections 쿼리 결과:', results)
-        
-        # 랩명 매핑
-        lab_map = {lab.id: lab.name for lab in Lab.query.all()}
         
         data = []
         for row in results:
-            if row.supported_lab_id is None:
-                continue
             data.append({
                 'supporting_lab': lab_map.get(row.supporting_lab_id, 'Unknown'),
                 'supported_lab': lab_map.get(row.supported_lab_id, 'Unknown'),
@@ -514,15 +794,56 @@ def get_lab_connections():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+# 랩간 지원 네트워크 지표 (랩별 지원/수혜 시간, PageRank, 매개 중심성, 상호성, 강연결 클러스터, 간선별 비교 기간 대비 변화량)
+# start_date만 주면 바로 앞의 같은 길이 기간과 비교, compare_start/compare_end로 직접 지정 가능
+# min_hours: 매개 중심성/클러스터/상호성 계산에서 이 시간 이하인 간선 제외
+# NumPy를 쓰는 lab_graph 모듈은 첫 요청 시 import (워커 기동 시간 단축)
+@app.route('/api/lab-connections/graph', methods=['GET'])
+@etag_versioned('activities', 'labs')
+def get_lab_connection_graph():
+    try:
+        from lab_graph import get_lab_graph
+        dates = {}
+        for name in ('start_date', 'end_date', 'compare_start', 'compare_end'):
+            value = request.args.get(name)
+            dates[name] = datetime.strptime(value, '%Y-%m-%d').date() if value else None
+        if dates['start_date'] and dates['end_date'] and dates['start_date'] > dates['end_date']:
+            return jsonify({'error': 'start_date는 end_date보다 늦을 수 없습니다.'}), 400
+        if dates['compare_start'] and dates['compare_end'] and dates['compare_start'] > dates['compare_end']:
+            return jsonify({'error': 'compare_start는 compare_end보다 늦을 수 없습니다.'}), 400
+        project_id = request.args.get('project_id', type=int)
+        min_hours = request.args.get('min_hours', 0.0, type=float)
+        return jsonify(get_lab_graph().analyze(project_id=project_id, min_hours=min_hours, **dates))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/costs', methods=['GET'])
+@etag_versioned('costs', 'labs', 'projects')
 def get_costs():
     try:
         lab_id = request.args.get('lab_id')
         project_id = request.args.get('project_id')
         start_date = request.args.get('start_date')
         end_date = request.args.get('end_date')
+        limit = request.args.get('limit')
+        cursor = request.args.get('cursor')
+        stream = request.args.get('stream')
 
-        query = Cost.query
+        # ORM 객체 생성 없이 필요한 컬럼만 조회 (금액은 Decimal 변환 없이 float)
+        query = db.session.query(
+            Cost.id,
+            Cost.lab_id,
+            Cost.project_id,
+            Cost.cost_date,
+            type_coerce(Cost.amount, Float).label('amount'),
+            Cost.cost_type,
+            Cost.category,
+            Cost.description,
+            Cost.created_at,
+            Cost.updated_at
+        )
         if lab_id:
             query = query.filter(Cost.lab_id == lab_id)
         if project_id:
@@ -532,26 +853,293 @@ def get_costs():
         if end_date:
             query = query.filter(Cost.cost_date <= datetime.strptime(end_date, '%Y-%m-%d').date())
 
-        costs = query.all()
-        result = []
-        for cost in costs:
-            result.append({
-                'id': cost.id,
-                'lab_id': cost.lab_id,
-                'project_id': cost.project_id,
-                'cost_date': cost.cost_date.isoformat(),
-                'amount': float(cost.amount),
-                'cost_type': cost.cost_type.value,
-                'category': cost.category,
-                'description': cost.description,
-                'created_at': cost.created_at.isoformat() if cost.created_at else None,
-                'updated_at': cost.updated_at.isoformat() if cost.updated_at else None,
-            })
-        return jsonify(result)
+        if request.args.get('format') == 'columnar':
+            if stream:
+                raise ValueError('format=columnar는 stream과 함께 사용할 수 없습니다.')
+            if limit or cursor:
+                query = apply_keyset(query, Cost.cost_date, Cost.id, cursor)
+            return columnar_response(query, limit, 'cost_date')
+
+        # 날짜/Enum 변환은 JSON provider가 처리
+        def serialize(cost):
+            return cost._asdict()
+
+        # 커서 기반 페이지네이션 / 스트리밍 (미지정 시 기존처럼 전체 목록)
+        if limit or cursor or stream:
+            query = apply_keyset(query, Cost.cost_date, Cost.id, cursor)
+        if stream:
+            return streaming_response(query, serialize, stream)
+        if limit:
+            return paginated_response(query, limit, serialize, 'cost_date')
+
+        return jsonify([serialize(cost) for cost in query.all()])
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/costs', methods=['POST'])
+def create_cost():
+    try:
+        data = request.get_json()
+        cost = Cost(
+            lab_id=data['lab_id'],
+            project_id=data.get('project_id'),
+            cost_date=datetime.strptime(data['cost_date'], '%Y-%m-%d').date(),
+            amount=Decimal(str(data['amount'])),
+            cost_type=CostType(data['cost_type']),
+            category=data.get('category'),
+            description=data.get('description', '')
+        )
+        db.session.add(cost)
+
+        # 일별 집계 반영
+        apply_cost_rollup(cost)
+
+        bump_data_version('costs')
+        db.session.commit()
+        return jsonify({'message': '비용이 성공적으로 등록되었습니다.', 'id': cost.id}), 201
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/costs/<int:cost_id>', methods=['PUT'])
+def update_cost(cost_id):
+    try:
+        data = request.get_json()
+        cost = Cost.query.get_or_404(cost_id)
+
+        # 기존 값 집계에서 제거 후 수정된 값 반영
+        apply_cost_rollup(cost, -1)
+        cost.lab_id = data.get('lab_id', cost.lab_id)
+        cost.project_id = data.get('project_id', cost.project_id)
+        cost.cost_date = datetime.strptime(data['cost_date'], '%Y-%m-%d').date() if data.get('cost_date') else cost.cost_date
+        cost.amount = Decimal(str(data['amount'])) if 'amount' in data else cost.amount
+        cost.cost_type = CostType(data['cost_type']) if data.get('cost_type') else cost.cost_type
+        cost.category = data.get('category', cost.category)
+        cost.description = data.get('description', cost.description)
+        apply_cost_rollup(cost)
+
+        bump_data_version('costs')
+        db.session.commit()
+        return jsonify({'message': '비용이 수정되었습니다.'})
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/costs/<int:cost_id>', methods=['DELETE'])
+def delete_cost(cost_id):
+    try:
+        cost = Cost.query.get_or_404(cost_id)
+        apply_cost_rollup(cost, -1)
+        db.session.delete(cost)
+        bump_data_version('costs')
+        db.session.commit()
+        return jsonify({'message': '비용이 삭제되었습니다.'})
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+# 기간 단위(bucket)별 날짜 키 SQL 표현식 (week는 해당 주 월요일 날짜)
+def bucket_expr(column, bucket):
+    if bucket == 'day':
+        return func.strftime('%Y-%m-%d', column)
+    if bucket == 'week':
+        return func.date(column, 'weekday 0', '-6 days')
+    if bucket == 'month':
+        return func.strftime('%Y-%m', column)
+    if bucket == 'year':
+        return func.strftime('%Y', column)
+    raise ValueError(f'지원하지 않는 집계 단위입니다: {bucket}')
+
+# 시계열 집계 API (일별 집계 테이블 GROUP BY, 컬럼형 배열 응답)
+@app.route('/api/analytics/timeseries', methods=['GET'])
+@etag_versioned('activities', 'costs', 'labs', 'projects')
+def get_analytics_timeseries():
+    try:
+        bucket = request.args.get('bucket', 'day')
+        start_date = request.args.get('start_date')
+        end_date = request.args.get('end_date')
+        lab_id = request.args.get('lab_id')
+        project_id = request.args.get('project_id')
+        activity_type = request.args.get('activity_type')
+        cost_type = request.args.get('cost_type')
+        category = request.args.get('category')
+        group_by = [g for g in request.args.get('group_by', '').split(',') if g]
+
+        # 그룹 차원 → (응답 컬럼명, 활동 컬럼, 비용 컬럼)
+        dimensions = {
+            'lab': ('lab_id', ActivityDailyRollup.lab_id, CostDailyRollup.lab_id),
+            'project': (
+                'project_id',
+                func.nullif(ActivityDailyRollup.project_id, 0),
+                func.nullif(CostDailyRollup.project_id, 0)
+            ),
+            'activity_type': ('activity_type', ActivityDailyRollup.activity_type, None),
+            'cost_type': ('cost_type', None, CostDailyRollup.cost_type),
+            'category': ('category', None, func.nullif(CostDailyRollup.category, '')),
+        }
+        unknown = [g for g in group_by if g not in dimensions]
+        if unknown:
+            return jsonify({'error': f'지원하지 않는 group_by 값입니다: {", ".join(unknown)}'}), 400
+
+        # 활동 집계: 시간 합계, 참여 인원수(중복 제외), 건수
+        activity_bucket = bucket_expr(ActivityDailyRollup.activity_date, bucket).label('bucket')
+        activity_dims = [(dimensions[g][0], dimensions[g][1]) for g in group_by if dimensions[g][1] is not None]
+        activity_query = db.session.query(
+            activity_bucket,
+            *[column.label(name) for name, column in activity_dims],
+            func.sum(ActivityDailyRollup.total_hours).label('hours'),
+            func.count(func.distinct(ActivityDailyRollup.personnel_id)).label('participants'),
+            func.sum(ActivityDailyRollup.activity_count).label('activity_count')
+        )
+        if start_date:
+            activity_query = activity_query.filter(ActivityDailyRollup.activity_date >= datetime.strptime(start_date, '%Y-%m-%d').date())
+        if end_date:
+            activity_query = activity_query.filter(ActivityDailyRollup.activity_date <= datetime.strptime(end_date, '%Y-%m-%d').date())
+        if lab_id:
+            activity_query = activity_query.filter(ActivityDailyRollup.lab_id == int(lab_id))
+        if project_id:
+            activity_query = activity_query.filter(ActivityDailyRollup.project_id == int(project_id))
+        if activity_type:
+            activity_query = activity_query.filter(ActivityDailyRollup.activity_type == ActivityType(activity_type))
+        activity_group = [activity_bucket] + [column for _, column in activity_dims]
+        activity_rows = activity_query.group_by(*activity_group).order_by(*activity_group).all()
+
+        # 비용 집계: 금액 합계, 건수
+        cost_bucket = bucket_expr(CostDailyRollup.cost_date, bucket).label('bucket')
+        cost_dims = [(dimensions[g][0], dimensions[g][2]) for g in group_by if dimensions[g][2] is not None]
+        cost_query = db.session.query(
+            cost_bucket,
+            *[column.label(name) for name, column in cost_dims],
+            func.sum(CostDailyRollup.total_amount).label('amount'),
+            func.sum(CostDailyRollup.cost_count).label('cost_count')
+        )
+        if start_date:
+            cost_query = cost_query.filter(CostDailyRollup.cost_date >= datetime.strptime(start_date, '%Y-%m-%d').date())
+        if end_date:
+            cost_query = cost_query.filter(CostDailyRollup.cost_date <= datetime.strptime(end_date, '%Y-%m-%d').date())
+        if lab_id:
+            cost_query = cost_query.filter(CostDailyRollup.lab_id == int(lab_id))
+        if project_id:
+            cost_query = cost_query.filter(CostDailyRollup.project_id == int(project_id))
+        if cost_type:
+            cost_query = cost_query.filter(CostDailyRollup.cost_type == CostType(cost_type))
+        if category:
+            cost_query = cost_query.filter(CostDailyRollup.category == category)
+        cost_group = [cost_bucket] + [column for _, column in cost_dims]
+        cost_rows = cost_query.group_by(*cost_group).order_by(*cost_group).all()
+
+        # 행 목록 → 컬럼형 배열 변환 (Enum은 value로)
+        def to_columns(rows, names, measures):
+            columns = {name: [] for name in names + list(measures)}
+            for row in rows:
+                for name in names:
+                    value = getattr(row, name)
+                    columns[name].append(value.value if isinstance(value, (ActivityType, CostType)) else value)
+                for name, cast in measures.items():
+                    columns[name].append(cast(getattr(row, name) or 0))
+            return columns
+
+        return jsonify({
+            'bucket': bucket,
+            'group_by': group_by,
+            'activities': to_columns(
+                activity_rows,
+                ['bucket'] + [name for name, _ in activity_dims],
+                {'hours': float, 'participants': int, 'activity_count': int}
+            ),
+            'costs': to_columns(
+                cost_rows,
+                ['bucket'] + [name for name, _ in cost_dims],
+                {'amount': float, 'cost_count': int}
+            )
+        })
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+# pandas 교차표/추이 리포트 API (lab-project-hours, personnel-lab-utilization, cost-per-hour, month-over-month, budget-vs-actual)
+# 응답: {report, index_names, index, columns, data: [[...]], labels: {labs/projects/personnel: {id: 이름}}}
+# pandas를 쓰는 analytics 모듈은 첫 요청 시 import (워커 기동 시간 단축)
+@app.route('/api/analytics/pivot/<report>', methods=['GET'])
+@etag_versioned('activities', 'costs', 'labs', 'projects', 'personnel')
+def get_analytics_pivot(report):
+    try:
+        from analytics import run_pivot_report
+        start_date = request.args.get('start_date')
+        end_date = request.args.get('end_date')
+        return jsonify(run_pivot_report(
+            report,
+            datetime.strptime(start_date, '%Y-%m-%d').date() if start_date else None,
+            datetime.strptime(end_date, '%Y-%m-%d').date() if end_date else None,
+            by_project=bool(request.args.get('by_project'))
+        ))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+# 오프라인 분석용 내보내기 API (Parquet 파일 다운로드 / Arrow IPC 스트림)
+# format=parquet: 임시 파일에 row group 단위로 기록 후 전송, format=arrow: record batch 단위 스트리밍
+@app.route('/api/export/<table_name>', methods=['GET'])
+def export_data(table_name):
+    try:
+        fmt = request.args.get('format', 'parquet')
+        if fmt not in EXPORT_FORMATS:
+            return jsonify({'error': f"지원하지 않는 형식입니다: {fmt} (가능: {', '.join(EXPORT_FORMATS)})"}), 400
+        start_date = request.args.get('start_date')
+        end_date = request.args.get('end_date')
+        start_date = datetime.strptime(start_date, '%Y-%m-%d').date() if start_date else None
+        end_date = datetime.strptime(end_date, '%Y-%m-%d').date() if end_date else None
+        batch_size = min(max(request.args.get('batch_size', EXPORT_BATCH_SIZE, type=int), 1000), EXPORT_BATCH_SIZE)
+        # 스트리밍 시작 전에 테이블 이름 / pyarrow 설치 여부 확인
+        arrow_schema(get_table(table_name))
+
+        if fmt == 'arrow':
+            return Response(
+                stream_with_context(iter_arrow_stream(table_name, start_date, end_date, batch_size=batch_size)),
+                mimetype='application/vnd.apache.arrow.stream',
+                headers={'Content-Disposition': f'attachment; filename={table_name}.arrows'}
+            )
+        sink = tempfile.TemporaryFile()
+        export_table(table_name, sink, 'parquet', start_date, end_date, batch_size=batch_size)
+        sink.seek(0)
+        return send_file(sink, mimetype='application/vnd.apache.parquet', as_attachment=True, download_name=f'{table_name}.parquet')
+    except (ExportError, ValueError) as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 # MCP + Gemini 연동 채팅 API
+# 자연어 → SQL (정규화 질문 + 스키마 해시 캐시) → (sql, 질문 캐시 키, 캐시 적중 여부)
+def resolve_chat_sql(user_query):
+    _, schema_hash = get_schema()
+    question_key = cache_key(normalize_question(user_query), schema_hash)
+    sql = sql_cache.get(question_key)
+    sql_cached = sql is not None
+    if not sql_cached:
+        sql = get_sql_from_llm(user_query)
+    return sql, question_key, sql_cached
+
+# 챗봇 SQL 실행 (읽기 전용 샌드박스) → ([{col: val, ...}, ...], 행 수 제한으로 잘렸는지 여부)
+# 샌드박스는 드라이버 연결을 직접 사용하므로 엔진 이벤트 대신 여기서 실행 시간 기록
+def execute_chat_sql(sql):
+    started = time.perf_counter()
+    try:
+        executed = execute_readonly(chat_engine, sql)
+    finally:
+        metrics.record_sql('chat', time.perf_counter() - started, sql)
+    return executed['rows'], executed['truncated']
+
+# 답변 캐시 키: 요약 문장은 질문 표현에 따라 달라지므로 같은 SQL이라도 질문별로 따로 저장
+def chat_answer_key(user_query, sql):
+    return cache_key(normalize_question(user_query), sql, get_data_version())
+
+def cache_chat_answer(answer_key, summary, result_dicts, truncated):
+    summary_cache.set(answer_key, json.dumps({'answer': summary, 'result': result_dicts, 'truncated': truncated}, ensure_ascii=False, default=str))
+
 @app.route('/api/chat', methods=['POST'])
 def chat_with_db():
     try:
@@ -559,21 +1147,112 @@ def chat_with_db():
         user_query = data['query']
 
         # 1. 자연어 → SQL 변환
-        sql = get_sql_from_llm(user_query)
+        sql, question_key, sql_cached = resolve_chat_sql(user_query)
+
+        # 2~3. 동일 SQL + 동일 데이터 버전이면 실행/요약 결과 재사용
+        answer_key = chat_answer_key(user_query, sql)
+        cached_answer = summary_cache.get(answer_key)
+        if cached_answer is not None:
+            cached_answer = json.loads(cached_answer)
+            summary, result_dicts = cached_answer['answer'], cached_answer['result']
+            truncated = cached_answer.get('truncated', False)
+        else:
+            # 2. SQL 실행
+            result_dicts, truncated = execute_chat_sql(sql)
+
+            # 3. 결과 요약
+            summary = summarize_with_llm(compact_result(result_dicts, truncated), user_query)
+            cache_chat_answer(answer_key, summary, result_dicts, truncated)
+
+        # 실행에 성공한 SQL만 캐시
+        if not sql_cached:
+            sql_cache.set(question_key, sql)
+
+        return jsonify({
+            'answer': summary,
+            'sql': sql,
+            'result': result_dicts,
+            'truncated': truncated,
+            'cached': {'sql': sql_cached, 'summary': cached_answer is not None}
+        })
+    except SQLSandboxError as e:
+        return jsonify({'error': str(e)}), 400
+    except LLMError as e:
+        return jsonify({'error': str(e)}), 502
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
 
-        # 2. SQL 실행
-        with sqlite3.connect(DB_PATH) as conn:
-            cursor = conn.cursor()
-            cursor.execute(sql)
-            columns = [desc[0] for desc in cursor.description] if cursor.description else []
-            result = cursor.fetchall()
-            # 결과를 [{col: val, ...}, ...] 형태로 변환
-            result_dicts = [dict(zip(columns, row)) for row in result] if columns else result
+def sse_event(event, data):
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
 
-        # 3. 결과 요약
-        summary = summarize_with_llm(result_dicts, user_query)
+# 챗봇 스트리밍(SSE) — sql → result → summary(조각) → done 순서로 전송, 실패 시 error 이벤트
+@app.route('/api/chat/stream', methods=['POST'])
+def chat_with_db_stream():
+    data = request.get_json(silent=True) or {}
+    user_query = data.get('query')
+    if not user_query:
+        return jsonify({'error': 'query가 필요합니다.'}), 400
+
+    def generate():
+        try:
+            sql, question_key, sql_cached = resolve_chat_sql(user_query)
+            yield sse_event('sql', {'sql': sql, 'cached': sql_cached})
+
+            answer_key = chat_answer_key(user_query, sql)
+            cached_answer = summary_cache.get(answer_key)
+            if cached_answer is not None:
+                cached_answer = json.loads(cached_answer)
+                result_dicts = cached_answer['result']
+                truncated = cached_answer.get('truncated', False)
+                if not sql_cached:
+                    sql_cache.set(question_key, sql)
+                yield sse_event('result', {'result': result_dicts, 'truncated': truncated})
+                summary = cached_answer['answer']
+                yield sse_event('summary', {'text': summary})
+            else:
+                result_dicts, truncated = execute_chat_sql(sql)
+                if not sql_cached:
+                    sql_cache.set(question_key, sql)
+                yield sse_event('result', {'result': result_dicts, 'truncated': truncated})
+                parts = []
+                for text in stream_summary_with_llm(compact_result(result_dicts, truncated), user_query):
+                    parts.append(text)
+                    yield sse_event('summary', {'text': text})
+                summary = ''.join(parts).strip()
+                cache_chat_answer(answer_key, summary, result_dicts, truncated)
 
-        return jsonify({'answer': summary, 'sql': sql, 'result': result_dicts})
+            yield sse_event('done', {
+                'answer': summary,
+                'cached': {'sql': sql_cached, 'summary': cached_answer is not None}
+            })
+        except Exception as e:
+            yield sse_event('error', {'error': str(e)})
+
+    return Response(stream_with_context(generate()), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
+# 챗봇 캐시 적중/미스 통계
+@app.route('/api/chat/cache', methods=['GET'])
+def get_chat_cache_stats():
+    return jsonify({
+        'sql': sql_cache.stats(),
+        'summary': summary_cache.stats(),
+        'llm_latency': llm.latency.snapshot() if llm is not None else {}
+    })
+
+# 요청/SQL/LLM 계측 지표 (Prometheus 텍스트 형식)
+@app.route('/api/_metrics', methods=['GET'])
+def get_metrics():
+    return Response(render_prometheus(llm.latency if llm is not None else None), mimetype='text/plain; version=0.0.4')
+
+# 챗봇 프롬프트용 스키마 설명 및 해시
+@app.route('/api/chat/schema', methods=['GET'])
+def get_chat_schema():
+    try:
+        schema_info, schema_hash = get_schema()
+        return jsonify({'schema': schema_info, 'hash': schema_hash})
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -586,7 +1265,5 @@ def serve(path):
         return send_from_directory(app.static_folder, "index.html")
 
 if __name__ == '__main__':
-    with app.app_context():
-        db.create_all()
     app.run(debug=True, host='0.0.0.0', port=5000) 
 
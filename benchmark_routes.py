@@ -0,0 +1,323 @@
+import argparse
+import hashlib
+import json
+import multiprocessing
+import os
+import queue
+import shutil
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+from synthetic_data import DEFAULT_END_DATE, DEFAULT_SCALE, generate_dataset
+
+# API 라우트 벤치마크
+# 규모별 합성 데이터 DB(synthetic_data.py)에 대해 app.py의 모든 라우트를 Flask test client로 호출하고
+# 라우트별 p50/p95 응답 시간, 요청당 SQL 수, 최대 메모리(tracemalloc)를 측정한다.
+#  - 생성한 DB는 --data-dir에 (규모, seed, 마지막 날짜)별로 보관해 재사용, 측정은 사본에서 실행 (쓰기 라우트 포함)
+#  - 기간 파라미터는 실행일이 아니라 데이터 마지막 날짜 기준
+#  - LLM은 고정 응답을 돌려주는 BenchmarkLLM으로 바꿔 서버 측 처리 시간만 측정
+#  - --baseline 결과와 비교해 회귀가 있으면 종료 코드 1
+# 첫 호출(first)은 캐시가 비어 있는 상태의 시간이며 p50/p95에서는 제외한다.
+
+BENCHMARK_SQL = 'SELECT lab_id, SUM(total_hours) AS hours FROM activity_daily_rollups GROUP BY lab_id;'
+
+class BenchmarkLLM:
+    def __init__(self):
+        from llm_client import LATENCY_BUCKETS
+        from metrics import LatencyHistogram
+        self.latency = LatencyHistogram(LATENCY_BUCKETS)
+
+    def complete(self, payload, label='llm'):
+        return BENCHMARK_SQL if label == 'sql' else '랩별 활동 시간 요약입니다.'
+
+    def stream(self, payload, label='llm'):
+        yield from ('랩별 ', '활동 시간 ', '요약입니다.')
+
+# 벤치마크 케이스: (이름, 라우트 규칙, 메서드, 요청 준비 함수(client, ctx, i) → client.open 인자)
+# 준비 함수에서 실행한 요청(삭제 대상 생성 등)은 측정에서 제외
+def _get(path):
+    return lambda client, ctx, i: {'path': path.format(**ctx)}
+
+def _created_id(client, path, body):
+    response = client.post(path, json=body)
+    return response.get_json()['id']
+
+def _activity_body(ctx, i):
+    return {
+        'personnel_id': ctx['personnel_id'], 'lab_id': ctx['lab_id'], 'project_id': ctx['project_id'],
+        'activity_date': ctx['today'], 'hours': 1 + i % 8, 'activity_type': 'support' if i % 5 == 0 else 'own',
+        'supported_lab_id': ctx['other_lab_id'] if i % 5 == 0 else None, 'description': '벤치마크',
+    }
+
+def _cost_body(ctx, i):
+    return {
+        'lab_id': ctx['lab_id'], 'project_id': ctx['project_id'], 'cost_date': ctx['today'],
+        'amount': 100000 + i, 'cost_type': 'actual', 'category': '기타', 'description': '벤치마크',
+    }
+
+def _project_body(ctx, i, prefix):
+    return {'code': f'{prefix}{i:05d}', 'name': f'벤치마크 프로젝트 {i}', 'lead_lab_id': ctx['lab_id'], 'lab_ids': [ctx['lab_id']]}
+
+READ_CASES = [
+    ('dashboard', '/api/dashboard', 'GET', _get('/api/dashboard')),
+    ('labs', '/api/labs', 'GET', _get('/api/labs')),
+    ('projects', '/api/projects', 'GET', _get('/api/projects')),
+    ('personnel', '/api/personnel', 'GET', _get('/api/personnel')),
+    ('activities page', '/api/activities', 'GET', _get('/api/activities?limit=100')),
+    ('activities lab 30d', '/api/activities', 'GET', _get('/api/activities?lab_id={lab_id}&start_date={month_ago}')),
+    ('activities columnar', '/api/activities', 'GET', _get('/api/activities?limit=5000&format=columnar')),
+    ('lab stats', '/api/labs/<int:lab_id>/stats', 'GET', _get('/api/labs/{lab_id}/stats')),
+    ('labs stats', '/api/labs/stats', 'GET', _get('/api/labs/stats')),
+    ('lab connections', '/api/lab-connections', 'GET', _get('/api/lab-connections')),
+    ('lab graph', '/api/lab-connections/graph', 'GET', _get('/api/lab-connections/graph')),
+    ('lab graph 90d delta', '/api/lab-connections/graph', 'GET', _get('/api/lab-connections/graph?start_date={quarter_ago}')),
+    ('personnel utilization', '/api/personnel/utilization', 'GET', _get('/api/personnel/utilization')),
+    ('costs page', '/api/costs', 'GET', _get('/api/costs?limit=100')),
+    ('costs lab 90d', '/api/costs', 'GET', _get('/api/costs?lab_id={lab_id}&start_date={quarter_ago}')),
+    ('timeseries', '/api/analytics/timeseries', 'GET', _get('/api/analytics/timeseries?bucket=month&group_by=lab')),
+    ('pivot lab-project', '/api/analytics/pivot/<report>', 'GET', _get('/api/analytics/pivot/lab-project-hours')),
+    ('pivot utilization', '/api/analytics/pivot/<report>', 'GET', _get('/api/analytics/pivot/personnel-lab-utilization')),
+    ('pivot cost-per-hour', '/api/analytics/pivot/<report>', 'GET', _get('/api/analytics/pivot/cost-per-hour')),
+    ('pivot month-over-month', '/api/analytics/pivot/<report>', 'GET', _get('/api/analytics/pivot/month-over-month')),
+    ('pivot budget', '/api/analytics/pivot/<report>', 'GET', _get('/api/analytics/pivot/budget-vs-actual?by_project=1')),
+    ('export costs 90d parquet', '/api/export/<table_name>', 'GET', _get('/api/export/costs?start_date={quarter_ago}')),
+    ('export activities 30d arrow', '/api/export/<table_name>', 'GET', _get('/api/export/activities?format=arrow&start_date={month_ago}')),
+    ('chat', '/api/chat', 'POST', lambda client, ctx, i: {'path': '/api/chat', 'json': {'query': f'랩별 활동 시간 {i}'}}),
+    ('chat stream', '/api/chat/stream', 'POST', lambda client, ctx, i: {'path': '/api/chat/stream', 'json': {'query': f'랩별 활동 시간 스트림 {i}'}}),
+    ('chat cache', '/api/chat/cache', 'GET', _get('/api/chat/cache')),
+    ('chat schema', '/api/chat/schema', 'GET', _get('/api/chat/schema')),
+    ('metrics', '/api/_metrics', 'GET', _get('/api/_metrics')),
+    ('index', '/', 'GET', _get('/')),
+    ('static', '/<path:path>', 'GET', _get('/favicon.ico')),
+]
+
+WRITE_CASES = [
+    ('create lab', '/api/labs', 'POST', lambda client, ctx, i: {'path': '/api/labs', 'json': {'code': f'BL{i:05d}', 'name': f'벤치마크 랩 {i}'}}),
+    ('update lab', '/api/labs/<int:lab_id>', 'PUT', lambda client, ctx, i: {'path': f"/api/labs/{ctx['lab_id']}", 'json': {'description': f'벤치마크 {i}'}}),
+    ('delete lab', '/api/labs/<int:lab_id>', 'DELETE', lambda client, ctx, i: {
+        'path': f"/api/labs/{_created_id(client, '/api/labs', {'code': f'BD{i:05d}', 'name': '삭제용'})}"}),
+    ('create project', '/api/projects', 'POST', lambda client, ctx, i: {'path': '/api/projects', 'json': _project_body(ctx, i, 'BP')}),
+    ('update project', '/api/projects/<int:project_id>', 'PUT', lambda client, ctx, i: {
+        'path': f"/api/projects/{ctx['project_id']}", 'json': {'description': f'벤치마크 {i}'}}),
+    ('delete project', '/api/projects/<int:project_id>', 'DELETE', lambda client, ctx, i: {
+        'path': f"/api/projects/{_created_id(client, '/api/projects', _project_body(ctx, i, 'BX'))}"}),
+    ('create personnel', '/api/personnel', 'POST', lambda client, ctx, i: {'path': '/api/personnel', 'json': {
+        'employee_id': f'BE{i:05d}', 'name': '벤치마크', 'email': f'bench{i}@example.com', 'lab_ids': [ctx['lab_id']]}}),
+    ('update personnel', '/api/personnel/<int:person_id>', 'PUT', lambda client, ctx, i: {
+        'path': f"/api/personnel/{ctx['personnel_id']}", 'json': {'position': f'연구원 {i}'}}),
+    ('create activity', '/api/activities', 'POST', lambda client, ctx, i: {'path': '/api/activities', 'json': _activity_body(ctx, i)}),
+    ('bulk activities 100', '/api/activities/bulk', 'POST', lambda client, ctx, i: {
+        'path': '/api/activities/bulk', 'json': [_activity_body(ctx, i * 100 + j) for j in range(100)]}),
+    ('update activity', '/api/activities/<int:activity_id>', 'PUT', lambda client, ctx, i: {
+        'path': f"/api/activities/{ctx['activity_id']}", 'json': {'hours': 1 + i % 8}}),
+    ('delete activity', '/api/activities/<int:activity_id>', 'DELETE', lambda client, ctx, i: {
+        'path': f"/api/activities/{_created_id(client, '/api/activities', _activity_body(ctx, i))}"}),
+    ('create cost', '/api/costs', 'POST', lambda client, ctx, i: {'path': '/api/costs', 'json': _cost_body(ctx, i)}),
+    ('update cost', '/api/costs/<int:cost_id>', 'PUT', lambda client, ctx, i: {
+        'path': f"/api/costs/{ctx['cost_id']}", 'json': {'amount': 200000 + i}}),
+    ('delete cost', '/api/costs/<int:cost_id>', 'DELETE', lambda client, ctx, i: {
+        'path': f"/api/costs/{_created_id(client, '/api/costs', _cost_body(ctx, i))}"}),
+]
+
+# 응답 상태가 이 값이면 정상으로 간주 (정적 파일은 빌드 결과물이 없으면 404)
+EXPECTED_STATUS = {'index': (200, 404), 'static': (200, 404)}
+
+def _percentile(values, ratio):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * ratio))] if values else 0.0
+
+def _sql_total(metrics):
+    return sum(series['count'] for series in metrics.sql.snapshot().values())
+
+def _run_case(client, metrics, ctx, name, prepare, method, repeat):
+    timings, sql_counts, statuses = [], [], set()
+    for i in range(repeat + 1):
+        kwargs = prepare(client, ctx, i)
+        before = _sql_total(metrics)
+        started = time.perf_counter()
+        response = client.open(method=method, **kwargs)
+        response.get_data()  # 스트리밍 응답까지 모두 소비
+        elapsed = time.perf_counter() - started
+        response.close()
+        sql_counts.append(_sql_total(metrics) - before)
+        statuses.add(response.status_code)
+        timings.append(elapsed)
+
+    # 최대 메모리는 별도 1회 (tracemalloc은 실행 속도를 떨어뜨림)
+    kwargs = prepare(client, ctx, repeat + 1)
+    tracemalloc.start()
+    response = client.open(method=method, **kwargs)
+    response.get_data()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    response.close()
+
+    expected = EXPECTED_STATUS.get(name, (200, 201))
+    return {
+        'first_ms': timings[0] * 1000,
+        'p50_ms': _percentile(timings[1:], 0.5) * 1000,
+        'p95_ms': _percentile(timings[1:], 0.95) * 1000,
+        'sql': sum(sql_counts[1:]) / max(len(sql_counts) - 1, 1),
+        'peak_mib': peak / 2 ** 20,
+        'status': sorted(statuses),
+        'ok': statuses <= set(expected),
+    }
+
+def _worker(db_path, end_date, repeat, queue):
+    # DATABASE_PATH 설정 후 워커 프로세스 안에서 앱 import
+    os.environ['DATABASE_PATH'] = db_path
+    import app as app_module
+    from app import app, db
+    from metrics import metrics
+    from models import Lab, Project, Personnel, Activity, Cost
+
+    app_module.llm = BenchmarkLLM()
+    client = app.test_client()
+    today = end_date
+    with app.app_context():
+        lab_ids = [lab_id for (lab_id,) in db.session.query(Lab.id).order_by(Lab.id).limit(2)]
+        ctx = {
+            'lab_id': lab_ids[0],
+            'other_lab_id': lab_ids[1],
+            'project_id': db.session.query(Project.id).order_by(Project.id).first()[0],
+            'personnel_id': db.session.query(Personnel.id).order_by(Personnel.id).first()[0],
+            'activity_id': db.session.query(Activity.id).order_by(Activity.id).first()[0],
+            'cost_id': db.session.query(Cost.id).order_by(Cost.id).first()[0],
+            'today': today.isoformat(),
+            'month_ago': (today - timedelta(days=30)).isoformat(),
+            'quarter_ago': (today - timedelta(days=90)).isoformat(),
+        }
+        db.session.remove()
+
+    covered = {(method, rule) for _, rule, method, _ in READ_CASES + WRITE_CASES}
+    routes = {(method, rule.rule) for rule in app.url_map.iter_rules() if rule.endpoint != 'static'
+              for method in rule.methods - {'HEAD', 'OPTIONS'}}
+    results = {}
+    # 읽기 먼저 (쓰기가 캐시를 무효화하므로)
+    for name, rule, method, prepare in READ_CASES + WRITE_CASES:
+        results[name] = _run_case(client, metrics, ctx, name, prepare, method, repeat)
+    queue.put({'results': results, 'uncovered': sorted(f'{method} {rule}' for method, rule in routes - covered)})
+
+def _generate(db_path, seed, end_date, scale):
+    os.environ['DATABASE_PATH'] = db_path
+    os.environ['SCHEMA_CHECK'] = 'off'
+    from app import app, db
+    from migrations import run_migrations
+    with app.app_context():
+        db.create_all()
+        run_migrations(db.engine)
+        generate_dataset(seed=seed, end_date=end_date, progress=lambda message: None, **scale)
+        # 연결을 닫아 WAL 내용을 DB 파일에 반영 (이후 파일 이름 변경)
+        db.session.remove()
+        db.engine.dispose()
+
+def _run_process(target, *args):
+    process = multiprocessing.Process(target=target, args=args)
+    process.start()
+    process.join()
+    if process.exitcode != 0:
+        raise SystemExit(f'{target.__name__} 실패 (종료 코드 {process.exitcode})')
+
+# (규모, seed, 마지막 날짜)별 DB 파일 — 없으면 생성
+def dataset_path(data_dir, seed, end_date, scale):
+    digest = hashlib.sha256(json.dumps(scale, sort_keys=True).encode('utf-8')).hexdigest()[:8]
+    path = os.path.join(data_dir, f"synthetic-{scale['activities']}-{seed}-{end_date:%Y%m%d}-{digest}.db")
+    if not os.path.exists(path):
+        print(f"합성 데이터 생성: 활동 {scale['activities']:,}건 → {path}")
+        started = time.perf_counter()
+        _run_process(_generate, path + '.tmp', seed, end_date, scale)
+        os.replace(path + '.tmp', path)
+        print(f'  생성 완료 ({time.perf_counter() - started:.1f}초)')
+    return path
+
+def measure(db_path, end_date, repeat):
+    workdir = tempfile.mkdtemp(prefix='labs-bench-')
+    try:
+        copy = os.path.join(workdir, 'future_labs.db')
+        shutil.copy(db_path, copy)
+        results = multiprocessing.Queue()
+        process = multiprocessing.Process(target=_worker, args=(copy, end_date, repeat, results))
+        process.start()
+        while True:
+            try:
+                result = results.get(timeout=1)
+                break
+            except queue.Empty:
+                if not process.is_alive():
+                    raise SystemExit(f'벤치마크 워커 실패 (종료 코드 {process.exitcode})')
+        process.join()
+        return result
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+# 기준 대비 회귀: p95가 tolerance 비율과 min_ms 이상 모두 늘었거나, 요청당 SQL 수가 늘었거나, 최대 메모리가 tolerance 비율과 1MiB 이상 늘어난 경우
+def find_regressions(current, baseline, tolerance, min_ms):
+    regressions = []
+    for size, cases in current.items():
+        for name, result in cases.items():
+            base = baseline.get(size, {}).get(name)
+            if base is None:
+                continue
+            if result['p95_ms'] > base['p95_ms'] * (1 + tolerance) and result['p95_ms'] - base['p95_ms'] >= min_ms:
+                regressions.append((size, name, 'p95', base['p95_ms'], result['p95_ms']))
+            if result['sql'] > base['sql'] + 0.5:
+                regressions.append((size, name, 'sql', base['sql'], result['sql']))
+            if result['peak_mib'] > base['peak_mib'] * (1 + tolerance) and result['peak_mib'] - base['peak_mib'] >= 1:
+                regressions.append((size, name, 'peak_mib', base['peak_mib'], result['peak_mib']))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description='API 라우트 벤치마크 (규모별 합성 데이터)')
+    parser.add_argument('--sizes', default='10000,100000,1000000', help='활동 행 수 목록 (쉼표 구분, 비용은 1/20)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--labs', type=int, default=DEFAULT_SCALE['labs'])
+    parser.add_argument('--personnel', type=int, default=DEFAULT_SCALE['personnel'])
+    parser.add_argument('--end-date', type=date.fromisoformat, default=DEFAULT_END_DATE, help='데이터 마지막 날짜 YYYY-MM-DD')
+    parser.add_argument('--years', type=int, default=DEFAULT_SCALE['years'])
+    parser.add_argument('--repeat', type=int, default=20, help='라우트별 반복 횟수 (첫 호출 제외)')
+    parser.add_argument('--data-dir', default=os.path.join(tempfile.gettempdir(), 'labs-bench-data'), help='생성한 DB 보관 디렉터리')
+    parser.add_argument('--output', help='결과 JSON 저장 경로 (다음 실행의 --baseline으로 사용)')
+    parser.add_argument('--baseline', help='비교할 기준 결과 JSON')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='허용 증가 비율 (기본 25%%)')
+    parser.add_argument('--min-ms', type=float, default=2.0, help='p95 회귀로 볼 최소 증가량(ms)')
+    args = parser.parse_args()
+
+    os.makedirs(args.data_dir, exist_ok=True)
+    sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+    current = {}
+    for size in sizes:
+        scale = {'activities': size, 'costs': max(size // 20, 1), 'labs': args.labs, 'personnel': args.personnel, 'years': args.years}
+        measured = measure(dataset_path(args.data_dir, args.seed, args.end_date, scale), args.end_date, args.repeat)
+        current[str(size)] = measured['results']
+
+        print(f'\n활동 {size:,}건')
+        print(f"{'라우트':<30}{'상태':>10}{'first':>10}{'p50':>10}{'p95':>10}{'SQL':>7}{'MiB':>8}")
+        for name, result in measured['results'].items():
+            status = ','.join(map(str, result['status'])) + ('' if result['ok'] else '!')
+            print(f"{name:<30}{status:>10}{result['first_ms']:>10.1f}{result['p50_ms']:>10.1f}{result['p95_ms']:>10.1f}"
+                  f"{result['sql']:>7.1f}{result['peak_mib']:>8.1f}")
+        if measured['uncovered']:
+            print('벤치마크 케이스가 없는 라우트: ' + ', '.join(measured['uncovered']))
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'seed': args.seed, 'end_date': args.end_date.isoformat(), 'repeat': args.repeat, 'sizes': current}, f, ensure_ascii=False, indent=2)
+        print(f'\n결과 저장: {args.output}')
+
+    failed = [(size, name) for size, cases in current.items() for name, result in cases.items() if not result['ok']]
+    for size, name in failed:
+        print(f'오류 응답: 활동 {int(size):,}건 / {name} (상태 {current[size][name]["status"]})')
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)['sizes']
+        regressions = find_regressions(current, baseline, args.tolerance, args.min_ms)
+        print(f'\n기준({args.baseline}) 대비 회귀 {len(regressions)}건')
+        for size, name, metric, before, after in regressions:
+            print(f'  활동 {int(size):,}건 / {name}: {metric} {before:.1f} → {after:.1f}')
+    if failed or regressions:
+        raise SystemExit(1)
+
+if __name__ == '__main__':
+    main()
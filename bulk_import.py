@@ -0,0 +1,160 @@
+import csv
+import io
+import json
+from datetime import datetime
+from sqlalchemy import insert
+from models import db, Lab, Project, Personnel, Activity, ActivityType
+from rollups import apply_activity_batch
+from data_version import bump_data_version
+
+# 활동 대량 등록 (JSON 배열 / CSV / NDJSON)
+# 전체 행을 먼저 검증한 뒤, 청크 단위 트랜잭션으로 executemany INSERT
+
+DEFAULT_CHUNK_SIZE = 5000
+MAX_REPORTED_ERRORS = 100
+
+class BulkImportError(Exception):
+    """검증 실패 (행 번호별 오류 목록 포함)"""
+    def __init__(self, errors):
+        super().__init__(f'{len(errors)}개 행에서 오류가 발생했습니다.')
+        self.errors = errors
+
+# 원본 데이터 → dict 목록
+def parse_rows(content, fmt):
+    if isinstance(content, bytes):
+        content = content.decode('utf-8-sig')
+    if fmt == 'json':
+        rows = json.loads(content)
+        if not isinstance(rows, list):
+            raise ValueError('JSON 형식은 배열이어야 합니다.')
+        return rows
+    if fmt == 'ndjson':
+        return [json.loads(line) for line in content.splitlines() if line.strip()]
+    if fmt == 'csv':
+        return list(csv.DictReader(io.StringIO(content)))
+    raise ValueError(f'지원하지 않는 형식입니다: {fmt}')
+
+# 파일명/Content-Type으로 형식 추정
+def detect_format(filename=None, content_type=None):
+    name = (filename or '').lower()
+    content_type = (content_type or '').lower()
+    if name.endswith('.csv') or 'csv' in content_type:
+        return 'csv'
+    if name.endswith(('.ndjson', '.jsonl')) or 'ndjson' in content_type:
+        return 'ndjson'
+    return 'json'
+
+# 빈 문자열(CSV)은 값 없음으로 처리
+def _value(row, name):
+    value = row.get(name)
+    if isinstance(value, str):
+        value = value.strip()
+        return value or None
+    return value
+
+# 코드/ID 조회 테이블 (테이블당 1회 조회)
+def _reference_maps():
+    personnel = db.session.query(Personnel.id, Personnel.employee_id).all()
+    labs = db.session.query(Lab.id, Lab.code).all()
+    projects = db.session.query(Project.id, Project.code).all()
+    return {
+        'personnel_ids': {row.id for row in personnel},
+        'employee_ids': {row.employee_id: row.id for row in personnel},
+        'lab_ids': {row.id for row in labs},
+        'lab_codes': {row.code: row.id for row in labs},
+        'project_ids': {row.id for row in projects},
+        'project_codes': {row.code: row.id for row in projects},
+    }
+
+# id 또는 코드 컬럼으로 참조 id 확인
+def _resolve(row, id_field, code_field, ids, codes, label, errors, required):
+    raw_id = _value(row, id_field)
+    raw_code = _value(row, code_field)
+    if raw_id is not None:
+        try:
+            resolved = int(raw_id)
+        except (TypeError, ValueError):
+            errors.append(f'{id_field} 값이 올바르지 않습니다: {raw_id}')
+            return None
+        if resolved not in ids:
+            errors.append(f'존재하지 않는 {label} id입니다: {resolved}')
+            return None
+        return resolved
+    if raw_code is not None:
+        resolved = codes.get(str(raw_code))
+        if resolved is None:
+            errors.append(f'존재하지 않는 {label} 코드입니다: {raw_code}')
+        return resolved
+    if required:
+        errors.append(f'{id_field} 또는 {code_field}가 필요합니다.')
+    return None
+
+# 전체 행 검증 및 INSERT 값 변환 (오류가 하나라도 있으면 BulkImportError)
+def validate_rows(rows):
+    maps = _reference_maps()
+    now = datetime.utcnow()
+    values = []
+    errors = []
+    for index, row in enumerate(rows, start=1):
+        row_errors = []
+        if not isinstance(row, dict):
+            errors.append({'row': index, 'errors': ['행은 객체여야 합니다.']})
+            continue
+        personnel_id = _resolve(row, 'personnel_id', 'employee_id', maps['personnel_ids'], maps['employee_ids'], '인원', row_errors, True)
+        lab_id = _resolve(row, 'lab_id', 'lab_code', maps['lab_ids'], maps['lab_codes'], '랩', row_errors, True)
+        project_id = _resolve(row, 'project_id', 'project_code', maps['project_ids'], maps['project_codes'], '프로젝트', row_errors, False)
+        supported_lab_id = _resolve(row, 'supported_lab_id', 'supported_lab_code', maps['lab_ids'], maps['lab_codes'], '지원 대상 랩', row_errors, False)
+
+        activity_date = None
+        try:
+            activity_date = datetime.strptime(str(_value(row, 'activity_date')), '%Y-%m-%d').date()
+        except ValueError:
+            row_errors.append(f"activity_date 값이 올바르지 않습니다: {row.get('activity_date')}")
+
+        hours = None
+        try:
+            hours = float(_value(row, 'hours'))
+            if not 0 < hours <= 24:
+                row_errors.append(f'hours는 0보다 크고 24 이하여야 합니다: {hours}')
+        except (TypeError, ValueError):
+            row_errors.append(f"hours 값이 올바르지 않습니다: {row.get('hours')}")
+
+        activity_type = None
+        try:
+            activity_type = ActivityType(_value(row, 'activity_type') or 'own')
+        except ValueError:
+            row_errors.append(f"activity_type 값이 올바르지 않습니다: {row.get('activity_type')}")
+
+        if row_errors:
+            errors.append({'row': index, 'errors': row_errors})
+            continue
+        values.append({
+            'personnel_id': personnel_id,
+            'lab_id': lab_id,
+            'project_id': project_id,
+            'activity_date': activity_date,
+            'hours': hours,
+            'activity_type': activity_type,
+            'supported_lab_id': supported_lab_id,
+            'description': _value(row, 'description') or '',
+            'created_at': now,
+            'updated_at': now,
+        })
+    if errors:
+        raise BulkImportError(errors)
+    return values
+
+# 청크 단위 INSERT (청크마다 일별 집계/지원 관계 반영 후 commit)
+def import_activities(rows, chunk_size=DEFAULT_CHUNK_SIZE):
+    values = validate_rows(rows)
+    try:
+        for start in range(0, len(values), chunk_size):
+            chunk = values[start:start + chunk_size]
+            db.session.execute(insert(Activity.__table__), chunk)
+            apply_activity_batch(chunk)
+            bump_data_version('activities')
+            db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    return len(values)
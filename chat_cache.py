@@ -0,0 +1,88 @@
+import hashlib
+import os
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from sqlalchemy import delete
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from models import db, ChatCacheEntry
+
+# 챗봇 2단계 캐시
+#  - sql: 정규화된 질문 + 스키마 해시 → SQL
+#  - summary: 정규화된 질문 + SQL + 데이터 버전 → 요약/결과
+# 프로세스 내 LRU(TTL) 앞단 + SQLite chat_cache 테이블 영속화
+
+CHAT_CACHE_SIZE = int(os.environ.get('CHAT_CACHE_SIZE', 512))
+CHAT_CACHE_TTL = int(os.environ.get('CHAT_CACHE_TTL', 7 * 24 * 3600))  # 초
+
+# 대소문자/공백/전각문자/끝 문장부호 차이는 같은 질문으로 취급
+def normalize_question(question):
+    question = unicodedata.normalize('NFKC', question).lower()
+    question = re.sub(r'\s+', ' ', question).strip()
+    return question.rstrip('?.!。 ')
+
+def cache_key(*parts):
+    return hashlib.sha256('\x1f'.join(str(part) for part in parts).encode('utf-8')).hexdigest()
+
+class ChatCache:
+    def __init__(self, kind, max_size=CHAT_CACHE_SIZE, ttl=CHAT_CACHE_TTL):
+        self.kind = kind
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key → (value, created_at)
+        self._lock = threading.Lock()
+
+    def _remember(self, key, value, created_at):
+        self._entries[key] = (value, created_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and now - entry[1] < self.ttl:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self._entries.pop(key, None)
+
+        row = db.session.get(ChatCacheEntry, key)
+        with self._lock:
+            if row is not None and row.kind == self.kind and now - row.created_at < self.ttl:
+                self._remember(key, row.value, row.created_at)
+                self.hits += 1
+                return row.value
+            self.misses += 1
+        return None
+
+    def set(self, key, value):
+        now = time.time()
+        with self._lock:
+            self._remember(key, value, now)
+        table = ChatCacheEntry.__table__
+        stmt = sqlite_insert(table).values(key=key, kind=self.kind, value=value, created_at=now)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['key'],
+            set_={'kind': stmt.excluded.kind, 'value': stmt.excluded.value, 'created_at': stmt.excluded.created_at}
+        )
+        try:
+            db.session.execute(stmt)
+            # 만료된 항목 정리
+            db.session.execute(delete(table).where(table.c.kind == self.kind, table.c.created_at < now - self.ttl))
+            db.session.commit()
+        except Exception:
+            # 영속화 실패는 응답에 영향을 주지 않음 (메모리 캐시는 유지)
+            db.session.rollback()
+
+    def stats(self):
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'size': len(self._entries)}
+
+sql_cache = ChatCache('sql')
+summary_cache = ChatCache('summary')
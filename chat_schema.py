@@ -0,0 +1,67 @@
+import hashlib
+import threading
+from sqlalchemy import Enum, UniqueConstraint, text
+from models import db
+
+# 챗봇(자연어→SQL) 프롬프트용 DB 스키마 설명
+# models.py 메타데이터로 한 번 생성해 캐시하고, SQLite PRAGMA schema_version이 바뀔 때만 다시 만든다.
+
+# 프롬프트에서 제외할 내부 테이블 (캐시/버전 카운터/집계 — 도메인 데이터가 아님)
+INTERNAL_TABLES = {'chat_cache', 'data_versions', 'activity_daily_rollups', 'cost_daily_rollups'}
+
+_lock = threading.Lock()
+_cache = {'schema_version': None, 'text': None, 'hash': None}
+
+def _column_line(column):
+    parts = [f"{column.name} {column.type.compile(dialect=db.engine.dialect)}"]
+    if column.primary_key:
+        parts.append('PK')
+    if not column.nullable and not column.primary_key:
+        parts.append('NOT NULL')
+    if column.unique:
+        parts.append('UNIQUE')
+    for fk in sorted(column.foreign_keys, key=lambda fk: fk.target_fullname):
+        parts.append(f'FK→{fk.target_fullname}')
+    if isinstance(column.type, Enum) and column.type.enum_class is not None:
+        # SQLAlchemy Enum은 값이 아닌 이름(대문자)으로 저장됨
+        stored = ', '.join(f"'{member.name}'" for member in column.type.enum_class)
+        parts.append(f'저장값: {stored}')
+    if column.comment:
+        parts.append(f'-- {column.comment}')
+    return '  - ' + ' '.join(parts)
+
+# 실제 DB에 존재하는 도메인 테이블만 메타데이터 기준으로 설명 생성
+def build_schema_description(table_names):
+    lines = ['[DB 스키마 정보] (SQLite, 날짜는 YYYY-MM-DD 문자열)']
+    for table in db.metadata.sorted_tables:
+        if table.name not in table_names or table.name in INTERNAL_TABLES:
+            continue
+        lines.append(f'{table.name}:')
+        lines.extend(_column_line(column) for column in table.columns)
+        unique = [
+            '(' + ', '.join(column.name for column in constraint.columns) + ')'
+            for constraint in table.constraints
+            if isinstance(constraint, UniqueConstraint) and len(constraint.columns) > 1
+        ]
+        if unique:
+            lines.append('  UNIQUE ' + ', '.join(unique))
+    return '\n'.join(lines)
+
+# (스키마 설명, 내용 해시) 반환 — 스키마가 바뀌지 않았다면 PRAGMA 1회만 실행
+def get_schema():
+    global _cache
+    with db.engine.connect() as conn:
+        schema_version = conn.execute(text('PRAGMA schema_version')).scalar()
+        cache = _cache
+        if cache['schema_version'] == schema_version:
+            return cache['text'], cache['hash']
+        table_names = {row[0] for row in conn.execute(text("SELECT name FROM sqlite_master WHERE type='table'"))}
+    with _lock:
+        if _cache['schema_version'] != schema_version:
+            description = build_schema_description(table_names)
+            _cache = {
+                'schema_version': schema_version,
+                'text': description,
+                'hash': hashlib.sha256(description.encode('utf-8')).hexdigest()[:16],
+            }
+        return _cache['text'], _cache['hash']
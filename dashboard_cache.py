@@ -0,0 +1,78 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, timedelta
+from sqlalchemy import case, func, select, true
+from models import db, Lab, Project, Personnel, ActivityDailyRollup, CostDailyRollup, CostType
+from data_version import get_data_version
+
+# 대시보드 KPI 캐시
+# (오늘 날짜, 관련 테이블 데이터 버전)을 키로 전체 기간 창의 KPI를 한 번에 계산해 저장한다.
+# 쓰기 API가 데이터 버전을 올리면 키가 바뀌어 자동 무효화되고, 날짜가 바뀌면 기간 창도 다시 계산된다.
+# 프로세스 내 LRU(계산 결과 dict를 그대로 보관)만 사용하고 디스크에 저장하지 않음 —
+# 라우트를 거치지 않은 변경(init_db, 직접 SQL, 백업 복원 등)은 워커 재시작 또는 TTL(DASHBOARD_CACHE_TTL) 경과 후 반영된다.
+# 재계산은 SELECT 1회.
+
+DASHBOARD_WINDOWS = tuple(sorted(int(days) for days in os.environ.get('DASHBOARD_WINDOWS', '7,30,90,365').split(',') if days.strip()))
+DEFAULT_WINDOW = 30 if 30 in DASHBOARD_WINDOWS else DASHBOARD_WINDOWS[0]
+DASHBOARD_TABLES = ('labs', 'projects', 'personnel', 'activities', 'costs')
+
+DASHBOARD_CACHE_TTL = int(os.environ.get('DASHBOARD_CACHE_TTL', 300))  # 초
+DASHBOARD_CACHE_SIZE = 16
+
+_cache = OrderedDict()  # (오늘, 기간 창, 데이터 버전) → (KPI dict, 저장 시각)
+_cache_lock = threading.Lock()
+
+# 모든 기간 창 KPI를 단일 SELECT로 계산 (카운트 서브쿼리 + 기간별 CASE 합계)
+def compute_dashboard(today, windows=DASHBOARD_WINDOWS):
+    since = {days: today - timedelta(days=days) for days in windows}
+    earliest = min(since.values())
+
+    counts = select(
+        select(func.count()).select_from(Lab).filter_by(is_active=True).scalar_subquery().label('total_labs'),
+        select(func.count()).select_from(Project).scalar_subquery().label('total_projects'),
+        select(func.count()).select_from(Personnel).filter_by(is_active=True).scalar_subquery().label('active_personnel'),
+    ).subquery()
+    hours = select(*[
+        func.sum(case((ActivityDailyRollup.activity_date >= start, ActivityDailyRollup.total_hours))).label(f'hours_{days}')
+        for days, start in since.items()
+    ]).where(ActivityDailyRollup.activity_date >= earliest).subquery()
+    costs = select(*[
+        func.sum(case((CostDailyRollup.cost_date >= start, CostDailyRollup.total_amount))).label(f'cost_{days}')
+        for days, start in since.items()
+    ]).where(CostDailyRollup.cost_date >= earliest, CostDailyRollup.cost_type == CostType.ACTUAL).subquery()
+
+    # 각 서브쿼리는 1행이므로 CROSS JOIN
+    joined = counts.join(hours, true()).join(costs, true())
+    row = db.session.execute(select(counts, hours, costs).select_from(joined)).mappings().one()
+    return {
+        'total_labs': row['total_labs'],
+        'total_projects': row['total_projects'],
+        'active_personnel': row['active_personnel'],
+        'windows': {
+            str(days): {
+                'total_hours': float(row[f'hours_{days}'] or 0),
+                'total_cost': float(row[f'cost_{days}'] or 0),
+            }
+            for days in windows
+        },
+    }
+
+# 캐시 적중 시 쿼리는 데이터 버전 조회 1회 (반환 dict는 공유되므로 수정하지 말 것)
+def get_dashboard(today=None):
+    today = today or date.today()
+    key = (today, DASHBOARD_WINDOWS, get_data_version(*DASHBOARD_TABLES))
+    now = time.time()
+    with _cache_lock:
+        entry = _cache.get(key)
+        if entry is not None and now - entry[1] < DASHBOARD_CACHE_TTL:
+            _cache.move_to_end(key)
+            return entry[0]
+    data = compute_dashboard(today)
+    with _cache_lock:
+        _cache[key] = (data, now)
+        _cache.move_to_end(key)
+        while len(_cache) > DASHBOARD_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return data
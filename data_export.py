@@ -0,0 +1,184 @@
+import os
+from sqlalchemy import Boolean, Date, DateTime, Enum, Float, Integer, Numeric, select
+from models import db
+
+# 활동/비용 및 기준 테이블 Parquet / Arrow IPC 내보내기 (오프라인 분석용)
+#  - models.py 메타데이터로 Arrow 스키마 생성: 날짜는 date32, 금액은 decimal128, Enum은 고정 사전 categorical
+#  - yield_per 배치 단위로 읽어 row group / record batch로 기록 (메모리 사용량은 배치 크기에 비례)
+# pyarrow는 내보내기에서만 사용하므로 함수 안에서 import (미설치 시 ExportError)
+
+EXPORT_BATCH_SIZE = int(os.environ.get('EXPORT_BATCH_SIZE', 50000))
+
+# 내보내기 대상 테이블 → 기간 필터/월 파티션 기준 날짜 컬럼 (기준 테이블은 None)
+EXPORT_TABLES = {
+    'activities': 'activity_date',
+    'costs': 'cost_date',
+    'labs': None,
+    'projects': None,
+    'personnel': None,
+    'project_labs': None,
+    'personnel_labs': None,
+}
+EXPORT_FORMATS = ('parquet', 'arrow')
+
+class ExportError(Exception):
+    """내보내기 불가 (pyarrow 미설치, 잘못된 테이블/형식 등)"""
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ExportError('Parquet/Arrow 내보내기에는 pyarrow가 필요합니다. (pip install pyarrow)') from e
+    return pyarrow
+
+def _arrow_type(pa, column):
+    column_type = column.type
+    if isinstance(column_type, Enum):
+        return pa.dictionary(pa.int8(), pa.string())
+    if isinstance(column_type, Boolean):
+        return pa.bool_()
+    if isinstance(column_type, Integer):
+        return pa.int64()
+    if isinstance(column_type, Float):
+        return pa.float64()
+    if isinstance(column_type, Numeric):
+        return pa.decimal128(column_type.precision or 38, column_type.scale or 0)
+    if isinstance(column_type, DateTime):
+        return pa.timestamp('us')
+    if isinstance(column_type, Date):
+        return pa.date32()
+    return pa.string()
+
+def get_table(name):
+    if name not in EXPORT_TABLES:
+        raise ExportError(f"내보낼 수 없는 테이블입니다: {name} (가능: {', '.join(EXPORT_TABLES)})")
+    return db.metadata.tables[name]
+
+def arrow_schema(table):
+    pa = _pyarrow()
+    return pa.schema([pa.field(column.name, _arrow_type(pa, column)) for column in table.columns])
+
+# 컬럼 값 목록 → Arrow 배열 (Enum은 모든 값을 담은 고정 사전으로 인코딩해 배치 간 사전이 같도록 함)
+def _to_array(pa, column, field, values):
+    if isinstance(column.type, Enum):
+        members = [member.value for member in column.type.enum_class]
+        position = {member: index for index, member in enumerate(column.type.enum_class)}
+        indices = pa.array([position.get(value) if value is not None else None for value in values], pa.int8())
+        return pa.DictionaryArray.from_arrays(indices, pa.array(members, pa.string()))
+    return pa.array(values, type=field.type)
+
+# 배치 단위 RecordBatch 생성기
+# 날짜 컬럼이 있는 테이블은 (날짜, PK) 순으로 정렬
+def iter_record_batches(table, start_date=None, end_date=None, batch_size=EXPORT_BATCH_SIZE):
+    pa = _pyarrow()
+    schema = arrow_schema(table)
+    date_column = EXPORT_TABLES[table.name]
+
+    stmt = select(table)
+    if date_column is not None:
+        if start_date:
+            stmt = stmt.where(table.c[date_column] >= start_date)
+        if end_date:
+            stmt = stmt.where(table.c[date_column] <= end_date)
+        stmt = stmt.order_by(table.c[date_column], *table.primary_key.columns)
+
+    result = db.session.execute(stmt.execution_options(yield_per=batch_size))
+    for rows in result.partitions():
+        columns = list(zip(*rows))
+        arrays = [_to_array(pa, column, schema.field(column.name), values) for column, values in zip(table.columns, columns)]
+        yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+# 파일(또는 파일 객체) 하나로 내보내기 → 기록한 행 수
+def export_table(name, sink, fmt='parquet', start_date=None, end_date=None, batch_size=EXPORT_BATCH_SIZE):
+    if fmt not in EXPORT_FORMATS:
+        raise ExportError(f'지원하지 않는 형식입니다: {fmt}')
+    pa = _pyarrow()
+    table = get_table(name)
+    schema = arrow_schema(table)
+    if fmt == 'parquet':
+        writer = pa.parquet.ParquetWriter(sink, schema, compression='zstd')
+    else:
+        writer = pa.ipc.new_stream(sink, schema)
+    rows = 0
+    try:
+        for batch in iter_record_batches(table, start_date, end_date, batch_size=batch_size):
+            if fmt == 'parquet':
+                writer.write_batch(batch, row_group_size=batch_size)
+            else:
+                writer.write_batch(batch)
+            rows += batch.num_rows
+    finally:
+        writer.close()
+    return rows
+
+# Arrow IPC 스트림을 배치 단위 bytes로 생성 (HTTP 스트리밍 응답용)
+class _ChunkSink:
+    def __init__(self):
+        self.chunks = []
+        self.closed = False
+        self.position = 0
+
+    def write(self, data):
+        data = bytes(data)
+        self.chunks.append(data)
+        self.position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self):
+        data = b''.join(self.chunks)
+        self.chunks = []
+        return data
+
+def iter_arrow_stream(name, start_date=None, end_date=None, batch_size=EXPORT_BATCH_SIZE):
+    pa = _pyarrow()
+    table = get_table(name)
+    sink = _ChunkSink()
+    writer = pa.ipc.new_stream(sink, arrow_schema(table))
+    for batch in iter_record_batches(table, start_date, end_date, batch_size=batch_size):
+        writer.write_batch(batch)
+        yield sink.drain()
+    writer.close()
+    yield sink.drain()
+
+# 월별 파티션 디렉터리로 내보내기 (<base_dir>/month=YYYY-MM/part-0.parquet, hive 형식) → 기록한 행 수
+# 배치는 날짜순이므로 월이 바뀔 때마다 이전 파일을 닫고 다음 파일을 연다 (열린 writer는 항상 1개)
+def export_partitioned(name, base_dir, start_date=None, end_date=None, batch_size=EXPORT_BATCH_SIZE):
+    pa = _pyarrow()
+    import pyarrow.compute as pc
+    table = get_table(name)
+    date_column = EXPORT_TABLES[name]
+    if date_column is None:
+        raise ExportError(f'{name} 테이블은 월 단위로 나눌 수 없습니다.')
+    schema = arrow_schema(table)
+    date_index = schema.get_field_index(date_column)
+
+    writer, current_month, rows = None, None, 0
+    try:
+        for batch in iter_record_batches(table, start_date, end_date, batch_size=batch_size):
+            months = pc.strftime(batch.column(date_index), format='%Y-%m')
+            for month in pc.unique(months).to_pylist():
+                part = batch.filter(pc.equal(months, month))
+                if month != current_month:
+                    if writer is not None:
+                        writer.close()
+                    directory = os.path.join(base_dir, f'month={month}')
+                    os.makedirs(directory, exist_ok=True)
+                    writer = pa.parquet.ParquetWriter(os.path.join(directory, 'part-0.parquet'), schema, compression='zstd')
+                    current_month = month
+                writer.write_batch(part, row_group_size=batch_size)
+                rows += part.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
@@ -0,0 +1,34 @@
+import time
+from sqlalchemy import func
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from models import db, DataVersion
+
+# 테이블별 데이터 버전 카운터
+# 쓰기 경로에서 같은 트랜잭션 안에 bump_data_version()을 호출하면 commit과 함께 반영된다.
+
+def bump_data_version(*names):
+    table = DataVersion.__table__
+    now = time.time()
+    stmt = sqlite_insert(table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['name'],
+        set_={'version': table.c.version + 1, 'updated_at': stmt.excluded.updated_at}
+    )
+    db.session.execute(stmt, [{'name': name, 'version': 1, 'updated_at': now} for name in names])
+
+# 지정한 테이블들(미지정 시 전체)의 버전 합 — 어느 하나라도 바뀌면 값이 달라짐
+def get_data_version(*names):
+    query = db.session.query(func.coalesce(func.sum(DataVersion.version), 0))
+    if names:
+        query = query.filter(DataVersion.name.in_(names))
+    return query.scalar()
+
+# (버전 합, 마지막 변경 시각) — HTTP ETag/Last-Modified용, 쿼리 1회
+def get_data_version_info(*names):
+    query = db.session.query(
+        func.coalesce(func.sum(DataVersion.version), 0),
+        func.max(DataVersion.updated_at)
+    )
+    if names:
+        query = query.filter(DataVersion.name.in_(names))
+    return query.one()
@@ -0,0 +1,41 @@
+import argparse
+import os
+from datetime import datetime
+from app import app
+from data_export import EXPORT_BATCH_SIZE, EXPORT_FORMATS, EXPORT_TABLES, ExportError, export_partitioned, export_table
+
+def parse_date(value):
+    return datetime.strptime(value, '%Y-%m-%d').date()
+
+def main():
+    """활동/비용 등 테이블을 Parquet / Arrow IPC 파일로 내보내기 (오프라인 분석용)"""
+    parser = argparse.ArgumentParser(description='테이블 Parquet / Arrow 내보내기')
+    parser.add_argument('tables', nargs='+', choices=list(EXPORT_TABLES), help='내보낼 테이블')
+    parser.add_argument('--format', choices=EXPORT_FORMATS, default='parquet', help='파일 형식 (기본: parquet)')
+    parser.add_argument('--out', default='export', help='출력 디렉터리')
+    parser.add_argument('--start-date', type=parse_date, help='시작일 (YYYY-MM-DD, 활동/비용만)')
+    parser.add_argument('--end-date', type=parse_date, help='종료일 (YYYY-MM-DD, 활동/비용만)')
+    parser.add_argument('--partition-by-month', action='store_true', help='월별 디렉터리(month=YYYY-MM)로 나눠 저장 (parquet만)')
+    parser.add_argument('--batch-size', type=int, default=EXPORT_BATCH_SIZE, help='row group / record batch 행 수')
+    args = parser.parse_args()
+    if args.partition_by_month and args.format != 'parquet':
+        parser.error('--partition-by-month는 parquet 형식에서만 사용할 수 있습니다.')
+
+    os.makedirs(args.out, exist_ok=True)
+    with app.app_context():
+        for name in args.tables:
+            try:
+                if args.partition_by_month and EXPORT_TABLES[name] is not None:
+                    path = os.path.join(args.out, name)
+                    rows = export_partitioned(name, path, args.start_date, args.end_date, batch_size=args.batch_size)
+                else:
+                    path = os.path.join(args.out, f"{name}.{'parquet' if args.format == 'parquet' else 'arrows'}")
+                    with open(path, 'wb') as f:
+                        rows = export_table(name, f, args.format, args.start_date, args.end_date, batch_size=args.batch_size)
+            except ExportError as e:
+                print(e)
+                raise SystemExit(1)
+            print(f"{name}: {rows}건 → {path}")
+
+if __name__ == '__main__':
+    main()
@@ -20,6 +20,18 @@ const ChatWidget: React.FC = () => {
   const [messages, setMessages] = useState<Message[]>([]);
   const [input, setInput] = useState('');
   const [loading, setLoading] = useState(false);
+  const [streaming, setStreaming] = useState(false);
+
+  // 마지막 봇 메시지에 텍스트 덧붙이기 (스트리밍 중 요약 조각)
+  const appendToBot = (text: string) => {
+    setMessages(msgs => {
+      const last = msgs[msgs.length - 1];
+      if (last && last.from === 'bot') {
+        return [...msgs.slice(0, -1), { ...last, text: last.text + text }];
+      }
+      return [...msgs, { from: 'bot', text }];
+    });
+  };
 
   const sendMessage = async () => {
     if (!input.trim()) return;
@@ -27,17 +39,43 @@ const ChatWidget: React.FC = () => {
     setInput('');
     setLoading(true);
     try {
-      const res = await fetch('/api/chat', {
+      // SSE 스트리밍: sql → result → summary(조각) → done / error
+      const res = await fetch('/api/chat/stream', {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
         body: JSON.stringify({ query: input }),
       });
-      const data = await res.json();
-      setMessages(msgs => [...msgs, { from: 'bot', text: data.answer || data.error || '오류가 발생했습니다.' }]);
+      if (!res.ok || !res.body) {
+        const data = await res.json().catch(() => ({}));
+        throw new Error(data.error || '오류가 발생했습니다.');
+      }
+      const reader = res.body.getReader();
+      const decoder = new TextDecoder();
+      let buffer = '';
+      while (true) {
+        const { done, value } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+        const events = buffer.split('\n\n');
+        buffer = events.pop() || '';
+        for (const raw of events) {
+          const event = raw.match(/^event: (.*)$/m)?.[1];
+          const dataLine = raw.match(/^data: (.*)$/m)?.[1];
+          if (!event || !dataLine) continue;
+          const data = JSON.parse(dataLine);
+          if (event === 'summary') {
+            setStreaming(true);
+            appendToBot(data.text);
+          } else if (event === 'error') {
+            setMessages(msgs => [...msgs, { from: 'bot', text: data.error || '오류가 발생했습니다.' }]);
+          }
+        }
+      }
     } catch (e) {
-      setMessages(msgs => [...msgs, { from: 'bot', text: '서버와 통신 중 오류가 발생했습니다.' }]);
+      setMessages(msgs => [...msgs, { from: 'bot', text: e instanceof Error && e.message ? e.message : '서버와 통신 중 오류가 발생했습니다.' }]);
     }
     setLoading(false);
+    setStreaming(false);
   };
 
   return (
@@ -59,7 +97,7 @@ const ChatWidget: React.FC = () => {
                 dangerouslySetInnerHTML={{ __html: renderMarkdown(msg.text) }}
               />
             ))}
-            {loading && <div className="bot">답변 생성 중...</div>}
+            {loading && !streaming && <div className="bot">답변 생성 중...</div>}
           </div>
           <div className="chat-input">
             <input
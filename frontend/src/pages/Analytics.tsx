@@ -1,12 +1,10 @@
 import React, { useEffect, useState } from 'react';
 import { Card, Row, Col, Select, DatePicker, Spin, message, Typography } from 'antd';
 import Plot from 'react-plotly.js';
-import { fetchLabs, fetchLabConnections, fetchProjects, fetchActivities, fetchCosts } from '../services/api';
+import { fetchLabs, fetchLabGraph, fetchProjects, fetchAnalyticsTimeseries } from '../services/api';
 import { Lab } from '../types/lab';
 import { Project } from '../types/project';
-import { Activity } from '../types/activity';
-import { Cost } from '../types/cost';
-import { LabConnection } from '../types/analytics';
+import { LabGraph, Timeseries } from '../types/analytics';
 import dayjs, { Dayjs } from 'dayjs';
 import CytoscapeNetwork from '../components/CytoscapeNetwork';
 
@@ -15,12 +13,11 @@ const { RangePicker } = DatePicker;
 const Analytics: React.FC = () => {
   const [labs, setLabs] = useState<Lab[]>([]);
   const [projects, setProjects] = useState<Project[]>([]);
-  const [activities, setActivities] = useState<Activity[]>([]);
-  const [costs, setCosts] = useState<Cost[]>([]);
+  const [timeseries, setTimeseries] = useState<Timeseries | null>(null);
   const [loading, setLoading] = useState(false);
   const [selectedLab, setSelectedLab] = useState<number | null>(null);
   const [selectedLabId, setSelectedLabId] = useState<number | undefined>(undefined);
-  const [connections, setConnections] = useState<LabConnection[]>([]);
+  const [graph, setGraph] = useState<LabGraph | null>(null);
   const [projectId, setProjectId] = useState<number | undefined>(undefined);
   const [drillData, setDrillData] = useState<{dates: string[], hours: number[], costs: number[], participants: number[]}>();
   const [drillLoading, setDrillLoading] = useState(false);
@@ -33,27 +30,37 @@ const Analytics: React.FC = () => {
   // aggregation 단위별로 날짜 key를 만드는 함수
   function getDateKey(date: dayjs.Dayjs) {
     if (aggregation === 'day') return date.format('YYYY-MM-DD');
-    if (aggregation === 'week') return date.format('YYYY-[W]WW');
+    // 서버(week)와 동일하게 해당 주 월요일 날짜를 key로 사용
+    if (aggregation === 'week') return date.subtract((date.day() + 6) % 7, 'day').format('YYYY-MM-DD');
     if (aggregation === 'month') return date.format('YYYY-MM');
     if (aggregation === 'year') return date.format('YYYY');
     return date.format('YYYY-MM-DD');
   }
 
-  // 데이터 로드 함수 (활동/비용 전체 불러오기)
+  // 데이터 로드 함수 (활동/비용은 서버에서 기간 단위로 집계된 결과만 불러오기)
   const loadData = async () => {
     setLoading(true);
     try {
-      const [labs, projects, acts, csts] = await Promise.all([
-        fetchLabs(), fetchProjects(), fetchActivities(), fetchCosts()
+      const [labs, projects, series] = await Promise.all([
+        fetchLabs(), fetchProjects(),
+        fetchAnalyticsTimeseries({
+          bucket: aggregation,
+          start_date: dateRange ? dateRange[0].format('YYYY-MM-DD') : undefined,
+          end_date: dateRange ? dateRange[1].format('YYYY-MM-DD') : undefined,
+          lab_id: selectedLabId,
+          project_id: projectId,
+        })
       ]);
       setLabs(labs);
       setProjects(projects);
-      setActivities(acts);
-      setCosts(csts);
-      const conns = await fetchLabConnections();
-      setConnections(conns);
-      const supportActs = acts.filter(a => a.activity_type === 'support' && a.supported_lab_name);
-      console.log('지원관계 활동 수:', supportActs.length, supportActs);
+      setTimeseries(series);
+      // 지원 네트워크 지표(PageRank/매개 중심성 등)는 서버에서 계산
+      const labGraph = await fetchLabGraph({
+        start_date: dateRange ? dateRange[0].format('YYYY-MM-DD') : undefined,
+        end_date: dateRange ? dateRange[1].format('YYYY-MM-DD') : undefined,
+        project_id: projectId,
+      });
+      setGraph(labGraph);
     } catch {
       message.error('분석 데이터를 불러오지 못했습니다.');
     } finally {
@@ -64,7 +71,7 @@ const Analytics: React.FC = () => {
   useEffect(() => {
     loadData();
     // eslint-disable-next-line
-  }, [projectId, dateRange, selectedLabId]);
+  }, [projectId, dateRange, selectedLabId, aggregation]);
 
   // aggregation(집계 단위)에 따라 기간 내 날짜 key 목록 생성
   function getDateKeysInRange(start: dayjs.Dayjs, end: dayjs.Dayjs) {
@@ -83,68 +90,55 @@ const Analytics: React.FC = () => {
     return keys;
   }
 
-  // aggregation에 따라 활동/비용 데이터를 날짜별로 합산
+  // 서버 집계 결과(컬럼형 배열)를 기간 내 날짜 key에 맞춰 배치 (빈 구간은 0)
   function aggregateStatsByDate() {
     if (!dateRange) return { x: [], hours: [], costs: [], participants: [] };
     const [start, end] = dateRange;
     const dateKeys = getDateKeysInRange(start, end);
-    const agg: Record<string, { hours: number, costs: number, participants: Set<number> }> = {};
-    dateKeys.forEach(k => { agg[k] = { hours: 0, costs: 0, participants: new Set() }; });
-    // 활동 집계
-    activities.forEach(act => {
-      const d = dayjs(act.activity_date);
-      if (d.isBefore(start) || d.isAfter(end)) return;
-      if (selectedLabId && act.lab_id !== selectedLabId) return;
-      if (projectId && act.project_id !== projectId) return;
-      const key = getDateKey(d);
-      if (agg[key]) {
-        agg[key].hours += act.hours;
-        agg[key].participants.add(act.personnel_id);
-      }
-    });
-    // 비용 집계
-    costs.forEach(cost => {
-      const d = dayjs(cost.cost_date);
-      if (d.isBefore(start) || d.isAfter(end)) return;
-      if (selectedLabId && cost.lab_id !== selectedLabId) return;
-      if (projectId && cost.project_id !== projectId) return;
-      const key = getDateKey(d);
-      if (agg[key]) {
-        agg[key].costs += cost.amount;
-      }
-    });
-    // key별 참여자(personnel_id) 배열 로그 출력
-    Object.entries(agg).forEach(([k, v]) => {
-      console.log('key:', k, '참여자:', Array.from(v.participants));
-    });
+    const agg: Record<string, { hours: number, costs: number, participants: number }> = {};
+    dateKeys.forEach(k => { agg[k] = { hours: 0, costs: 0, participants: 0 }; });
+    if (timeseries && timeseries.bucket === aggregation) {
+      timeseries.activities.bucket.forEach((key, i) => {
+        if (agg[key]) {
+          agg[key].hours += timeseries.activities.hours[i];
+          agg[key].participants += timeseries.activities.participants[i];
+        }
+      });
+      timeseries.costs.bucket.forEach((key, i) => {
+        if (agg[key]) agg[key].costs += timeseries.costs.amount[i];
+      });
+    }
     return {
       x: dateKeys,
       hours: dateKeys.map(k => agg[k].hours),
       costs: dateKeys.map(k => agg[k].costs),
-      participants: dateKeys.map(k => agg[k].participants.size),
+      participants: dateKeys.map(k => agg[k].participants),
     };
   }
 
   const aggData = aggregateStatsByDate();
-  console.log('aggData.x', aggData.x);
 
-  // Cytoscape 네트워크 데이터 변환
-  const cyNodes = Array.from(new Set([
-    ...connections.map(c => c.supporting_lab),
-    ...connections.map(c => c.supported_lab),
-  ])).map(lab => ({ data: { id: lab, label: lab } }));
-  const cyEdges = connections.map(c => ({
+  // Cytoscape 네트워크 데이터 변환 (지원 관계가 있는 랩만, 노드 크기 = PageRank 비율)
+  const graphLabs = (graph?.labs || []).filter(l => l.partners_out + l.partners_in > 0);
+  const maxRank = Math.max(...graphLabs.map(l => l.pagerank), 0) || 1;
+  const cyNodes = graphLabs.map(l => ({
     data: {
-      source: c.supporting_lab,
-      target: c.supported_lab,
-      label: `${c.supporting_lab}→${c.supported_lab} (${Math.round(c.total_hours)}h)` ,
-      weight: c.total_hours
+      id: String(l.lab_id),
+      label: l.name,
+      rank: l.pagerank / maxRank,
+      cluster: l.cluster,
+    }
+  }));
+  const cyEdges = (graph?.edges || []).filter(e => e.hours > 0).map(e => ({
+    data: {
+      source: String(e.supporting_lab_id),
+      target: String(e.supported_lab_id),
+      label: e.delta === undefined
+        ? `${e.supporting_lab}→${e.supported_lab} (${Math.round(e.hours)}h)`
+        : `${e.supporting_lab}→${e.supported_lab} (${Math.round(e.hours)}h, ${e.delta >= 0 ? '+' : ''}${Math.round(e.delta)})`,
+      weight: e.hours
     }
   }));
-
-  console.log('connections', connections);
-  console.log('cyNodes', cyNodes);
-  console.log('cyEdges', cyEdges);
 
   const nodeIds = new Set(cyNodes.map(n => n.data.id));
   const elements = [
@@ -170,8 +164,8 @@ const Analytics: React.FC = () => {
         'text-valign': 'center',
         'color': '#222',
         'background-color': '#1890ff',
-        'width': 40,
-        'height': 40,
+        'width': 'mapData(rank, 0, 1, 24, 64)',
+        'height': 'mapData(rank, 0, 1, 24, 64)',
         'font-size': 14,
         'font-weight': 'bold',
       }
@@ -192,32 +186,39 @@ const Analytics: React.FC = () => {
     }
   ];
 
-  // Bar Chart 클릭 시 drill-down
+  // Bar Chart 클릭 시 drill-down (일별 시계열 1회 조회)
   const handleBarClick = async (labIdx: number) => {
-    // 기존 fetchLabStats 기반 drill-down 로직 주석 처리
-    // const lab = labs[labIdx];
-    // if (!lab) return;
-    // setDrillLoading(true);
-    // setSelectedLab(lab.id);
-    // // 기간 내에서 일별로 통계 조회
-    // const start = dateRange ? dateRange[0] : dayjs().subtract(30, 'day');
-    // const end = dateRange ? dateRange[1] : dayjs();
-    // const days: string[] = [];
-    // for (let d = start; d.isBefore(end) || d.isSame(end, 'day'); d = d.add(1, 'day')) {
-    //   days.push(d.format('YYYY-MM-DD'));
-    // }
-    // const params: any = { project_id: projectId };
-    // const hours: number[] = [];
-    // const costs: number[] = [];
-    // const participants: number[] = [];
-    // for (const day of days) {
-    //   const stat = await fetchLabStats(lab.id, { ...params, start_date: day, end_date: day });
-    //   hours.push(stat.total_hours);
-    //   costs.push(stat.total_cost);
-    //   participants.push(stat.participant_count);
-    // }
-    // setDrillData({ dates: days, hours, costs, participants });
-    // setDrillLoading(false);
+    const lab = labs[labIdx];
+    if (!lab) return;
+    setDrillLoading(true);
+    setSelectedLab(lab.id);
+    try {
+      const start = dateRange ? dateRange[0] : dayjs().subtract(30, 'day');
+      const end = dateRange ? dateRange[1] : dayjs();
+      const series = await fetchAnalyticsTimeseries({
+        bucket: 'day',
+        start_date: start.format('YYYY-MM-DD'),
+        end_date: end.format('YYYY-MM-DD'),
+        lab_id: lab.id,
+        project_id: projectId,
+      });
+      const days: string[] = [];
+      for (let d = start; d.isBefore(end) || d.isSame(end, 'day'); d = d.add(1, 'day')) {
+        days.push(d.format('YYYY-MM-DD'));
+      }
+      const actIdx = new Map(series.activities.bucket.map((k, i) => [k, i]));
+      const costIdx = new Map(series.costs.bucket.map((k, i) => [k, i]));
+      setDrillData({
+        dates: days,
+        hours: days.map(k => actIdx.has(k) ? series.activities.hours[actIdx.get(k)!] : 0),
+        costs: days.map(k => costIdx.has(k) ? series.costs.amount[costIdx.get(k)!] : 0),
+        participants: days.map(k => actIdx.has(k) ? series.activities.participants[actIdx.get(k)!] : 0),
+      });
+    } catch {
+      message.error('상세 추이를 불러오지 못했습니다.');
+    } finally {
+      setDrillLoading(false);
+    }
   };
 
   // Plotly 레이아웃 공통 옵션 생성 함수
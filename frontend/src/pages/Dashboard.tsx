@@ -1,5 +1,5 @@
 import React, { useEffect, useState } from 'react';
-import { Card, Row, Col, Statistic, Spin, message } from 'antd';
+import { Card, Row, Col, Statistic, Spin, Select, message } from 'antd';
 import { fetchDashboardData } from '../services/api';
 import { DashboardData } from '../types/dashboard';
 import { TeamOutlined, ProjectOutlined, FieldTimeOutlined, UserOutlined, DollarOutlined } from '@ant-design/icons';
@@ -7,6 +7,8 @@ import { TeamOutlined, ProjectOutlined, FieldTimeOutlined, UserOutlined, DollarO
 const Dashboard: React.FC = () => {
   const [data, setData] = useState<DashboardData | null>(null);
   const [loading, setLoading] = useState(false);
+  // 기간 창(일) — 응답에 모든 기간 값이 포함되어 있어 전환 시 재요청 없음
+  const [windowDays, setWindowDays] = useState(30);
 
   useEffect(() => {
     setLoading(true);
@@ -18,7 +20,17 @@ const Dashboard: React.FC = () => {
 
   return (
     <div>
-      <h2>대시보드</h2>
+      <Row justify="space-between" align="middle">
+        <h2>대시보드</h2>
+        {data && (
+          <Select
+            style={{ width: 120 }}
+            value={windowDays}
+            onChange={setWindowDays}
+            options={Object.keys(data.windows).map(days => ({ value: Number(days), label: `최근 ${days}일` }))}
+          />
+        )}
+      </Row>
       {loading ? (
         <Spin size="large" />
       ) : data ? (
@@ -35,7 +47,7 @@ const Dashboard: React.FC = () => {
           </Col>
           <Col xs={24} sm={12} md={8} lg={6}>
             <Card>
-              <Statistic title="최근 30일 총 투입시간" value={data.total_hours} suffix="시간" prefix={<FieldTimeOutlined />} precision={1} />
+              <Statistic title={`최근 ${windowDays}일 총 투입시간`} value={data.windows[windowDays]?.total_hours ?? data.total_hours} suffix="시간" prefix={<FieldTimeOutlined />} precision={1} />
             </Card>
           </Col>
           <Col xs={24} sm={12} md={8} lg={6}>
@@ -45,7 +57,7 @@ const Dashboard: React.FC = () => {
           </Col>
           <Col xs={24} sm={12} md={8} lg={6}>
             <Card>
-              <Statistic title="최근 30일 총 비용" value={data.total_cost} prefix={<DollarOutlined />} suffix="원" precision={0} />
+              <Statistic title={`최근 ${windowDays}일 총 비용`} value={data.windows[windowDays]?.total_cost ?? data.total_cost} prefix={<DollarOutlined />} suffix="원" precision={0} />
             </Card>
           </Col>
         </Row>
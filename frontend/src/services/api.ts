@@ -4,13 +4,13 @@ import { Lab, LabInput } from '../types/lab';
 import { Project, ProjectInput } from '../types/project';
 import { Personnel, PersonnelInput } from '../types/personnel';
 import { Activity, ActivityInput } from '../types/activity';
-import { LabStat, LabConnection } from '../types/analytics';
+import { LabStat, LabConnection, LabGraph, LabGraphParams, Timeseries, TimeseriesParams } from '../types/analytics';
 import { Cost, CostInput } from '../types/cost';
 
 const API_BASE = '/api';
 
-export async function fetchDashboardData(): Promise<DashboardData> {
-  const res = await axios.get(`${API_BASE}/dashboard`);
+export async function fetchDashboardData(window?: number): Promise<DashboardData> {
+  const res = await axios.get(`${API_BASE}/dashboard`, { params: window ? { window } : {} });
   return res.data;
 }
 
@@ -87,11 +87,26 @@ export async function fetchLabStats(lab_id: number, params?: {start_date?: strin
   return res.data;
 }
 
+export async function fetchLabsStats(params?: {lab_ids?: string, start_date?: string, end_date?: string, project_id?: number}): Promise<LabStat[]> {
+  const res = await axios.get(`${API_BASE}/labs/stats`, { params });
+  return res.data;
+}
+
 export async function fetchLabConnections(): Promise<LabConnection[]> {
   const res = await axios.get(`${API_BASE}/lab-connections`);
   return res.data;
 }
 
+export async function fetchLabGraph(params?: LabGraphParams): Promise<LabGraph> {
+  const res = await axios.get(`${API_BASE}/lab-connections/graph`, { params });
+  return res.data;
+}
+
+export async function fetchAnalyticsTimeseries(params: TimeseriesParams): Promise<Timeseries> {
+  const res = await axios.get(`${API_BASE}/analytics/timeseries`, { params });
+  return res.data;
+}
+
 export async function fetchCosts(): Promise<Cost[]> {
   const res = await axios.get(`${API_BASE}/costs`);
   return res.data;
@@ -1,4 +1,5 @@
 export interface LabStat {
+  lab_id?: number;
   total_hours: number;
   participant_count: number;
   total_cost: number;
@@ -9,4 +10,92 @@ export interface LabConnection {
   supported_lab: string;
   total_hours: number;
   last_activity_date: string;
-} 
\ No newline at end of file
+}
+
+// 랩간 지원 네트워크 지표 (GET /api/lab-connections/graph)
+export interface LabGraphParams {
+  start_date?: string;
+  end_date?: string;
+  compare_start?: string;
+  compare_end?: string;
+  project_id?: number;
+  min_hours?: number;
+}
+
+export interface LabGraphNode {
+  lab_id: number;
+  name: string;
+  support_given: number;
+  support_received: number;
+  partners_out: number;
+  partners_in: number;
+  pagerank: number;
+  betweenness: number;
+  reciprocity: number;
+  cluster: number;
+}
+
+export interface LabGraphEdge {
+  supporting_lab_id: number;
+  supported_lab_id: number;
+  supporting_lab: string;
+  supported_lab: string;
+  hours: number;
+  reverse_hours: number;
+  previous_hours?: number;  // 비교 기간이 있을 때만
+  delta?: number;
+}
+
+export interface LabGraph {
+  window: {
+    start_date: string | null;
+    end_date: string | null;
+    compare_start: string | null;
+    compare_end: string | null;
+    project_id: number | null;
+    min_hours: number;
+  };
+  summary: {
+    total_hours: number;
+    edge_count: number;
+    edge_reciprocity: number;
+    weighted_reciprocity: number;
+    cluster_count: number;
+  };
+  labs: LabGraphNode[];
+  clusters: { cluster: number; lab_ids: number[]; hours: number }[];
+  edges: LabGraphEdge[];
+}
+
+export type TimeBucket = 'day' | 'week' | 'month' | 'year';
+
+export interface TimeseriesParams {
+  bucket: TimeBucket;
+  start_date?: string;
+  end_date?: string;
+  lab_id?: number;
+  project_id?: number;
+  activity_type?: string;
+  cost_type?: 'actual' | 'budget';
+  category?: string;
+  group_by?: string;
+}
+
+// 컬럼형 배열 (bucket 외 group_by 차원 컬럼이 추가될 수 있음)
+export interface Timeseries {
+  bucket: TimeBucket;
+  group_by: string[];
+  activities: {
+    bucket: string[];
+    hours: number[];
+    participants: number[];
+    activity_count: number[];
+    [dimension: string]: (string | number | null)[];
+  };
+  costs: {
+    bucket: string[];
+    amount: number[];
+    cost_count: number[];
+    [dimension: string]: (string | number | null)[];
+  };
+}
@@ -4,4 +4,6 @@ export interface DashboardData {
   total_hours: number;
   active_personnel: number;
   total_cost: number;
+  window: number;
+  windows: Record<string, { total_hours: number; total_cost: number }>;
 } 
\ No newline at end of file
@@ -0,0 +1,42 @@
+from datetime import date, datetime, timezone
+from functools import wraps
+from flask import current_app, request
+from data_version import get_data_version_info
+
+# GET 응답 HTTP 캐시 (ETag / Last-Modified)
+# 테이블별 데이터 버전으로 ETag를 만들고, If-None-Match가 일치하면
+# 조회/직렬화 없이 304를 반환한다. 브라우저는 Cache-Control: no-cache로 매번 재검증한다.
+# Last-Modified는 참고용으로만 보냄 — HTTP 날짜는 초 단위라 같은 초 안의 변경을 구분할 수 없으므로
+# If-Modified-Since만으로는 304를 반환하지 않는다.
+
+def _not_modified(etag):
+    return bool(request.if_none_match) and request.if_none_match.contains(etag)
+
+# names: 응답이 의존하는 테이블 이름들 (bump_data_version에 쓰는 이름과 동일)
+# daily: 오늘 날짜 기준 기간을 쓰는 응답은 날짜가 바뀌면 ETag도 바뀌도록 함
+def etag_versioned(*names, daily=False):
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            version, updated_at = get_data_version_info(*names)
+            etag = f'{view.__name__}-{version}'
+            if daily:
+                etag += f'-{date.today():%Y%m%d}'
+            last_modified = None
+            if updated_at is not None and not daily:
+                # HTTP 날짜는 초 단위
+                last_modified = datetime.fromtimestamp(int(updated_at), tz=timezone.utc)
+
+            if _not_modified(etag):
+                response = current_app.response_class(status=304)
+            else:
+                response = current_app.make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            response.set_etag(etag)
+            if last_modified is not None:
+                response.last_modified = last_modified
+            response.headers['Cache-Control'] = 'no-cache'
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,27 @@
+import argparse
+from app import app
+from bulk_import import BulkImportError, DEFAULT_CHUNK_SIZE, MAX_REPORTED_ERRORS, detect_format, parse_rows, import_activities
+
+def main():
+    """활동 데이터 파일(JSON 배열 / CSV / NDJSON) 대량 등록"""
+    parser = argparse.ArgumentParser(description='활동 데이터 대량 등록')
+    parser.add_argument('path', help='가져올 파일 경로 (.json, .csv, .ndjson)')
+    parser.add_argument('--format', choices=['json', 'csv', 'ndjson'], help='파일 형식 (기본: 확장자로 추정)')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help='트랜잭션당 INSERT 행 수')
+    args = parser.parse_args()
+
+    with open(args.path, 'rb') as f:
+        rows = parse_rows(f.read(), args.format or detect_format(args.path))
+
+    with app.app_context():
+        try:
+            inserted = import_activities(rows, chunk_size=args.chunk_size)
+        except BulkImportError as e:
+            print(e)
+            for error in e.errors[:MAX_REPORTED_ERRORS]:
+                print(f"  {error['row']}행: {', '.join(error['errors'])}")
+            raise SystemExit(1)
+    print(f"활동 {inserted}건 등록 완료!")
+
+if __name__ == '__main__':
+    main()
@@ -1,16 +1,40 @@
+import os
+os.environ['SCHEMA_CHECK'] = 'off'  # 빈 DB/구 스키마도 열 수 있도록 (아래에서 마이그레이션 적용)
 from app import app, db
-from models import Lab, Project, Personnel, Activity, Cost, ActivityType, ProjectStatus, CostType
+from sqlalchemy import inspect
+from models import Lab, Project, Personnel, Activity, Cost, ActivityType, ProjectStatus, CostType, DataVersion
+from rollups import rebuild_rollups
+from data_version import bump_data_version
+from migrations import run_migrations
 from datetime import datetime, date, timedelta
+import argparse
 import random
 
-def init_database():
-    """데이터베이스 초기화 및 샘플 데이터 생성"""
+def init_database(reset=False):
+    """데이터베이스 초기화 및 샘플 데이터 생성 (기존 데이터가 있으면 스키마만 업그레이드)"""
     with app.app_context():
-        # 테이블 삭제 후 재생성
-        db.drop_all()
-        db.create_all()
-        
+        if reset:
+            # 테이블 삭제 후 재생성
+            # 데이터 버전은 이어서 증가시킴 (0부터 다시 시작하면 실행 중인 워커의 캐시 키/ETag와 겹칠 수 있음)
+            versions = []
+            if inspect(db.engine).has_table(DataVersion.__tablename__):
+                # 구 스키마(updated_at 컬럼 없음)일 수 있어 이름/버전만 읽음
+                versions = [
+                    {'name': name, 'version': version}
+                    for name, version in db.session.query(DataVersion.name, DataVersion.version)
+                ]
+                db.session.rollback()
+            db.drop_all()
+            db.create_all()
+            if versions:
+                db.session.execute(DataVersion.__table__.insert(), versions)
+                db.session.commit()
+        run_migrations(db.engine, progress=print)
         print("데이터베이스 테이블 생성 완료...")
+
+        if not reset and Lab.query.first() is not None:
+            print("기존 데이터가 있어 샘플 데이터 생성을 건너뜁니다. (전체 초기화: --reset)")
+            return
         
         # 샘플 랩 데이터
         labs = [
@@ -125,6 +149,11 @@ def init_database():
             db.session.add(cost)
         
         db.session.commit()
+        
+        # 일별 집계 테이블 생성 + 데이터 버전 증가 (캐시/ETag 무효화)
+        rebuild_rollups()
+        bump_data_version('labs', 'projects', 'personnel', 'activities', 'costs')
+        db.session.commit()
         print("샘플 데이터 생성 완료!")
         print("총 랩 수:", Lab.query.count())
         print("총 프로젝트 수:", Project.query.count())
@@ -133,4 +162,7 @@ def init_database():
         print("총 비용 데이터 수:", Cost.query.count())
 
 if __name__ == '__main__':
-    init_database() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description='DB 초기화 및 샘플 데이터 생성')
+    parser.add_argument('--reset', action='store_true', help='모든 테이블을 삭제하고 샘플 데이터로 다시 생성')
+    args = parser.parse_args()
+    init_database(reset=args.reset) 
\ No newline at end of file
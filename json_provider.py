@@ -0,0 +1,45 @@
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from flask.json.provider import DefaultJSONProvider, JSONProvider
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 기반으로 동작
+    orjson = None
+
+# Flask JSON 직렬화 (app.json)
+#  - orjson 사용 (date/datetime은 ISO 8601, Enum은 값, Decimal은 float)
+#  - orjson이 없으면 동일한 변환 규칙의 표준 json provider 사용
+
+def _default(obj):
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (date, datetime)):
+        return obj.isoformat()
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+class OrjsonProvider(JSONProvider):
+    # int 키 dict 허용, numpy 값은 그대로 직렬화
+    option = (orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY) if orjson else 0
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=_default, option=self.option).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=_default, option=self.option)
+        return self._app.response_class(body, mimetype='application/json')
+
+class StdJSONProvider(DefaultJSONProvider):
+    default = staticmethod(_default)
+    ensure_ascii = False
+    sort_keys = False
+
+def init_json(app):
+    app.json = OrjsonProvider(app) if orjson is not None else StdJSONProvider(app)
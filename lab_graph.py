@@ -0,0 +1,289 @@
+import os
+import threading
+from collections import OrderedDict
+from datetime import date, timedelta
+import numpy as np
+from sqlalchemy import String, select, type_coerce
+from models import db, ActivityDailyRollup, ActivityType, Lab
+from data_version import get_data_version
+
+# 랩간 지원 네트워크 분석 (GET /api/lab-connections/graph)
+# 일별 집계 테이블의 지원 활동을 (일, 지원 랩, 지원받은 랩, 프로젝트, 시간) NumPy 배열로 한 번 읽어
+# (활동/랩 데이터 버전이 같으면 재사용) 기간/프로젝트별 인접 행렬을 bincount로 만들고,
+# 중심성(가중 차수, PageRank, 매개 중심성)·상호성·강연결 클러스터·기간 대비 변화량을 행렬 연산으로 계산한다.
+# 같은 조건의 결과는 데이터 버전이 바뀔 때까지 메모리에 보관.
+
+GRAPH_TABLES = ('activities', 'labs')
+GRAPH_CACHE_SIZE = int(os.environ.get('GRAPH_CACHE_SIZE', 64))  # 조건별 결과 보관 개수
+PAGERANK_DAMPING = 0.85
+
+EPOCH = date(1970, 1, 1)
+
+_graph = {}  # 'version' → 데이터 버전, 'graph' → LabGraph
+_graph_lock = threading.Lock()
+
+def _to_day(value):
+    return (value - EPOCH).days
+
+def _to_date(day):
+    return EPOCH + timedelta(days=int(day))
+
+# --- 행렬 알고리즘 (matrix[i, j]: 랩 i가 랩 j를 지원한 시간) ---
+
+# 가중 PageRank (지원 시간 비율로 전이, 나가는 지원이 없는 랩은 전체에 균등 분배)
+def pagerank(matrix, damping=PAGERANK_DAMPING, tol=1e-10, max_iter=200):
+    size = len(matrix)
+    if size == 0:
+        return np.zeros(0)
+    out = matrix.sum(axis=1)
+    transition = np.divide(matrix, out[:, None], out=np.zeros_like(matrix), where=out[:, None] > 0)
+    dangling = out == 0
+    rank = np.full(size, 1.0 / size)
+    for _ in range(max_iter):
+        updated = (1 - damping) / size + damping * (rank @ transition + rank[dangling].sum() / size)
+        if np.abs(updated - rank).sum() < tol:
+            return updated
+        rank = updated
+    return rank
+
+# 매개 중심성 (방향 그래프, 간선 수 기준 최단 경로 — Brandes 알고리즘을 모든 출발점에 대해 행렬로 동시 계산)
+# (n-1)(n-2)로 정규화
+def betweenness(adjacency):
+    size = len(adjacency)
+    if size < 3:
+        return np.zeros(size)
+    links = adjacency.astype(np.float64)
+    sigma = np.eye(size)  # sigma[s, v]: s → v 최단 경로 수
+    depth = np.where(np.eye(size, dtype=bool), 0, -1)
+    frontier = np.eye(size)
+    level = 0
+    while frontier.any():
+        level += 1
+        reached = (frontier @ links) * (depth < 0)
+        newly = reached > 0
+        if not newly.any():
+            break
+        depth[newly] = level
+        sigma += reached
+        frontier = reached
+
+    delta = np.zeros((size, size))
+    for current in range(level, 0, -1):
+        at_level = depth == current
+        coefficient = np.divide(1 + delta, sigma, out=np.zeros_like(delta), where=at_level)
+        delta += np.where(depth == current - 1, sigma * (coefficient @ links.T), 0)
+    np.fill_diagonal(delta, 0)
+    return delta.sum(axis=0) / ((size - 1) * (size - 2))
+
+# 강연결 요소 — 도달 가능 행렬(거듭제곱으로 닫힘 계산)에서 서로 도달 가능한 랩끼리 묶음
+# → 랩별 요소 대표 인덱스 (요소 안에서 가장 작은 인덱스)
+def strongly_connected_components(adjacency):
+    size = len(adjacency)
+    if size == 0:
+        return np.zeros(0, dtype=np.int64)
+    reach = adjacency.astype(bool) | np.eye(size, dtype=bool)
+    while True:
+        square = reach.astype(np.float32)
+        expanded = (square @ square) > 0
+        if (expanded == reach).all():
+            break
+        reach = expanded
+    return (reach & reach.T).argmax(axis=1)
+
+# 상호 지원 비율 (전체: 양방향 간선 비율, 가중: 시간 기준, 랩별: 주고받은 시간 중 상호 지원 비율)
+def reciprocity(matrix):
+    mutual = np.minimum(matrix, matrix.T)
+    edges = matrix > 0
+    total = matrix.sum()
+    exchanged = matrix.sum(axis=1) + matrix.sum(axis=0)
+    return {
+        'edges': float((edges & edges.T).sum() / edges.sum()) if edges.any() else 0.0,
+        'weighted': float(mutual.sum() / total) if total > 0 else 0.0,
+        'by_lab': np.divide(2 * mutual.sum(axis=1), exchanged, out=np.zeros(len(matrix)), where=exchanged > 0),
+    }
+
+class LabGraph:
+    """지원 활동 간선 배열 + 전체 기간 인접 행렬 (데이터 버전별 1개)"""
+
+    def __init__(self, lab_ids, lab_names, days, sources, targets, projects, hours):
+        self.lab_ids = np.asarray(lab_ids, dtype=np.int64)
+        self.lab_names = lab_names
+        self.size = len(self.lab_ids)
+        self.days = np.asarray(days, dtype=np.int32)
+        self.sources = np.asarray(sources, dtype=np.int64)
+        self.targets = np.asarray(targets, dtype=np.int64)
+        self.projects = np.asarray(projects, dtype=np.int64)
+        self.hours = np.asarray(hours, dtype=np.float64)
+        self.first_day = int(self.days.min()) if len(self.days) else None
+        self.last_day = int(self.days.max()) if len(self.days) else None
+        self.matrix = self.adjacency()
+        self._results = OrderedDict()
+        self._results_lock = threading.Lock()
+
+    # 기간(일 번호, 양 끝 포함)/프로젝트로 거른 간선의 인접 행렬
+    def adjacency(self, start_day=None, end_day=None, project_id=None):
+        mask = np.ones(len(self.hours), dtype=bool)
+        if start_day is not None:
+            mask &= self.days >= start_day
+        if end_day is not None:
+            mask &= self.days <= end_day
+        if project_id is not None:
+            mask &= self.projects == project_id
+        flat = np.bincount(
+            self.sources[mask] * self.size + self.targets[mask],
+            weights=self.hours[mask], minlength=self.size * self.size
+        )
+        return flat.astype(np.float64, copy=False).reshape(self.size, self.size)
+
+    def analyze(self, start_date=None, end_date=None, compare_start=None, compare_end=None, project_id=None, min_hours=0.0):
+        key = (start_date, end_date, compare_start, compare_end, project_id, min_hours)
+        with self._results_lock:
+            if key in self._results:
+                self._results.move_to_end(key)
+                return self._results[key]
+        result = self._analyze(*key)
+        with self._results_lock:
+            self._results[key] = result
+            while len(self._results) > GRAPH_CACHE_SIZE:
+                self._results.popitem(last=False)
+        return result
+
+    def _analyze(self, start_date, end_date, compare_start, compare_end, project_id, min_hours):
+        start_day = _to_day(start_date) if start_date else None
+        end_day = _to_day(end_date) if end_date else None
+        if start_day is None and end_day is None and project_id is None:
+            matrix = self.matrix
+        else:
+            matrix = self.adjacency(start_day, end_day, project_id)
+
+        # 시작일만 지정: 종료일은 마지막 데이터 일 (데이터가 없거나 시작일보다 이르면 시작일)
+        if start_day is not None and end_day is None:
+            end_date = _to_date(max(self.last_day, start_day) if self.last_day is not None else start_day)
+            end_day = _to_day(end_date)
+
+        # 비교 기간: 지정하지 않았고 시작일이 있으면 바로 앞의 같은 길이 기간
+        if compare_start is None and compare_end is None and start_date:
+            length = end_day - start_day + 1
+            compare_start = start_date - timedelta(days=length)
+            compare_end = start_date - timedelta(days=1)
+        previous = None
+        if compare_start or compare_end:
+            previous = self.adjacency(
+                _to_day(compare_start) if compare_start else None,
+                _to_day(compare_end) if compare_end else None,
+                project_id
+            )
+
+        # 구조 지표(매개 중심성/클러스터/상호성)는 min_hours 초과 간선만 사용
+        structure = np.where(matrix > min_hours, matrix, 0.0)
+        adjacency = structure > 0
+        np.fill_diagonal(adjacency, False)
+        ranks = pagerank(matrix)
+        between = betweenness(adjacency)
+        components = strongly_connected_components(adjacency)
+        mutual = reciprocity(structure)
+
+        support_given = matrix.sum(axis=1)
+        support_received = matrix.sum(axis=0)
+        labs = [{
+            'lab_id': int(self.lab_ids[i]),
+            'name': self.lab_names.get(int(self.lab_ids[i]), 'Unknown'),
+            'support_given': float(support_given[i]),
+            'support_received': float(support_received[i]),
+            'partners_out': int(adjacency[i].sum()),
+            'partners_in': int(adjacency[:, i].sum()),
+            'pagerank': float(ranks[i]),
+            'betweenness': float(between[i]),
+            'reciprocity': float(mutual['by_lab'][i]),
+            'cluster': int(self.lab_ids[components[i]]),
+        } for i in range(self.size)]
+
+        clusters = []
+        for representative in np.unique(components):
+            members = np.flatnonzero(components == representative)
+            if len(members) < 2:
+                continue
+            clusters.append({
+                'cluster': int(self.lab_ids[representative]),
+                'lab_ids': self.lab_ids[members].tolist(),
+                'hours': float(structure[np.ix_(members, members)].sum()),
+            })
+        clusters.sort(key=lambda cluster: (-len(cluster['lab_ids']), -cluster['hours']))
+
+        # 간선: 현재 또는 비교 기간에 시간이 있는 랩 쌍 (현재 시간 내림차순)
+        present = matrix > 0 if previous is None else (matrix > 0) | (previous > 0)
+        rows, columns = np.nonzero(present)
+        order = np.lexsort((columns, rows, -matrix[rows, columns]))
+        edges = []
+        for i, j in zip(rows[order].tolist(), columns[order].tolist()):
+            edge = {
+                'supporting_lab_id': int(self.lab_ids[i]),
+                'supported_lab_id': int(self.lab_ids[j]),
+                'supporting_lab': self.lab_names.get(int(self.lab_ids[i]), 'Unknown'),
+                'supported_lab': self.lab_names.get(int(self.lab_ids[j]), 'Unknown'),
+                'hours': float(matrix[i, j]),
+                'reverse_hours': float(matrix[j, i]),
+            }
+            if previous is not None:
+                edge['previous_hours'] = float(previous[i, j])
+                edge['delta'] = float(matrix[i, j] - previous[i, j])
+            edges.append(edge)
+
+        return {
+            'window': {
+                'start_date': start_date or (_to_date(self.first_day) if self.first_day is not None else None),
+                'end_date': end_date or (_to_date(self.last_day) if self.last_day is not None else None),
+                'compare_start': compare_start,
+                'compare_end': compare_end,
+                'project_id': project_id,
+                'min_hours': min_hours,
+            },
+            'summary': {
+                'total_hours': float(matrix.sum()),
+                'edge_count': int((matrix > 0).sum()),
+                'edge_reciprocity': mutual['edges'],
+                'weighted_reciprocity': mutual['weighted'],
+                'cluster_count': len(clusters),
+            },
+            'labs': labs,
+            'clusters': clusters,
+            'edges': edges,
+        }
+
+# 지원 간선 (일 × 지원 랩 × 지원받은 랩 × 프로젝트, 인원 단위 행 그대로 — bincount에서 합산) → LabGraph
+def load_lab_graph():
+    labs = db.session.query(Lab.id, Lab.name).order_by(Lab.id).all()
+    lab_ids = np.array([lab_id for lab_id, _ in labs], dtype=np.int64)
+    table = ActivityDailyRollup.__table__
+    stmt = select(
+        type_coerce(table.c.activity_date, String),
+        table.c.lab_id, table.c.supported_lab_id, table.c.project_id, table.c.total_hours,
+    ).where(
+        table.c.activity_type == ActivityType.SUPPORT,
+        table.c.supported_lab_id != 0,
+        table.c.supported_lab_id != table.c.lab_id,
+    )
+    rows = db.session.execute(stmt).all()
+    dates, supporting, supported, projects, hours = (list(column) for column in zip(*rows)) if rows else ([],) * 5
+
+    days = np.array(dates, dtype='datetime64[D]').astype(np.int32)  # 1970-01-01부터의 일 수
+    supporting = np.array(supporting, dtype=np.int64)
+    supported = np.array(supported, dtype=np.int64)
+    sources = np.searchsorted(lab_ids, supporting)
+    targets = np.searchsorted(lab_ids, supported)
+    # 삭제된 랩을 가리키는 간선 제외
+    known = (sources < len(lab_ids)) & (targets < len(lab_ids))
+    known[known] &= (lab_ids[sources[known]] == supporting[known]) & (lab_ids[targets[known]] == supported[known])
+    return LabGraph(
+        lab_ids, dict(labs),
+        days[known], sources[known], targets[known],
+        np.array(projects, dtype=np.int64)[known], np.array(hours, dtype=np.float64)[known]
+    )
+
+# 데이터 버전이 바뀌었을 때만 다시 읽음 (쿼리 1회로 버전 확인)
+def get_lab_graph():
+    version = get_data_version(*GRAPH_TABLES)
+    with _graph_lock:
+        if _graph.get('version') != version:
+            _graph.update(version=version, graph=load_lab_graph())
+        return _graph['graph']
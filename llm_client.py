@@ -0,0 +1,163 @@
+import json
+import os
+import random
+import threading
+import time
+from metrics import LatencyHistogram
+
+# LLM(Claude Messages API) 공용 클라이언트
+#  - 프로세스당 keep-alive 커넥션 풀 (요청마다 TLS 재연결 방지)
+#  - connect/read 타임아웃, 429/5xx/연결 오류 시 지수 백오프 재시도
+#  - 세마포어로 프로세스당 동시 호출 수 제한
+#  - 스트리밍(SSE) 응답 텍스트 조각 단위 전달
+#  - 호출 지연시간 히스토그램
+# requests는 첫 호출 시 import (챗봇을 쓰지 않는 워커의 기동 시간 단축)
+
+LLM_CONNECT_TIMEOUT = float(os.environ.get('LLM_CONNECT_TIMEOUT', 5))
+LLM_READ_TIMEOUT = float(os.environ.get('LLM_READ_TIMEOUT', 60))
+LLM_MAX_RETRIES = int(os.environ.get('LLM_MAX_RETRIES', 2))
+LLM_BACKOFF_BASE = float(os.environ.get('LLM_BACKOFF_BASE', 0.5))
+LLM_MAX_CONCURRENCY = int(os.environ.get('LLM_MAX_CONCURRENCY', 4))
+LLM_QUEUE_TIMEOUT = float(os.environ.get('LLM_QUEUE_TIMEOUT', 30))
+
+RETRY_STATUS = {429, 500, 502, 503, 504, 529}
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+class LLMError(Exception):
+    """LLM 호출 실패 (재시도 후에도 실패, 대기열 초과 등)"""
+
+def _requests():
+    import requests
+    import requests.adapters
+    return requests
+
+class LLMClient:
+    def __init__(self, api_url, api_key, model='claude-sonnet-4-20250514',
+                 max_concurrency=LLM_MAX_CONCURRENCY, max_retries=LLM_MAX_RETRIES):
+        self.api_url = api_url
+        self.api_key = api_key
+        self.model = model
+        self.max_retries = max_retries
+        self.timeout = (LLM_CONNECT_TIMEOUT, LLM_READ_TIMEOUT)
+        self.latency = LatencyHistogram(LATENCY_BUCKETS)
+        self._semaphore = threading.BoundedSemaphore(max_concurrency)
+        self._max_concurrency = max_concurrency
+        self._session = None
+        self._session_pid = None
+        self._session_lock = threading.Lock()
+
+    # fork(gunicorn 워커) 이후 프로세스별로 세션 생성
+    def _get_session(self):
+        pid = os.getpid()
+        if self._session is None or self._session_pid != pid:
+            with self._session_lock:
+                if self._session is None or self._session_pid != pid:
+                    requests = _requests()
+                    session = requests.Session()
+                    adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=self._max_concurrency)
+                    session.mount('https://', adapter)
+                    session.mount('http://', adapter)
+                    session.headers.update({
+                        'x-api-key': self.api_key,
+                        'anthropic-version': '2023-06-01',
+                        'content-type': 'application/json',
+                    })
+                    self._session = session
+                    self._session_pid = pid
+        return self._session
+
+    def _backoff(self, attempt, response=None):
+        retry_after = response.headers.get('retry-after') if response is not None else None
+        if retry_after:
+            try:
+                return min(float(retry_after), LLM_READ_TIMEOUT)
+            except ValueError:
+                pass
+        return LLM_BACKOFF_BASE * (2 ** attempt) * (0.5 + random.random())
+
+    def _acquire(self):
+        if not self._semaphore.acquire(timeout=LLM_QUEUE_TIMEOUT):
+            raise LLMError('LLM 동시 호출 한도를 초과했습니다. 잠시 후 다시 시도해주세요.')
+
+    # 재시도 포함 요청 전송 (stream=True면 응답 본문은 호출 측에서 읽음)
+    def _send(self, payload, stream=False):
+        requests = _requests()
+        for attempt in range(self.max_retries + 1):
+            response = None
+            try:
+                response = self._get_session().post(self.api_url, json=payload, timeout=self.timeout, stream=stream)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt >= self.max_retries:
+                    raise LLMError(f'LLM 호출 실패: {e}') from e
+            else:
+                if response.status_code < 400:
+                    return response
+                if response.status_code not in RETRY_STATUS or attempt >= self.max_retries:
+                    raise LLMError(f'LLM 호출 실패 (HTTP {response.status_code}): {response.text[:200]}')
+                response.close()
+            time.sleep(self._backoff(attempt, response))
+
+    # Messages API 호출 → requests.Response
+    def post(self, payload, label='default'):
+        payload = {'model': self.model, 'max_tokens': 1024, **payload}
+        self._acquire()
+        started = time.perf_counter()
+        outcome = 'error'
+        try:
+            response = self._send(payload)
+            outcome = 'ok'
+            return response
+        finally:
+            self._semaphore.release()
+            self.latency.observe(f'{label}:{outcome}', time.perf_counter() - started)
+
+    # 스트리밍(SSE) 호출 → 텍스트 조각을 순서대로 yield
+    # 스트림을 다 읽거나 소비자가 중단할 때까지 동시 호출 슬롯을 점유한다.
+    def stream(self, payload, label='default'):
+        payload = {'model': self.model, 'max_tokens': 1024, **payload, 'stream': True}
+        requests = _requests()
+        self._acquire()
+        started = time.perf_counter()
+        outcome = 'error'
+        response = None
+        try:
+            response = self._send(payload, stream=True)
+            first = True
+            # text/event-stream은 charset 헤더가 없어도 UTF-8 (줄 단위로 디코딩)
+            for raw in response.iter_lines():
+                line = raw.decode('utf-8')
+                if not line.startswith('data:'):
+                    continue
+                try:
+                    event = json.loads(line[5:])
+                except ValueError:
+                    continue
+                if event.get('type') == 'error':
+                    raise LLMError(f"LLM 스트림 오류: {event.get('error')}")
+                if event.get('type') != 'content_block_delta':
+                    continue
+                text = event.get('delta', {}).get('text')
+                if text:
+                    if first:
+                        self.latency.observe(f'{label}:first_token', time.perf_counter() - started)
+                        first = False
+                    yield text
+            outcome = 'ok'
+        except GeneratorExit:
+            outcome = 'aborted'
+            raise
+        except requests.RequestException as e:
+            raise LLMError(f'LLM 스트림 수신 실패: {e}') from e
+        finally:
+            if response is not None:
+                response.close()
+            self._semaphore.release()
+            self.latency.observe(f'{label}:{outcome}', time.perf_counter() - started)
+
+    # 첫 번째 텍스트 블록 반환
+    def complete(self, payload, label='default'):
+        response = self.post(payload, label=label)
+        try:
+            return response.json()['content'][0]['text']
+        except (ValueError, KeyError, IndexError) as e:
+            raise LLMError(f'LLM 응답 형식이 올바르지 않습니다: {response.text[:200]}') from e
@@ -0,0 +1,197 @@
+import cProfile
+import io
+import logging
+import os
+import pstats
+import threading
+import time
+from flask import g, has_request_context, request
+from sqlalchemy import event
+
+# 요청/SQL 계측 (GET /api/_metrics, Prometheus 텍스트 형식)
+#  - 라우트별 응답 시간 히스토그램, 상태 코드별 응답 수, 응답 크기 히스토그램
+#  - SQLAlchemy before/after_cursor_execute 이벤트로 SQL 실행 수/누적 시간 (라우트별 + 엔진별 히스토그램)
+#  - LLM 호출 시간은 LLMClient.latency를 함께 출력
+#  - (선택) 느린 요청/SQL 로그, 요청 단위 cProfile
+# 값은 프로세스별로 집계된다 (gunicorn 워커마다 별도).
+
+def _env_ms(name):
+    value = os.environ.get(name)
+    return float(value) / 1000 if value else None
+
+METRICS_SLOW_REQUEST_MS = _env_ms('METRICS_SLOW_REQUEST_MS')  # 초과 시 요청 로그 (미설정: 끔)
+METRICS_SLOW_QUERY_MS = _env_ms('METRICS_SLOW_QUERY_MS')  # 초과 시 SQL 로그 (미설정: 끔)
+METRICS_PROFILE = os.environ.get('METRICS_PROFILE', '')  # '1': ?_profile=1 요청만, 'all': 모든 요청 cProfile
+METRICS_PROFILE_LINES = int(os.environ.get('METRICS_PROFILE_LINES', 25))
+
+REQUEST_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+SQL_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5)
+SIZE_BUCKETS = (1024, 10 * 1024, 100 * 1024, 1024 ** 2, 10 * 1024 ** 2, 100 * 1024 ** 2)
+
+logger = logging.getLogger(__name__)
+
+# 라벨별 누적 히스토그램 (요청/SQL/응답 크기, LLM 호출 시간에 공용)
+class LatencyHistogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._series = {}  # label → {'counts': [...], 'sum': float, 'count': int}
+
+    def observe(self, label, seconds):
+        with self._lock:
+            series = self._series.setdefault(label, {'counts': [0] * len(self.buckets), 'sum': 0.0, 'count': 0})
+            for i, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    series['counts'][i] += 1
+            series['sum'] += seconds
+            series['count'] += 1
+
+    # 누적 버킷 카운트 (Prometheus histogram 형식과 동일한 의미)
+    def snapshot(self):
+        with self._lock:
+            return {
+                label: {
+                    'buckets': dict(zip(self.buckets, series['counts'])),
+                    'sum': series['sum'],
+                    'count': series['count'],
+                }
+                for label, series in self._series.items()
+            }
+
+class RequestMetrics:
+    def __init__(self):
+        self.latency = LatencyHistogram(REQUEST_BUCKETS)  # (method, route) → 초
+        self.payload = LatencyHistogram(SIZE_BUCKETS)  # (method, route) → 응답 바이트 (길이를 알 수 있는 응답만)
+        self.sql = LatencyHistogram(SQL_BUCKETS)  # (engine,) → 초
+        self._lock = threading.Lock()
+        self._responses = {}  # (method, route, status) → 건수
+        self._sql_totals = {}  # (method, route) → [실행 수, 누적 초]
+
+    def record_request(self, key, status, seconds, size, sql_statements, sql_seconds):
+        self.latency.observe(key, seconds)
+        if size is not None:
+            self.payload.observe(key, size)
+        with self._lock:
+            self._responses[(*key, str(status))] = self._responses.get((*key, str(status)), 0) + 1
+            totals = self._sql_totals.setdefault(key, [0, 0.0])
+            totals[0] += sql_statements
+            totals[1] += sql_seconds
+
+    # 엔진 이벤트 또는 직접 계측한 SQL 1건 (요청 처리 중이면 해당 요청에 합산)
+    def record_sql(self, engine_name, seconds, statement):
+        self.sql.observe((engine_name,), seconds)
+        if has_request_context():
+            g.metrics_sql_statements = g.get('metrics_sql_statements', 0) + 1
+            g.metrics_sql_seconds = g.get('metrics_sql_seconds', 0.0) + seconds
+        if METRICS_SLOW_QUERY_MS is not None and seconds >= METRICS_SLOW_QUERY_MS:
+            route = f' [{_route_key()[1]}]' if has_request_context() else ''
+            logger.warning('느린 SQL %.1fms (%s)%s: %s', seconds * 1000, engine_name, route, ' '.join(statement.split()))
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self._responses), {key: tuple(totals) for key, totals in self._sql_totals.items()}
+
+metrics = RequestMetrics()
+
+# 라우트 템플릿 기준 라벨 (/api/labs/<int:lab_id>) — 매칭되지 않은 경로는 하나로 묶어 라벨 수 제한
+def _route_key():
+    rule = request.url_rule.rule if request.url_rule is not None else 'unmatched'
+    return request.method, rule
+
+def _profiling_requested():
+    return METRICS_PROFILE == 'all' or (METRICS_PROFILE == '1' and '_profile' in request.args)
+
+def _before_request():
+    g.metrics_started = time.perf_counter()
+    g.metrics_sql_statements = 0
+    g.metrics_sql_seconds = 0.0
+    if _profiling_requested():
+        g.metrics_profiler = cProfile.Profile()
+        g.metrics_profiler.enable()
+
+# 스트리밍 응답은 첫 바이트 전까지의 시간만 측정되고 크기는 집계하지 않음
+def _after_request(response):
+    started = g.pop('metrics_started', None)
+    if started is None:
+        return response
+    seconds = time.perf_counter() - started
+    profiler = g.pop('metrics_profiler', None)
+    if profiler is not None:
+        profiler.disable()
+
+    key = _route_key()
+    sql_statements = g.get('metrics_sql_statements', 0)
+    sql_seconds = g.get('metrics_sql_seconds', 0.0)
+    size = None if response.is_streamed else response.content_length
+    metrics.record_request(key, response.status_code, seconds, size, sql_statements, sql_seconds)
+
+    slow = METRICS_SLOW_REQUEST_MS is not None and seconds >= METRICS_SLOW_REQUEST_MS
+    if slow:
+        logger.warning('느린 요청 %.1fms %s %s (상태 %s, SQL %d건 %.1fms)',
+                       seconds * 1000, key[0], request.full_path.rstrip('?'), response.status_code, sql_statements, sql_seconds * 1000)
+    if profiler is not None and (slow or METRICS_SLOW_REQUEST_MS is None):
+        output = io.StringIO()
+        pstats.Stats(profiler, stream=output).sort_stats('cumulative').print_stats(METRICS_PROFILE_LINES)
+        logger.warning('프로파일 %s %s (%.1fms)\n%s', key[0], request.full_path.rstrip('?'), seconds * 1000, output.getvalue())
+    return response
+
+# SQLAlchemy 엔진의 모든 커서 실행 시간 측정 (중첩 실행 대비 연결별 시작 시각 스택)
+def instrument_engine(engine, name):
+    @event.listens_for(engine, 'before_cursor_execute')
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('metrics_query_started', []).append(time.perf_counter())
+
+    @event.listens_for(engine, 'after_cursor_execute')
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info['metrics_query_started'].pop()
+        metrics.record_sql(name, time.perf_counter() - started, statement)
+
+    # 실행 중 오류가 나면 after_cursor_execute가 호출되지 않으므로 시작 시각 정리
+    @event.listens_for(engine, 'handle_error')
+    def handle_error(context):
+        if context.connection is not None and context.connection.info.get('metrics_query_started'):
+            context.connection.info['metrics_query_started'].pop()
+
+def init_metrics(app):
+    app.before_request(_before_request)
+    app.after_request(_after_request)
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _labels(names, values, **extra):
+    pairs = [*zip(names, values), *extra.items()]
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}' if pairs else ''
+
+def _histogram(lines, name, description, snapshot, label_names):
+    lines.append(f'# HELP {name} {description}')
+    lines.append(f'# TYPE {name} histogram')
+    for key, series in sorted(snapshot.items()):
+        for bound, count in series['buckets'].items():
+            lines.append(f'{name}_bucket{_labels(label_names, key, le=bound)} {count}')
+        lines.append(f'{name}_bucket{_labels(label_names, key, le="+Inf")} {series["count"]}')
+        lines.append(f'{name}_sum{_labels(label_names, key)} {series["sum"]}')
+        lines.append(f'{name}_count{_labels(label_names, key)} {series["count"]}')
+
+def _counter(lines, name, description, values, label_names):
+    lines.append(f'# HELP {name} {description}')
+    lines.append(f'# TYPE {name} counter')
+    for key, value in sorted(values.items()):
+        lines.append(f'{name}{_labels(label_names, key)} {value}')
+
+# Prometheus 텍스트 노출 형식 (llm_latency: LLMClient.latency — 라벨 '호출:결과')
+def render_prometheus(llm_latency=None):
+    responses, sql_totals = metrics.snapshot()
+    lines = []
+    _histogram(lines, 'labs_http_request_duration_seconds', 'HTTP 요청 처리 시간', metrics.latency.snapshot(), ('method', 'route'))
+    _counter(lines, 'labs_http_responses_total', '상태 코드별 HTTP 응답 수', responses, ('method', 'route', 'status'))
+    _histogram(lines, 'labs_http_response_size_bytes', 'HTTP 응답 크기 (스트리밍 제외)', metrics.payload.snapshot(), ('method', 'route'))
+    _counter(lines, 'labs_http_sql_statements_total', '요청 처리 중 실행한 SQL 수',
+             {key: totals[0] for key, totals in sql_totals.items()}, ('method', 'route'))
+    _counter(lines, 'labs_http_sql_seconds_total', '요청 처리 중 SQL 누적 실행 시간',
+             {key: totals[1] for key, totals in sql_totals.items()}, ('method', 'route'))
+    _histogram(lines, 'labs_sql_duration_seconds', 'SQL 실행 시간', metrics.sql.snapshot(), ('engine',))
+    if llm_latency is not None:
+        llm_snapshot = {tuple(label.split(':', 1)): series for label, series in llm_latency.snapshot().items()}
+        _histogram(lines, 'labs_llm_duration_seconds', 'LLM 호출 시간 (outcome=first_token: 스트리밍 첫 토큰까지)', llm_snapshot, ('call', 'outcome'))
+    return '\n'.join(lines) + '\n'
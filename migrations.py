@@ -0,0 +1,62 @@
+from models import db, upgrade_schema
+from rollups import rebuild_rollups, rollups_need_backfill
+
+# 버전별 스키마 마이그레이션 (기존 DB를 데이터 삭제 없이 제자리 업그레이드)
+#  - 마지막으로 적용한 버전은 SQLite PRAGMA user_version에 기록 (별도 테이블 없이 한 번의 조회로 확인)
+#  - 각 단계는 여러 번 실행해도 결과가 같도록 작성 (중간에 실패하면 다시 실행해 이어서 적용)
+#  - 스키마 변경은 MIGRATIONS 끝에 다음 번호로 추가하고, 이미 배포된 단계는 수정하지 않는다
+# 단계 중 세션(db.session)을 쓰는 것이 있으므로 앱 컨텍스트 안에서 실행한다.
+
+class MigrationError(Exception):
+    """마이그레이션 불가 (DB가 코드보다 새 버전 등)"""
+
+# 모델 기준 누락된 테이블/컬럼/인덱스 추가
+def _upgrade_schema(engine):
+    upgrade_schema(engine)
+
+# 새로 생성된 일별 집계 / 지원 관계 테이블 백필
+def _backfill_rollups(engine):
+    if rollups_need_backfill():
+        rebuild_rollups()
+        db.session.commit()
+
+MIGRATIONS = [
+    (1, '누락된 테이블/컬럼/인덱스 추가', _upgrade_schema),
+    (2, '일별 집계/지원 관계 백필', _backfill_rollups),
+    (3, '일별 집계 프로젝트 인덱스 추가', _upgrade_schema),
+]
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+def get_schema_version(engine):
+    with engine.connect() as conn:
+        return conn.exec_driver_sql('PRAGMA user_version').scalar()
+
+def _set_schema_version(engine, version):
+    with engine.begin() as conn:
+        conn.exec_driver_sql(f'PRAGMA user_version = {int(version)}')
+
+# 아직 적용하지 않은 단계 [(버전, 설명, 함수), ...]
+def pending_migrations(engine):
+    current = get_schema_version(engine)
+    if current > SCHEMA_VERSION:
+        raise MigrationError(f'DB 스키마 버전({current})이 코드가 아는 최신 버전({SCHEMA_VERSION})보다 높습니다.')
+    return [migration for migration in MIGRATIONS if migration[0] > current]
+
+# 대기 중인 단계를 순서대로 적용하고 단계마다 버전 기록 → 적용한 버전 목록
+def run_migrations(engine, progress=None):
+    applied = []
+    for version, description, migrate in pending_migrations(engine):
+        migrate(engine)
+        _set_schema_version(engine, version)
+        applied.append(version)
+        if progress:
+            progress(f'마이그레이션 {version} 적용: {description}')
+    return applied
+
+# 대기 중인 단계가 있으면 MigrationError (앱 기동 시 확인용)
+def check_schema(engine):
+    if pending_migrations(engine):
+        raise MigrationError(
+            f'DB 스키마 버전({get_schema_version(engine)})이 최신({SCHEMA_VERSION})이 아닙니다. '
+            'python upgrade_db.py 로 업그레이드한 뒤 다시 시작하세요.'
+        )
@@ -1,6 +1,7 @@
 from flask_sqlalchemy import SQLAlchemy
 from datetime import datetime
-from sqlalchemy import Enum, Numeric
+from sqlalchemy import Enum, Numeric, inspect, text
+from sqlalchemy.schema import CreateColumn
 import enum
 
 db = SQLAlchemy()
@@ -24,7 +25,7 @@ class Lab(db.Model):
     __tablename__ = 'labs'
     
     id = db.Column(db.Integer, primary_key=True)
-    code = db.Column(db.String(20), unique=True, nullable=False)  # 랩 고유 코드
+    code = db.Column(db.String(20), unique=True, nullable=False, comment='랩 고유 코드')
     name = db.Column(db.String(100), nullable=False)
     description = db.Column(db.Text)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
@@ -86,7 +87,7 @@ class Personnel(db.Model):
     employee_id = db.Column(db.String(20), unique=True, nullable=False)
     name = db.Column(db.String(50), nullable=False)
     email = db.Column(db.String(100), unique=True, nullable=False)
-    ms_teams_id = db.Column(db.String(100))  # MS Teams 연동용
+    ms_teams_id = db.Column(db.String(100), comment='MS Teams 연동용')
     position = db.Column(db.String(50))
     is_active = db.Column(db.Boolean, default=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
@@ -102,14 +103,14 @@ class Activity(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     personnel_id = db.Column(db.Integer, db.ForeignKey('personnel.id'), nullable=False)
     lab_id = db.Column(db.Integer, db.ForeignKey('labs.id'), nullable=False)
-    project_id = db.Column(db.Integer, db.ForeignKey('projects.id'))  # NULL 가능 (미상)
+    project_id = db.Column(db.Integer, db.ForeignKey('projects.id'), comment='NULL 가능 (미상)')
     
     activity_date = db.Column(db.Date, nullable=False)
-    hours = db.Column(db.Float, nullable=False)  # 투입 시간
-    activity_type = db.Column(Enum(ActivityType), default=ActivityType.OWN)
+    hours = db.Column(db.Float, nullable=False, comment='투입 시간')
+    activity_type = db.Column(Enum(ActivityType), default=ActivityType.OWN, comment='OWN: 자체 랩 활동, SUPPORT: 다른 랩 지원 활동')
     
     # 지원 활동인 경우 지원받는 랩
-    supported_lab_id = db.Column(db.Integer, db.ForeignKey('labs.id'))
+    supported_lab_id = db.Column(db.Integer, db.ForeignKey('labs.id'), comment='지원 활동인 경우 지원받는 랩')
     
     description = db.Column(db.Text)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
@@ -117,6 +118,14 @@ class Activity(db.Model):
     
     # 관계
     supported_lab = db.relationship('Lab', foreign_keys=[supported_lab_id])
+    
+    # 조회/집계용 복합 인덱스 (기간 + 랩/프로젝트/유형 필터)
+    __table_args__ = (
+        db.Index('ix_activities_activity_date', 'activity_date'),
+        db.Index('ix_activities_lab_date', 'lab_id', 'activity_date'),
+        db.Index('ix_activities_project_date', 'project_id', 'activity_date'),
+        db.Index('ix_activities_support', 'activity_type', 'lab_id', 'supported_lab_id', 'activity_date'),
+    )
 
 # 비용 데이터
 class Cost(db.Model):
@@ -124,16 +133,24 @@ class Cost(db.Model):
     
     id = db.Column(db.Integer, primary_key=True)
     lab_id = db.Column(db.Integer, db.ForeignKey('labs.id'), nullable=False)
-    project_id = db.Column(db.Integer, db.ForeignKey('projects.id'))  # NULL 가능 (미상)
+    project_id = db.Column(db.Integer, db.ForeignKey('projects.id'), comment='NULL 가능 (미상)')
     
     cost_date = db.Column(db.Date, nullable=False)
-    amount = db.Column(Numeric(15, 2), nullable=False)
-    cost_type = db.Column(Enum(CostType), nullable=False)
-    category = db.Column(db.String(50))  # 비용 카테고리 (인건비, 장비비, 기타 등)
+    amount = db.Column(Numeric(15, 2), nullable=False, comment='금액 (원)')
+    cost_type = db.Column(Enum(CostType), nullable=False, comment='ACTUAL: 실제 비용, BUDGET: 예산성 비용')
+    category = db.Column(db.String(50), comment='비용 카테고리 (인건비, 장비비, 기타 등)')
     description = db.Column(db.Text)
     
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    # 조회/집계용 복합 인덱스 (기간 + 랩/프로젝트/비용유형 필터)
+    __table_args__ = (
+        db.Index('ix_costs_cost_date', 'cost_date'),
+        db.Index('ix_costs_lab_date', 'lab_id', 'cost_date'),
+        db.Index('ix_costs_project_date', 'project_id', 'cost_date'),
+        db.Index('ix_costs_type_date', 'cost_type', 'cost_date'),
+    )
 
 # 랩간 지원 관계 매트릭스 (분석용)
 class LabSupportRelation(db.Model):
@@ -150,4 +167,84 @@ class LabSupportRelation(db.Model):
     supported_lab = db.relationship('Lab', foreign_keys=[supported_lab_id])
     
     # 유니크 제약조건
-    __table_args__ = (db.UniqueConstraint('supporting_lab_id', 'supported_lab_id'),) 
+    __table_args__ = (db.UniqueConstraint('supporting_lab_id', 'supported_lab_id'),)
+
+# 일별 활동 집계 (랩/프로젝트/인원/활동유형/지원대상 랩 단위, 쓰기 시 증분 갱신)
+class ActivityDailyRollup(db.Model):
+    __tablename__ = 'activity_daily_rollups'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    activity_date = db.Column(db.Date, nullable=False)
+    lab_id = db.Column(db.Integer, db.ForeignKey('labs.id'), nullable=False)
+    project_id = db.Column(db.Integer, nullable=False, default=0, comment='0: 미상')
+    personnel_id = db.Column(db.Integer, db.ForeignKey('personnel.id'), nullable=False)
+    activity_type = db.Column(Enum(ActivityType), nullable=False)
+    supported_lab_id = db.Column(db.Integer, nullable=False, default=0, comment='0: 지원 대상 없음')
+    total_hours = db.Column(db.Float, nullable=False, default=0.0)
+    activity_count = db.Column(db.Integer, nullable=False, default=0)
+    
+    __table_args__ = (
+        db.UniqueConstraint(
+            'activity_date', 'lab_id', 'project_id', 'personnel_id', 'activity_type', 'supported_lab_id',
+            name='uq_activity_daily_rollups_key'
+        ),
+        db.Index('ix_activity_daily_rollups_lab_date', 'lab_id', 'activity_date'),
+        db.Index('ix_activity_daily_rollups_project_date', 'project_id', 'activity_date'),
+    )
+
+# 일별 비용 집계 (랩/프로젝트/비용유형/카테고리 단위, 쓰기 시 증분 갱신)
+class CostDailyRollup(db.Model):
+    __tablename__ = 'cost_daily_rollups'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    cost_date = db.Column(db.Date, nullable=False)
+    lab_id = db.Column(db.Integer, db.ForeignKey('labs.id'), nullable=False)
+    project_id = db.Column(db.Integer, nullable=False, default=0, comment='0: 미상')
+    cost_type = db.Column(Enum(CostType), nullable=False)
+    category = db.Column(db.String(50), nullable=False, default='', comment="'': 미분류")
+    total_amount = db.Column(Numeric(15, 2), nullable=False, default=0)
+    cost_count = db.Column(db.Integer, nullable=False, default=0)
+    
+    __table_args__ = (
+        db.UniqueConstraint(
+            'cost_date', 'lab_id', 'project_id', 'cost_type', 'category',
+            name='uq_cost_daily_rollups_key'
+        ),
+        db.Index('ix_cost_daily_rollups_lab_date', 'lab_id', 'cost_date'),
+        db.Index('ix_cost_daily_rollups_project_date', 'project_id', 'cost_date'),
+        db.Index('ix_cost_daily_rollups_type_date', 'cost_type', 'cost_date'),
+    )
+
+# 테이블별 데이터 버전 (쓰기마다 증가, 캐시 무효화용)
+class DataVersion(db.Model):
+    __tablename__ = 'data_versions'
+    
+    name = db.Column(db.String(50), primary_key=True)  # 테이블명
+    version = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.Float, comment='마지막 변경 시각 (UNIX time)')
+
+# 챗봇 캐시 (질문→SQL, SQL+데이터 버전→요약), 워커 재시작 후에도 유지
+class ChatCacheEntry(db.Model):
+    __tablename__ = 'chat_cache'
+    
+    key = db.Column(db.String(64), primary_key=True)  # 캐시 키 (sha256)
+    kind = db.Column(db.String(20), nullable=False)  # sql / summary
+    value = db.Column(db.Text, nullable=False)
+    created_at = db.Column(db.Float, nullable=False)  # UNIX time
+
+# 기존 DB 업그레이드: 누락된 테이블/컬럼/인덱스만 생성 (데이터 보존, 반복 실행 가능)
+# 추가 컬럼은 NULL 허용 또는 기본값이 있는 컬럼만 가능 (SQLite ADD COLUMN 제약)
+def upgrade_schema(engine):
+    db.metadata.create_all(bind=engine, checkfirst=True)
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table in db.metadata.sorted_tables:
+            existing = {column['name'] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name not in existing:
+                    ddl = CreateColumn(column).compile(dialect=engine.dialect)
+                    conn.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {ddl}'))
+    for table in db.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
@@ -0,0 +1,15 @@
+from app import app, db
+from models import ActivityDailyRollup, CostDailyRollup
+from rollups import rebuild_rollups
+
+def rebuild():
+    """일별 집계 테이블 재구축 (원본 활동/비용 데이터 기준 백필)"""
+    with app.app_context():
+        rebuild_rollups()
+        db.session.commit()
+        print("일별 집계 / 지원 관계 재구축 완료!")
+        print("활동 집계 행 수:", ActivityDailyRollup.query.count())
+        print("비용 집계 행 수:", CostDailyRollup.query.count())
+
+if __name__ == '__main__':
+    rebuild()
@@ -0,0 +1,67 @@
+import io
+import os
+
+# 챗봇 요약 프롬프트용 쿼리 결과 압축
+#  - 작은 결과: 헤더 + 행(CSV) 그대로
+#  - 큰 결과: pandas로 계산한 컬럼별 통계(합계/최소/최대/상위 값) + 앞부분 샘플
+# 행마다 컬럼명을 반복하는 dict repr 대신 전달해, 프롬프트 크기가 행 수가 아닌 정보량에 비례하도록 함
+# pandas는 첫 요약 시 import (챗봇을 쓰지 않는 워커의 기동 시간 단축)
+
+CHAT_PROMPT_MAX_ROWS = int(os.environ.get('CHAT_PROMPT_MAX_ROWS', 50))   # 이 행 수 이하면 전체 전달
+CHAT_PROMPT_SAMPLE_ROWS = int(os.environ.get('CHAT_PROMPT_SAMPLE_ROWS', 10))
+CHAT_PROMPT_TOP_N = int(os.environ.get('CHAT_PROMPT_TOP_N', 5))
+
+FLOAT_FORMAT = '%.10g'  # 232.20000000000002 → 232.2 (큰 금액은 지수 표기 없이 유지)
+
+def _format_number(value):
+    import pandas as pd
+    if pd.isna(value):
+        return ''
+    return FLOAT_FORMAT % value if isinstance(value, float) else str(value)
+
+def _to_csv(frame):
+    buffer = io.StringIO()
+    frame.to_csv(buffer, index=False, float_format=FLOAT_FORMAT)
+    return buffer.getvalue().rstrip('\n')
+
+# 컬럼별 요약 통계 (숫자: 합계/평균/최소/최대, 그 외: 고유값 수/범위/상위 N개 빈도)
+def _column_digest(frame, top_n):
+    import pandas as pd
+    lines = []
+    for name in frame.columns:
+        column = frame[name]
+        non_null = int(column.notna().sum())
+        if pd.api.types.is_bool_dtype(column) or not pd.api.types.is_numeric_dtype(column):
+            values = column.dropna().astype(str)
+            unique = values.nunique()
+            line = f'- {name}: 값 {non_null}개, 고유값 {unique}개'
+            if non_null:
+                # 문자열 범위 (YYYY-MM-DD 날짜면 기간)
+                line += f', 범위 {values.min()} ~ {values.max()}'
+            if 0 < unique < non_null:
+                counts = values.value_counts().head(top_n)
+                line += ', 상위: ' + ', '.join(f'{value}({count})' for value, count in counts.items())
+            lines.append(line)
+        else:
+            lines.append(
+                f'- {name}: 값 {non_null}개, 합계 {_format_number(column.sum())}, 평균 {_format_number(column.mean())}, '
+                f'최소 {_format_number(column.min())}, 최대 {_format_number(column.max())}'
+            )
+    return lines
+
+# 쿼리 결과 → 요약 프롬프트용 텍스트
+def compact_result(rows, truncated=False, max_rows=CHAT_PROMPT_MAX_ROWS,
+                   sample_rows=CHAT_PROMPT_SAMPLE_ROWS, top_n=CHAT_PROMPT_TOP_N):
+    if not rows:
+        return '(결과 없음)'
+    import pandas as pd
+    frame = pd.DataFrame.from_records(rows)
+    total = f'{len(frame)}행 이상(행 수 제한으로 잘림)' if truncated else f'{len(frame)}행'
+    if len(frame) <= max_rows and not truncated:
+        return f'{total}\n{_to_csv(frame)}'
+
+    lines = [f'{total}, 컬럼별 통계:']
+    lines.extend(_column_digest(frame, top_n))
+    lines.append(f'앞 {min(sample_rows, len(frame))}행 샘플:')
+    lines.append(_to_csv(frame.head(sample_rows)))
+    return '\n'.join(lines)
@@ -0,0 +1,232 @@
+from types import SimpleNamespace
+from sqlalchemy import func, delete, insert, select, and_, or_
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from data_version import bump_data_version
+from models import db, Activity, Cost, ActivityDailyRollup, CostDailyRollup, LabSupportRelation, ActivityType
+
+# 일별 집계 / 랩간 지원 관계 테이블 증분 갱신/재구축
+# 모든 함수는 현재 세션 트랜잭션 안에서 실행되며, commit은 호출하는 쪽에서 처리
+
+ACTIVITY_KEY = ['activity_date', 'lab_id', 'project_id', 'personnel_id', 'activity_type', 'supported_lab_id']
+COST_KEY = ['cost_date', 'lab_id', 'project_id', 'cost_type', 'category']
+
+def activity_rollup_key(activity):
+    return {
+        'activity_date': activity.activity_date,
+        'lab_id': activity.lab_id,
+        'project_id': activity.project_id or 0,
+        'personnel_id': activity.personnel_id,
+        'activity_type': activity.activity_type or ActivityType.OWN,
+        'supported_lab_id': activity.supported_lab_id or 0,
+    }
+
+def cost_rollup_key(cost):
+    return {
+        'cost_date': cost.cost_date,
+        'lab_id': cost.lab_id,
+        'project_id': cost.project_id or 0,
+        'cost_type': cost.cost_type,
+        'category': cost.category or '',
+    }
+
+# 활동 집계 UPSERT 문 (단건/executemany 공용)
+def activity_rollup_upsert():
+    table = ActivityDailyRollup.__table__
+    stmt = sqlite_insert(table)
+    return stmt.on_conflict_do_update(
+        index_elements=ACTIVITY_KEY,
+        set_={
+            'total_hours': table.c.total_hours + stmt.excluded.total_hours,
+            'activity_count': table.c.activity_count + stmt.excluded.activity_count,
+        }
+    )
+
+# 비용 집계 UPSERT 문 (단건/executemany 공용)
+def cost_rollup_upsert():
+    table = CostDailyRollup.__table__
+    stmt = sqlite_insert(table)
+    return stmt.on_conflict_do_update(
+        index_elements=COST_KEY,
+        set_={
+            'total_amount': table.c.total_amount + stmt.excluded.total_amount,
+            'cost_count': table.c.cost_count + stmt.excluded.cost_count,
+        }
+    )
+
+# 지원 관계 UPSERT 문 (시간 누적, 최근 활동일은 더 늦은 날짜로)
+def support_relation_upsert():
+    table = LabSupportRelation.__table__
+    stmt = sqlite_insert(table)
+    return stmt.on_conflict_do_update(
+        index_elements=['supporting_lab_id', 'supported_lab_id'],
+        set_={
+            'total_hours': func.coalesce(table.c.total_hours, 0) + stmt.excluded.total_hours,
+            'last_activity_date': func.max(
+                func.coalesce(table.c.last_activity_date, stmt.excluded.last_activity_date),
+                stmt.excluded.last_activity_date
+            ),
+        }
+    )
+
+# 활동 1건 반영 (sign=1: 추가, sign=-1: 제거)
+def apply_activity_rollup(activity, sign=1):
+    key = activity_rollup_key(activity)
+    table = ActivityDailyRollup.__table__
+    db.session.execute(activity_rollup_upsert(), {
+        **key,
+        'total_hours': sign * float(activity.hours),
+        'activity_count': sign,
+    })
+    if sign < 0:
+        db.session.execute(delete(table).where(
+            and_(*[table.c[name] == value for name, value in key.items()]),
+            table.c.activity_count <= 0
+        ))
+
+# 비용 1건 반영 (sign=1: 추가, sign=-1: 제거)
+def apply_cost_rollup(cost, sign=1):
+    key = cost_rollup_key(cost)
+    table = CostDailyRollup.__table__
+    db.session.execute(cost_rollup_upsert(), {
+        **key,
+        'total_amount': sign * cost.amount,
+        'cost_count': sign,
+    })
+    if sign < 0:
+        db.session.execute(delete(table).where(
+            and_(*[table.c[name] == value for name, value in key.items()]),
+            table.c.cost_count <= 0
+        ))
+
+SUPPORT_HOURS_EPSILON = 1e-9  # 이 값 이하의 지원 시간은 0으로 간주
+
+# 지원 활동 1건을 랩간 지원 관계에 반영 (sign=1: 추가, sign=-1: 제거)
+# 일별 집계가 먼저 반영된 상태에서 호출해야 제거 시 최근 활동일이 정확히 재계산됨
+def apply_support_relation(activity, sign=1):
+    if activity.activity_type != ActivityType.SUPPORT or not activity.supported_lab_id:
+        return
+    if sign > 0:
+        db.session.execute(support_relation_upsert(), {
+            'supporting_lab_id': activity.lab_id,
+            'supported_lab_id': activity.supported_lab_id,
+            'total_hours': float(activity.hours),
+            'last_activity_date': activity.activity_date,
+        })
+        return
+    table = LabSupportRelation.__table__
+    rollup = ActivityDailyRollup.__table__
+    last_activity_date = select(func.max(rollup.c.activity_date)).where(
+        rollup.c.lab_id == activity.lab_id,
+        rollup.c.supported_lab_id == activity.supported_lab_id,
+        rollup.c.activity_type == ActivityType.SUPPORT
+    ).scalar_subquery()
+    db.session.execute(table.update().where(
+        table.c.supporting_lab_id == activity.lab_id,
+        table.c.supported_lab_id == activity.supported_lab_id
+    ).values(
+        total_hours=func.coalesce(table.c.total_hours, 0) - float(activity.hours),
+        last_activity_date=last_activity_date
+    ))
+    # 남은 지원 활동이 없거나 시간이 0(부동소수점 잔차 포함)이면 관계 삭제
+    db.session.execute(delete(table).where(
+        table.c.supporting_lab_id == activity.lab_id,
+        table.c.supported_lab_id == activity.supported_lab_id,
+        or_(table.c.last_activity_date.is_(None), table.c.total_hours <= SUPPORT_HOURS_EPSILON)
+    ))
+
+# 여러 활동(dict 목록)을 일별 집계/지원 관계에 한 번에 반영 (대량 등록용)
+def apply_activity_batch(rows):
+    rollup_deltas = {}
+    relation_deltas = {}
+    for row in rows:
+        key = activity_rollup_key(SimpleNamespace(**row))
+        delta = rollup_deltas.setdefault(tuple(key.values()), {**key, 'total_hours': 0.0, 'activity_count': 0})
+        delta['total_hours'] += float(row['hours'])
+        delta['activity_count'] += 1
+        if row['activity_type'] == ActivityType.SUPPORT and row.get('supported_lab_id'):
+            pair = (row['lab_id'], row['supported_lab_id'])
+            relation = relation_deltas.setdefault(pair, {
+                'supporting_lab_id': pair[0],
+                'supported_lab_id': pair[1],
+                'total_hours': 0.0,
+                'last_activity_date': row['activity_date'],
+            })
+            relation['total_hours'] += float(row['hours'])
+            relation['last_activity_date'] = max(relation['last_activity_date'], row['activity_date'])
+    if rollup_deltas:
+        db.session.execute(activity_rollup_upsert(), list(rollup_deltas.values()))
+    if relation_deltas:
+        db.session.execute(support_relation_upsert(), list(relation_deltas.values()))
+
+# 집계/지원 관계 테이블이 비어 있어 백필이 필요한지 여부
+def rollups_need_backfill():
+    return (
+        (ActivityDailyRollup.query.first() is None and Activity.query.first() is not None)
+        or (CostDailyRollup.query.first() is None and Cost.query.first() is not None)
+        or (LabSupportRelation.query.first() is None
+            and ActivityDailyRollup.query.filter(
+                ActivityDailyRollup.activity_type == ActivityType.SUPPORT,
+                ActivityDailyRollup.supported_lab_id != 0
+            ).first() is not None)
+    )
+
+# 원본 activities/costs 로부터 집계 테이블 전체 재구축 (백필용)
+# 집계 기반 캐시/ETag가 무효화되도록 같은 트랜잭션에서 activities/costs 데이터 버전도 증가 (commit은 호출자)
+def rebuild_rollups():
+    activity_table = ActivityDailyRollup.__table__
+    cost_table = CostDailyRollup.__table__
+
+    db.session.execute(delete(activity_table))
+    activity_type = func.coalesce(Activity.activity_type, ActivityType.OWN.name)
+    project_id = func.coalesce(Activity.project_id, 0)
+    supported_lab_id = func.coalesce(Activity.supported_lab_id, 0)
+    db.session.execute(insert(activity_table).from_select(
+        ACTIVITY_KEY + ['total_hours', 'activity_count'],
+        select(
+            Activity.activity_date,
+            Activity.lab_id,
+            project_id,
+            Activity.personnel_id,
+            activity_type,
+            supported_lab_id,
+            func.sum(Activity.hours),
+            func.count(Activity.id)
+        ).group_by(
+            Activity.activity_date, Activity.lab_id, project_id,
+            Activity.personnel_id, activity_type, supported_lab_id
+        )
+    ))
+
+    db.session.execute(delete(cost_table))
+    cost_project_id = func.coalesce(Cost.project_id, 0)
+    category = func.coalesce(Cost.category, '')
+    db.session.execute(insert(cost_table).from_select(
+        COST_KEY + ['total_amount', 'cost_count'],
+        select(
+            Cost.cost_date,
+            Cost.lab_id,
+            cost_project_id,
+            Cost.cost_type,
+            category,
+            func.sum(Cost.amount),
+            func.count(Cost.id)
+        ).group_by(Cost.cost_date, Cost.lab_id, cost_project_id, Cost.cost_type, category)
+    ))
+
+    # 랩간 지원 관계 (일별 집계 기준)
+    relation_table = LabSupportRelation.__table__
+    db.session.execute(delete(relation_table))
+    db.session.execute(insert(relation_table).from_select(
+        ['supporting_lab_id', 'supported_lab_id', 'total_hours', 'last_activity_date'],
+        select(
+            activity_table.c.lab_id,
+            activity_table.c.supported_lab_id,
+            func.sum(activity_table.c.total_hours),
+            func.max(activity_table.c.activity_date)
+        ).where(
+            activity_table.c.activity_type == ActivityType.SUPPORT,
+            activity_table.c.supported_lab_id != 0
+        ).group_by(activity_table.c.lab_id, activity_table.c.supported_lab_id)
+    ))
+
+    bump_data_version('activities', 'costs')
@@ -0,0 +1,72 @@
+import os
+import re
+import sqlite3
+import time
+
+# 챗봇(LLM 생성 SQL) 실행 전용 샌드박스
+#  - 읽기 전용 연결 풀 (mode=ro URI + query_only) 및 authorizer로 SELECT 외 동작 차단
+#  - 단일 SELECT(WITH 포함) 문만 허용
+#  - progress handler로 실행 시간 제한, fetchmany로 반환 행 수 제한
+
+CHAT_SQL_TIMEOUT = float(os.environ.get('CHAT_SQL_TIMEOUT', 5))  # 초
+CHAT_SQL_MAX_ROWS = int(os.environ.get('CHAT_SQL_MAX_ROWS', 1000))
+
+PROGRESS_STEPS = 10000  # progress handler 호출 간격 (VM 명령 수)
+
+# 읽기에 필요한 동작만 허용 (ATTACH/PRAGMA/쓰기 등은 모두 거부)
+_ALLOWED_ACTIONS = {sqlite3.SQLITE_SELECT, sqlite3.SQLITE_READ, sqlite3.SQLITE_FUNCTION}
+_RECURSIVE = getattr(sqlite3, 'SQLITE_RECURSIVE', None)
+if _RECURSIVE is not None:
+    _ALLOWED_ACTIONS.add(_RECURSIVE)
+
+class SQLSandboxError(Exception):
+    """허용되지 않은 SQL 또는 실행 제한 초과"""
+
+# 주석을 제외하고 SELECT(WITH)로 시작하는 문인지 확인
+# (여러 문장 여부는 sqlite3 execute가 ProgrammingError로 거부)
+def validate_select(sql):
+    head = re.sub(r'--[^\n]*|/\*[\s\S]*?\*/', ' ', sql or '').strip()
+    if not head.rstrip(';').strip():
+        raise SQLSandboxError('실행할 SQL이 없습니다.')
+    if not re.match(r'(SELECT|WITH)\b', head, re.IGNORECASE):
+        raise SQLSandboxError('SELECT 문만 실행할 수 있습니다.')
+    return sql.strip()
+
+def _authorizer(action, arg1, arg2, db_name, trigger):
+    return sqlite3.SQLITE_OK if action in _ALLOWED_ACTIONS else sqlite3.SQLITE_DENY
+
+# SQL 실행 (읽기 전용 풀에서 연결을 빌려 사용) → {'columns', 'rows'(dict 목록), 'truncated'}
+def execute_readonly(engine, sql, timeout=CHAT_SQL_TIMEOUT, max_rows=CHAT_SQL_MAX_ROWS):
+    sql = validate_select(sql)
+    pooled = engine.raw_connection()
+    conn = pooled.driver_connection
+    deadline = time.monotonic() + timeout
+    # authorizer/progress handler는 이 실행 동안만 설치 (풀 반환 전 해제)
+    conn.set_authorizer(_authorizer)
+    conn.set_progress_handler(lambda: 1 if time.monotonic() > deadline else 0, PROGRESS_STEPS)
+    cursor = conn.cursor()
+    try:
+        cursor.execute(sql)
+        columns = [desc[0] for desc in cursor.description] if cursor.description else []
+        rows = cursor.fetchmany(max_rows + 1)
+    except sqlite3.ProgrammingError as e:
+        raise SQLSandboxError('한 번에 하나의 SQL 문만 실행할 수 있습니다.') from e
+    except sqlite3.OperationalError as e:
+        if 'interrupted' in str(e):
+            raise SQLSandboxError(f'쿼리 실행 시간이 {timeout:g}초를 초과했습니다.') from e
+        if 'not authorized' in str(e) or 'readonly' in str(e):
+            raise SQLSandboxError('읽기 전용 조회만 실행할 수 있습니다.') from e
+        # 문법 오류, 없는 테이블/컬럼 등 — 생성된 SQL의 문제이므로 그대로 전달
+        raise SQLSandboxError(f'SQL 실행 오류: {e}') from e
+    finally:
+        cursor.close()
+        conn.set_progress_handler(None, 0)
+        conn.set_authorizer(None)
+        pooled.close()  # 풀에 반환
+    truncated = len(rows) > max_rows
+    rows = rows[:max_rows]
+    return {
+        'columns': columns,
+        'rows': [dict(zip(columns, row)) for row in rows],
+        'truncated': truncated,
+    }
@@ -0,0 +1,50 @@
+import os
+import sqlite3
+from sqlalchemy import create_engine, event
+from sqlalchemy.pool import QueuePool
+
+# SQLite 엔진/연결 설정
+#  - 모든 연결에 WAL, synchronous=NORMAL, busy_timeout, cache/mmap, temp_store=MEMORY 적용
+#  - 챗봇 SQL 실행용 읽기 전용(mode=ro) 엔진도 같은 설정으로 생성
+# WAL에서는 읽기와 쓰기가 서로 막지 않으므로, 여러 gunicorn 워커에서도 "database is locked"가 나지 않는다.
+
+SQLITE_BUSY_TIMEOUT = int(os.environ.get('SQLITE_BUSY_TIMEOUT', 5000))    # ms
+SQLITE_CACHE_SIZE = int(os.environ.get('SQLITE_CACHE_SIZE', -64000))      # 음수는 KiB 단위 (약 64MB)
+SQLITE_MMAP_SIZE = int(os.environ.get('SQLITE_MMAP_SIZE', 256 * 1024 * 1024))
+SQLITE_READONLY_POOL_SIZE = int(os.environ.get('SQLITE_READONLY_POOL_SIZE', 4))
+
+def apply_pragmas(dbapi_connection, readonly=False):
+    cursor = dbapi_connection.cursor()
+    try:
+        # journal_mode는 DB 파일에 기록되는 설정이라 쓰기 가능한 연결에서만 변경
+        if not readonly:
+            cursor.execute('PRAGMA journal_mode=WAL')
+            cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.execute(f'PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT}')
+        cursor.execute(f'PRAGMA cache_size={SQLITE_CACHE_SIZE}')
+        cursor.execute(f'PRAGMA mmap_size={SQLITE_MMAP_SIZE}')
+        cursor.execute('PRAGMA temp_store=MEMORY')
+        if readonly:
+            cursor.execute('PRAGMA query_only=ON')
+    finally:
+        cursor.close()
+
+# 기존 엔진(Flask-SQLAlchemy가 생성한 db.engine 등)에 연결 시 PRAGMA 적용
+def configure_sqlite(engine, readonly=False):
+    @event.listens_for(engine, 'connect')
+    def _on_connect(dbapi_connection, connection_record):
+        apply_pragmas(dbapi_connection, readonly=readonly)
+    return engine
+
+# 읽기 전용(mode=ro) 연결 풀 엔진
+def create_readonly_engine(db_path, pool_size=SQLITE_READONLY_POOL_SIZE):
+    uri = f'file:{os.path.abspath(db_path)}?mode=ro'
+
+    def creator():
+        conn = sqlite3.connect(uri, uri=True, timeout=SQLITE_BUSY_TIMEOUT / 1000, check_same_thread=False)
+        apply_pragmas(conn, readonly=True)
+        return conn
+
+    # creator 사용 시 URL이 메모리 DB로 보이므로 풀 클래스를 명시
+    return create_engine('sqlite://', creator=creator, poolclass=QueuePool,
+                         pool_size=pool_size, max_overflow=pool_size)
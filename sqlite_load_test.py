@@ -0,0 +1,115 @@
+import argparse
+import multiprocessing
+import os
+import random
+import shutil
+import tempfile
+import time
+from datetime import date, timedelta
+
+# SQLite 동시 읽기/쓰기 부하 테스트
+# DB 사본에 대해 여러 프로세스(gunicorn 워커 가정)가 활동 등록(쓰기)과
+# 대시보드/목록/통계/챗봇 SQL(읽기)을 동시에 실행하고, "database is locked" 등 오류 수를 집계한다.
+
+READ_PATHS = [
+    '/api/dashboard',
+    '/api/activities?limit=200',
+    '/api/labs/stats',
+    '/api/lab-connections',
+]
+CHAT_SQL = 'SELECT lab_id, SUM(total_hours) AS hours FROM activity_daily_rollups GROUP BY lab_id;'
+
+def _worker(role, seconds, seed, queue):
+    # DATABASE_PATH 환경 변수 설정 후 워커 프로세스 안에서 앱 import (연결을 부모와 공유하지 않음)
+    from app import app, db, chat_engine
+    from models import Lab, Personnel
+    from sql_sandbox import execute_readonly
+
+    rng = random.Random(seed)
+    client = app.test_client()
+    with app.app_context():
+        lab_ids = [lab.id for lab in Lab.query.all()]
+        personnel_ids = [person.id for person in Personnel.query.all()]
+        db.session.remove()
+
+    stats = {'role': role, 'ok': 0, 'errors': 0, 'locked': 0, 'latencies': []}
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        started = time.perf_counter()
+        error = None
+        try:
+            if role == 'writer':
+                lab_id = rng.choice(lab_ids)
+                supported = rng.random() < 0.4 and len(lab_ids) > 1
+                response = client.post('/api/activities', json={
+                    'personnel_id': rng.choice(personnel_ids),
+                    'lab_id': lab_id,
+                    'activity_date': (date.today() - timedelta(days=rng.randrange(90))).isoformat(),
+                    'hours': round(rng.uniform(0.5, 8), 1),
+                    'activity_type': 'support' if supported else 'own',
+                    'supported_lab_id': rng.choice([i for i in lab_ids if i != lab_id]) if supported else None,
+                    'description': '부하 테스트',
+                })
+            elif rng.random() < 0.25:
+                execute_readonly(chat_engine, CHAT_SQL)
+                response = None
+            else:
+                response = client.get(rng.choice(READ_PATHS))
+            if response is not None and response.status_code >= 400:
+                error = (response.get_json(silent=True) or {}).get('error', str(response.status_code))
+        except Exception as e:
+            error = str(e)
+        stats['latencies'].append(time.perf_counter() - started)
+        if error:
+            stats['errors'] += 1
+            stats['locked'] += 'locked' in error
+        else:
+            stats['ok'] += 1
+    queue.put(stats)
+
+def _percentile(values, ratio):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * ratio))] * 1000 if values else 0
+
+def main():
+    parser = argparse.ArgumentParser(description='SQLite 동시 읽기/쓰기 부하 테스트 (DB 사본 사용)')
+    parser.add_argument('--db', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'future_labs.db'), help='원본 DB 경로')
+    parser.add_argument('--writers', type=int, default=4, help='쓰기 프로세스 수')
+    parser.add_argument('--readers', type=int, default=4, help='읽기 프로세스 수')
+    parser.add_argument('--seconds', type=float, default=10, help='실행 시간(초)')
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='labs-load-')
+    db_path = os.path.join(workdir, 'future_labs.db')
+    shutil.copy(args.db, db_path)
+    os.environ['DATABASE_PATH'] = db_path
+
+    queue = multiprocessing.Queue()
+    roles = ['writer'] * args.writers + ['reader'] * args.readers
+    processes = [multiprocessing.Process(target=_worker, args=(role, args.seconds, i, queue)) for i, role in enumerate(roles)]
+    try:
+        for process in processes:
+            process.start()
+        results = [queue.get() for _ in processes]
+        for process in processes:
+            process.join()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    total_locked = 0
+    for role in ('writer', 'reader'):
+        group = [r for r in results if r['role'] == role]
+        if not group:
+            continue
+        latencies = [value for r in group for value in r['latencies']]
+        ok = sum(r['ok'] for r in group)
+        errors = sum(r['errors'] for r in group)
+        locked = sum(r['locked'] for r in group)
+        total_locked += locked
+        print(f"{role}: 성공 {ok}건 ({ok / args.seconds:.0f}/s), 오류 {errors}건 (locked {locked}건), "
+              f"p50 {_percentile(latencies, 0.5):.1f}ms, p99 {_percentile(latencies, 0.99):.1f}ms")
+    if total_locked:
+        raise SystemExit(1)
+
+if __name__ == '__main__':
+    main()
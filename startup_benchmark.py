@@ -0,0 +1,103 @@
+import argparse
+import json
+import os
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+# 앱 기동 시간(콜드 스타트) 측정 및 예산 검사
+# 매 회 새 Python 프로세스(gunicorn 워커 기동/재시작 가정)에서 app import 시간과 첫 요청 처리 시간을 재고,
+# 중앙값이 예산을 넘거나 기동 시 지연 import 대상 모듈(pandas 등)이 로드되면 종료 코드 1.
+# DB 사본을 사용하고, LLM_API_KEY 없이 기동되는지도 함께 확인한다.
+
+LAZY_MODULES = ('pandas', 'numpy', 'pyarrow', 'requests')  # 첫 사용 시에만 import 되어야 하는 모듈
+
+def _child(path):
+    started = time.perf_counter()
+    import app as app_module
+    imported = time.perf_counter()
+    loaded = [name for name in LAZY_MODULES if name in sys.modules]
+
+    client = app_module.app.test_client()
+    response = client.get(path)
+    first = time.perf_counter()
+    client.get(path)
+    second = time.perf_counter()
+    print(json.dumps({
+        'import_ms': (imported - started) * 1000,
+        'first_request_ms': (first - imported) * 1000,
+        'second_request_ms': (second - first) * 1000,
+        'status': response.status_code,
+        'lazy_loaded': loaded,
+        'max_rss_mib': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }))
+
+def _run_once(db_path, path):
+    env = {key: value for key, value in os.environ.items() if key != 'LLM_API_KEY'}
+    env['DATABASE_PATH'] = db_path
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--child', path],
+        env=env, capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__))
+    )
+    elapsed = (time.perf_counter() - started) * 1000
+    if completed.returncode != 0:
+        raise SystemExit(f'기동 실패 (종료 코드 {completed.returncode}):\n{completed.stderr}')
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    result['process_ms'] = elapsed
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description='앱 콜드 스타트(import + 첫 요청) 시간 측정')
+    parser.add_argument('--db', default=os.environ.get('DATABASE_PATH', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'future_labs.db')),
+                        help='원본 DB 경로 (사본에 대해 실행)')
+    parser.add_argument('--path', default='/api/dashboard', help='첫 요청 경로')
+    parser.add_argument('--runs', type=int, default=5, help='측정 횟수 (중앙값으로 예산 비교)')
+    parser.add_argument('--import-budget-ms', type=float, default=1000, help='app import 시간 예산')
+    parser.add_argument('--first-request-budget-ms', type=float, default=500, help='첫 요청 처리 시간 예산')
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _child(args.child)
+        return
+
+    workdir = tempfile.mkdtemp(prefix='labs-startup-')
+    try:
+        db_path = os.path.join(workdir, 'future_labs.db')
+        shutil.copy(args.db, db_path)
+        results = [_run_once(db_path, args.path) for _ in range(args.runs)]
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(f"{'회차':<6}{'프로세스(ms)':>14}{'import(ms)':>12}{'첫 요청(ms)':>13}{'두 번째(ms)':>13}{'RSS(MiB)':>10}  상태")
+    for i, result in enumerate(results, 1):
+        print(f"{i:<6}{result['process_ms']:>14.0f}{result['import_ms']:>12.0f}{result['first_request_ms']:>13.1f}"
+              f"{result['second_request_ms']:>13.1f}{result['max_rss_mib']:>10.0f}  {result['status']}")
+
+    import_ms = statistics.median(result['import_ms'] for result in results)
+    first_request_ms = statistics.median(result['first_request_ms'] for result in results)
+    print(f"중앙값: import {import_ms:.0f}ms (예산 {args.import_budget_ms:.0f}ms), "
+          f"첫 요청 {first_request_ms:.1f}ms (예산 {args.first_request_budget_ms:.0f}ms)")
+
+    failures = []
+    if import_ms > args.import_budget_ms:
+        failures.append('import 시간 예산 초과')
+    if first_request_ms > args.first_request_budget_ms:
+        failures.append('첫 요청 시간 예산 초과')
+    loaded = sorted({name for result in results for name in result['lazy_loaded']})
+    if loaded:
+        failures.append(f"기동 시 로드된 지연 import 대상 모듈: {', '.join(loaded)}")
+    if any(result['status'] >= 400 for result in results):
+        failures.append(f'{args.path} 요청 실패')
+    for failure in failures:
+        print(failure)
+    if failures:
+        raise SystemExit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,204 @@
+from datetime import date, datetime, timedelta
+import numpy as np
+from sqlalchemy import insert
+from models import db, Lab, Project, Personnel, Activity, Cost, ActivityType, ProjectStatus, CostType
+from models import project_labs, personnel_labs
+from rollups import rebuild_rollups
+from data_version import bump_data_version
+
+# 재현 가능한 대용량 합성 데이터 생성 (벤치마크/부하 테스트용)
+# 같은 seed, 규모 설정, 마지막 날짜(end_date)면 항상 같은 데이터가 만들어진다 (numpy Generator 하나를 순서대로 사용).
+# end_date 기본값은 고정 날짜 (실행한 날에 따라 데이터가 달라지지 않도록).
+#  - 인원마다 소속 랩(일부는 보조 랩 1개)이 있고 활동은 대부분 소속 랩에서 발생
+#  - 지원 활동은 랩마다 정해진 협력 랩 몇 곳에 몰리도록 생성 (나머지는 임의의 다른 랩)
+#  - 프로젝트는 참여 랩 활동/비용에만 연결, 일부는 미상(NULL)
+#  - 활동/비용은 평일에만 발생
+# 활동/비용은 보조 인덱스를 지운 상태에서 SQLite 저장 형식으로 만든 튜플을 드라이버 executemany로 바로 넣고
+# (SQLAlchemy 파라미터 변환 생략), 적재 후 인덱스와 일별 집계를 다시 만든다.
+
+DEFAULT_SCALE = {
+    'labs': 50,
+    'projects': 200,
+    'personnel': 2000,
+    'activities': 5000000,
+    'costs': 250000,
+    'years': 5,
+    'support_ratio': 0.15,   # 지원 활동 비율
+    'partner_labs': 4,       # 랩별 주요 지원 대상 랩 수
+    'partner_share': 0.8,    # 지원 활동 중 주요 지원 대상 랩으로 가는 비율
+    'unknown_project_ratio': 0.1,
+    'budget_ratio': 0.3,     # 비용 중 예산성 비용 비율
+}
+DEFAULT_CHUNK_SIZE = 50000
+DEFAULT_END_DATE = date(2025, 12, 31)
+
+HOUR_CHOICES = np.arange(1, 17) / 2  # 0.5 ~ 8시간
+HOUR_WEIGHTS = np.array([1, 3, 3, 5, 4, 6, 4, 8, 4, 5, 3, 4, 2, 3, 2, 6], dtype=float)
+COST_CATEGORIES = ['인건비', '장비비', '재료비', '기타']
+SURNAMES = ['김', '이', '박', '최', '정', '강', '조', '윤', '장', '임', '한', '오', '서', '신', '권']
+GIVEN_NAMES = ['민준', '서연', '도윤', '지우', '하준', '서윤', '시우', '지민', '예준', '수아', '주원', '하은', '지호', '윤서', '현우']
+POSITIONS = ['연구원', '선임연구원', '책임연구원', '수석연구원']
+ACTIVITY_COLUMNS = ('personnel_id', 'lab_id', 'project_id', 'activity_date', 'hours', 'activity_type', 'supported_lab_id', 'created_at', 'updated_at')
+COST_COLUMNS = ('lab_id', 'project_id', 'cost_date', 'amount', 'cost_type', 'category', 'created_at', 'updated_at')
+
+def _business_days(end, years):
+    start = end - timedelta(days=365 * years)
+    days = [start + timedelta(days=offset) for offset in range((end - start).days + 1)]
+    return [day for day in days if day.weekday() < 5]
+
+# 랩별 값 목록(길이가 다름)에서 행마다 하나씩 선택 → 선택 불가(목록이 비어 있음)는 -1
+def _pick_ragged(rng, groups, keys):
+    width = max((len(values) for values in groups), default=0) or 1
+    padded = np.full((len(groups), width), -1, dtype=np.int64)
+    counts = np.zeros(len(groups), dtype=np.int64)
+    for index, values in enumerate(groups):
+        padded[index, :len(values)] = values
+        counts[index] = len(values)
+    offsets = (rng.random(len(keys)) * np.maximum(counts[keys], 1)).astype(np.int64)
+    return padded[keys, offsets]
+
+def _insert_chunks(table, rows, chunk_size):
+    for start in range(0, len(rows), chunk_size):
+        db.session.execute(insert(table), rows[start:start + chunk_size])
+
+# 저장 형식 그대로의 튜플 목록 INSERT (날짜는 ISO 문자열, Enum은 이름)
+def _insert_raw(table, columns, rows):
+    sql = f"INSERT INTO {table.name} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+    db.session.connection().exec_driver_sql(sql, rows)
+
+# 활동/비용 적재 중에는 보조 인덱스를 지우고 적재 후 한 번에 생성
+def _drop_indexes(table):
+    for index in table.indexes:
+        index.drop(bind=db.session.connection(), checkfirst=True)
+
+def _create_indexes(table):
+    for index in table.indexes:
+        index.create(bind=db.session.connection(), checkfirst=True)
+
+def generate_dataset(seed=42, chunk_size=DEFAULT_CHUNK_SIZE, end_date=DEFAULT_END_DATE, progress=print, **scale):
+    """빈 DB(테이블 생성 직후)에 합성 데이터 적재 → 테이블별 행 수"""
+    scale = {**DEFAULT_SCALE, **scale}
+    unknown = set(scale) - set(DEFAULT_SCALE)
+    if unknown:
+        raise ValueError(f"알 수 없는 규모 설정입니다: {', '.join(sorted(unknown))}")
+    if scale['labs'] < 2:
+        raise ValueError('지원 활동을 만들려면 랩이 2개 이상 필요합니다.')
+
+    rng = np.random.default_rng(seed)
+    created_at = datetime.combine(end_date, datetime.min.time())
+    created_at_text = created_at.strftime('%Y-%m-%d %H:%M:%S.%f')
+    days = _business_days(end_date, scale['years'])
+    day_texts = [day.isoformat() for day in days]
+    lab_count, project_count, personnel_count = scale['labs'], scale['projects'], scale['personnel']
+
+    # 랩 (id는 빈 DB 기준 1부터 순서대로)
+    lab_ids = np.arange(1, lab_count + 1)
+    _insert_chunks(Lab.__table__, [
+        {'id': int(lab_id), 'code': f'LAB{lab_id:03d}', 'name': f'랩 {lab_id:03d}', 'description': f'합성 데이터 랩 {lab_id}',
+         'created_at': created_at, 'is_active': True}
+        for lab_id in lab_ids
+    ], chunk_size)
+
+    # 프로젝트: 주도 랩 + 참여 랩 0~3개, 기간은 전체 기간 안에서 3개월~2년
+    project_ids = np.arange(1, project_count + 1)
+    lead_labs = rng.choice(lab_ids, project_count)
+    starts = rng.integers(0, len(days), project_count)
+    lengths = rng.integers(90, 730, project_count)
+    suspended = rng.random(project_count) < 0.05
+    projects, participants = [], []
+    for project_id, lead_lab, start, length, is_suspended in zip(project_ids, lead_labs, starts, lengths, suspended):
+        start_date = days[start]
+        end = start_date + timedelta(days=int(length))
+        status = ProjectStatus.SUSPENDED if is_suspended else (ProjectStatus.ACTIVE if end >= end_date else ProjectStatus.COMPLETED)
+        projects.append({
+            'id': int(project_id), 'code': f'PRJ{project_id:04d}', 'name': f'프로젝트 {project_id:04d}',
+            'description': f'합성 데이터 프로젝트 {project_id}', 'start_date': start_date, 'end_date': end,
+            'status': status, 'created_at': created_at, 'lead_lab_id': int(lead_lab),
+        })
+        members = {int(lead_lab), *(int(lab) for lab in rng.choice(lab_ids, rng.integers(0, 4)))}
+        participants.extend({'project_id': int(project_id), 'lab_id': lab_id} for lab_id in sorted(members))
+    _insert_chunks(Project.__table__, projects, chunk_size)
+    _insert_chunks(project_labs, participants, chunk_size)
+    lab_projects = [[] for _ in lab_ids]
+    for row in participants:
+        lab_projects[row['lab_id'] - 1].append(row['project_id'])
+
+    # 인원: 소속 랩 1개 + 30%는 보조 랩
+    personnel_ids = np.arange(1, personnel_count + 1)
+    home_labs = rng.choice(lab_ids, personnel_count)
+    second_labs = np.where(rng.random(personnel_count) < 0.3, rng.choice(lab_ids, personnel_count), home_labs)
+    surnames = rng.choice(SURNAMES, personnel_count)
+    given_names = rng.choice(GIVEN_NAMES, personnel_count)
+    positions = rng.choice(POSITIONS, personnel_count, p=[0.5, 0.3, 0.15, 0.05])
+    inactive = rng.random(personnel_count) < 0.05
+    _insert_chunks(Personnel.__table__, [
+        {'id': int(person_id), 'employee_id': f'EMP{person_id:05d}', 'name': f'{surname}{given}',
+         'email': f'emp{person_id:05d}@example.com', 'ms_teams_id': f'emp{person_id:05d}@example.com',
+         'position': position, 'is_active': not is_inactive, 'created_at': created_at}
+        for person_id, surname, given, position, is_inactive in zip(personnel_ids, surnames, given_names, positions, inactive)
+    ], chunk_size)
+    memberships = {(int(person_id), int(lab_id)) for person_id, home, second in zip(personnel_ids, home_labs, second_labs) for lab_id in (home, second)}
+    _insert_chunks(personnel_labs, [{'personnel_id': person_id, 'lab_id': lab_id} for person_id, lab_id in sorted(memberships)], chunk_size)
+    progress(f'랩 {lab_count}개, 프로젝트 {project_count}개, 인원 {personnel_count}명 생성')
+
+    # 랩별 주요 지원 대상 랩 (자기 자신 제외)
+    partners = np.array([
+        rng.choice(np.delete(lab_ids, lab_id - 1), min(scale['partner_labs'], lab_count - 1), replace=False)
+        for lab_id in lab_ids
+    ])
+    hour_weights = HOUR_WEIGHTS / HOUR_WEIGHTS.sum()
+
+    activity_table = Activity.__table__
+    _drop_indexes(activity_table)
+    for start in range(0, scale['activities'], chunk_size):
+        size = min(chunk_size, scale['activities'] - start)
+        person = rng.integers(0, personnel_count, size)
+        lab = np.where(rng.random(size) < 0.9, home_labs[person], second_labs[person])
+        project = _pick_ragged(rng, lab_projects, lab - 1)
+        project = np.where(rng.random(size) < scale['unknown_project_ratio'], -1, project)
+        support = rng.random(size) < scale['support_ratio']
+        partner = partners[lab - 1, rng.integers(0, partners.shape[1], size)]
+        other = (lab - 1 + rng.integers(1, lab_count, size)) % lab_count + 1  # 자기 랩이 아닌 임의의 랩
+        supported = np.where(rng.random(size) < scale['partner_share'], partner, other)
+        day = rng.integers(0, len(days), size)
+        hours = rng.choice(HOUR_CHOICES, size, p=hour_weights)
+        _insert_raw(activity_table, ACTIVITY_COLUMNS, [
+            (p + 1, l, j if j > 0 else None, day_texts[d], h,
+             ActivityType.SUPPORT.name if s else ActivityType.OWN.name, t if s else None,
+             created_at_text, created_at_text)
+            for p, l, j, d, h, s, t in zip(person.tolist(), lab.tolist(), project.tolist(), day.tolist(), hours.tolist(), support.tolist(), supported.tolist())
+        ])
+        progress(f'활동 {start + size:,}/{scale["activities"]:,}')
+    _create_indexes(activity_table)
+
+    cost_table = Cost.__table__
+    _drop_indexes(cost_table)
+    for start in range(0, scale['costs'], chunk_size):
+        size = min(chunk_size, scale['costs'] - start)
+        lab = rng.choice(lab_ids, size)
+        project = _pick_ragged(rng, lab_projects, lab - 1)
+        project = np.where(rng.random(size) < scale['unknown_project_ratio'], -1, project)
+        budget = rng.random(size) < scale['budget_ratio']
+        amount = np.round(rng.lognormal(13.5, 1.0, size), -3)  # 중앙값 약 73만원, 천원 단위
+        category = rng.integers(0, len(COST_CATEGORIES), size)
+        day = rng.integers(0, len(days), size)
+        _insert_raw(cost_table, COST_COLUMNS, [
+            (l, j if j > 0 else None, day_texts[d], a,
+             CostType.BUDGET.name if b else CostType.ACTUAL.name, COST_CATEGORIES[c],
+             created_at_text, created_at_text)
+            for l, j, d, a, b, c in zip(lab.tolist(), project.tolist(), day.tolist(), amount.tolist(), budget.tolist(), category.tolist())
+        ])
+    _create_indexes(cost_table)
+    progress(f'비용 {scale["costs"]:,}건 생성')
+
+    rebuild_rollups()
+    bump_data_version('labs', 'projects', 'personnel', 'activities', 'costs')
+    db.session.commit()
+    progress('일별 집계 / 지원 관계 생성 완료')
+    return {
+        'labs': lab_count,
+        'projects': project_count,
+        'personnel': personnel_count,
+        'activities': scale['activities'],
+        'costs': scale['costs'],
+    }
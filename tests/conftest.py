@@ -0,0 +1,98 @@
+import os
+import sys
+import tempfile
+from datetime import date, timedelta
+
+import pytest
+
+# app은 import 시점에 DATABASE_PATH를 읽으므로 임시 DB 경로를 먼저 지정
+_TEST_DB_DIR = tempfile.mkdtemp(prefix='labs-test-')
+os.environ['DATABASE_PATH'] = os.path.join(_TEST_DB_DIR, 'test.db')
+os.environ['SCHEMA_CHECK'] = 'off'  # 스키마는 app 픽스처에서 create_all로 생성
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event
+from app import app as flask_app, db
+import dashboard_cache
+from models import Lab, Project, Personnel, Activity, Cost, ActivityType, CostType
+
+@pytest.fixture
+def app():
+    with flask_app.app_context():
+        db.drop_all()
+        db.create_all()
+        # 테스트마다 DB를 새로 만들어 데이터 버전이 0부터 다시 시작하므로 프로세스 내 캐시도 비움
+        dashboard_cache._cache.clear()
+        yield flask_app
+        db.session.remove()
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+# 규모(size)에 비례하는 샘플 데이터 생성 (start부터 하루 간격) — 랩 3개, 프로젝트/인원 size개, 활동 size*5건, 비용 size*2건
+@pytest.fixture
+def seed(app):
+    def _seed(size, start=date(2025, 1, 1)):
+        labs = [Lab(code=f'LAB{i}', name=f'랩 {i}') for i in range(3)]
+        db.session.add_all(labs)
+        projects = [
+            Project(code=f'P{i}', name=f'프로젝트 {i}', lead_lab=labs[i % 3], labs=[labs[i % 3], labs[(i + 1) % 3]])
+            for i in range(size)
+        ]
+        personnel = [
+            Personnel(employee_id=f'E{i:04d}', name=f'인원 {i}', email=f'e{i}@example.com', labs=[labs[i % 3]])
+            for i in range(size)
+        ]
+        db.session.add_all(projects + personnel)
+        db.session.flush()
+        for i in range(size * 5):
+            support = i % 2 == 1
+            db.session.add(Activity(
+                personnel_id=personnel[i % size].id,
+                lab_id=labs[i % 3].id,
+                project_id=projects[i % size].id,
+                activity_date=start + timedelta(days=i),
+                hours=4.0,
+                activity_type=ActivityType.SUPPORT if support else ActivityType.OWN,
+                supported_lab_id=labs[(i + 1) % 3].id if support else None,
+            ))
+        for i in range(size * 2):
+            db.session.add(Cost(
+                lab_id=labs[i % 3].id,
+                project_id=projects[i % size].id,
+                cost_date=start + timedelta(days=i),
+                amount=1000,
+                cost_type=CostType.ACTUAL,
+                category='기타',
+            ))
+        db.session.commit()
+    return _seed
+
+# 블록 안에서 실행된 SQL 문 (문, 파라미터) 목록 수집
+class StatementCounter:
+    def __init__(self, engine):
+        self.engine = engine
+        self.executed = []
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.executed.append((statement, parameters))
+
+    @property
+    def statements(self):
+        return [statement for statement, _ in self.executed]
+
+    def __enter__(self):
+        event.listen(self.engine, 'before_cursor_execute', self._record)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, 'before_cursor_execute', self._record)
+
+    @property
+    def count(self):
+        return len(self.statements)
+
+@pytest.fixture
+def count_statements(app):
+    return lambda: StatementCounter(db.engine)
@@ -0,0 +1,31 @@
+import app as app_module
+from chat_cache import sql_cache, summary_cache
+
+# 같은 SQL로 변환되는 서로 다른 질문은 각자의 답변을, 같은 질문(표기 차이만)은 캐시된 답변을 받아야 함
+class FakeLLM:
+    def __init__(self):
+        self.summaries = 0
+
+    def complete(self, payload, label='default'):
+        if label == 'sql':
+            return 'SELECT name FROM labs ORDER BY id;'
+        self.summaries += 1
+        question = payload['messages'][0]['content'].splitlines()[0]
+        return f'답변: {question}'
+
+def test_answer_cache_is_keyed_by_question(client, seed, monkeypatch):
+    seed(2)
+    for cache in (sql_cache, summary_cache):  # 프로세스 내 LRU는 테스트 간 공유되므로 비움
+        cache._entries.clear()
+    llm = FakeLLM()
+    monkeypatch.setattr(app_module, 'get_llm', lambda: llm)
+
+    first = client.post('/api/chat', json={'query': '랩 이름 목록 알려줘'}).get_json()
+    second = client.post('/api/chat', json={'query': '랩이 몇 개야?'}).get_json()
+    repeated = client.post('/api/chat', json={'query': '  랩 이름 목록 알려줘?'}).get_json()
+
+    assert first['sql'] == second['sql']
+    assert '랩 이름 목록 알려줘' in first['answer']
+    assert '랩이 몇 개야' in second['answer']
+    assert repeated['answer'] == first['answer'] and repeated['cached']['summary']
+    assert llm.summaries == 2
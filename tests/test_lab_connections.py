@@ -0,0 +1,24 @@
+from models import db, Lab, LabSupportRelation
+
+# 지원 활동 삭제/수정 후 시간이 0(또는 부동소수점 잔차)만 남은 랩 쌍은 연결로 표시되지 않아야 함
+def _support(client, hours, lab_id, supported_lab_id):
+    response = client.post('/api/activities', json={
+        'personnel_id': 1, 'lab_id': lab_id, 'activity_date': '2025-01-10',
+        'hours': hours, 'activity_type': 'support', 'supported_lab_id': supported_lab_id,
+    })
+    assert response.status_code == 201
+    return response.get_json()['id']
+
+def test_zero_hour_support_relation_is_removed(client, seed):
+    seed(2)
+    labs = [lab_id for (lab_id,) in db.session.query(Lab.id).order_by(Lab.id)]
+    first = _support(client, 0.1, labs[0], labs[1])
+    _support(client, 0.0, labs[0], labs[1])
+    _support(client, 0.3, labs[1], labs[2])
+
+    assert client.delete(f'/api/activities/{first}').status_code == 200
+
+    pairs = {(row.supporting_lab_id, row.supported_lab_id) for row in LabSupportRelation.query}
+    assert (labs[0], labs[1]) not in pairs
+    connections = client.get('/api/lab-connections').get_json()
+    assert [row['total_hours'] for row in connections] == [0.3]
@@ -0,0 +1,137 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+import llm_client
+from llm_client import LLMClient, LLMError
+
+# 로컬 스텁 HTTP 서버(LLM_API_URL 대용)에 대해 LLMClient 재시도/타임아웃/스트리밍 검사
+# 서버는 요청마다 responses 목록에서 앞에서부터 하나씩 꺼내 응답한다.
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers['content-length'])))
+        self.server.received.append(body)
+        respond = self.server.responses.pop(0)
+        respond(self)
+
+    def send_json(self, status, data, headers=()):
+        payload = json.dumps(data).encode('utf-8')
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header('content-type', 'application/json')
+        self.send_header('content-length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def send_chunks(self, chunks):
+        self.send_response(200)
+        self.send_header('content-type', 'text/event-stream')
+        self.send_header('transfer-encoding', 'chunked')
+        self.end_headers()
+        for chunk in chunks:
+            data = chunk.encode('utf-8') if isinstance(chunk, str) else chunk
+            self.wfile.write(f'{len(data):x}\r\n'.encode() + data + b'\r\n')
+            self.wfile.flush()
+        self.wfile.write(b'0\r\n\r\n')
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _StubHandler)
+    server.daemon_threads = True
+    server.responses = []
+    server.received = []
+    thread = threading.Thread(target=server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+def _client(server, **kwargs):
+    return LLMClient(f'http://127.0.0.1:{server.server_address[1]}/v1/messages', 'test-key', **kwargs)
+
+def _message(text):
+    return {'content': [{'type': 'text', 'text': text}]}
+
+def test_retries_429_with_retry_after(stub_server):
+    stub_server.responses = [
+        lambda h: h.send_json(429, {'error': 'rate limited'}, headers=[('retry-after', '0')]),
+        lambda h: h.send_json(200, _message('SELECT 1;')),
+    ]
+    client = _client(stub_server, max_retries=2)
+    assert client.complete({'messages': []}, label='sql') == 'SELECT 1;'
+    assert len(stub_server.received) == 2
+    assert client.latency.snapshot()['sql:ok']['count'] == 1
+
+def test_does_not_retry_client_errors(stub_server):
+    stub_server.responses = [lambda h: h.send_json(400, {'error': 'bad request'})]
+    client = _client(stub_server, max_retries=2)
+    with pytest.raises(LLMError, match='HTTP 400'):
+        client.complete({'messages': []})
+    assert len(stub_server.received) == 1
+
+def test_read_timeout_on_stalled_response(stub_server):
+    def stall(handler):
+        time.sleep(1.0)
+        handler.send_json(200, _message('too late'))
+    stub_server.responses = [stall]
+    client = _client(stub_server, max_retries=0)
+    client.timeout = (1, 0.2)
+    started = time.perf_counter()
+    with pytest.raises(LLMError, match='LLM 호출 실패'):
+        client.complete({'messages': []}, label='sql')
+    assert time.perf_counter() - started < 0.9
+    assert client.latency.snapshot()['sql:error']['count'] == 1
+
+def test_queue_timeout_when_concurrency_exhausted(stub_server, monkeypatch):
+    monkeypatch.setattr(llm_client, 'LLM_QUEUE_TIMEOUT', 0.05)
+    client = _client(stub_server, max_concurrency=1)
+    client._acquire()  # 슬롯 1개를 점유한 상태
+    try:
+        with pytest.raises(LLMError, match='동시 호출 한도'):
+            client.complete({'messages': []})
+    finally:
+        client._semaphore.release()
+    assert stub_server.received == []
+
+def test_stream_parses_chunked_sse(stub_server):
+    def sse(event):
+        return f"event: {event['type']}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+    delta = lambda text: sse({'type': 'content_block_delta', 'index': 0, 'delta': {'type': 'text_delta', 'text': text}})
+    body = ''.join([
+        sse({'type': 'message_start'}),
+        sse({'type': 'ping'}),
+        delta('랩별 '),
+        'data: {not json}\n\n',
+        delta('활동 시간은 '),
+        delta('AFL이 가장 많습니다.'),
+        sse({'type': 'message_stop'}),
+    ])
+    # 이벤트/멀티바이트 문자 경계와 무관하게 청크 분할
+    encoded = body.encode('utf-8')
+    chunks = [encoded[start:start + 7] for start in range(0, len(encoded), 7)]
+    stub_server.responses = [lambda h: h.send_chunks(chunks)]
+
+    client = _client(stub_server, max_concurrency=1)
+    pieces = list(client.stream({'messages': []}, label='summary'))
+    assert pieces == ['랩별 ', '활동 시간은 ', 'AFL이 가장 많습니다.']
+    assert stub_server.received[0]['stream'] is True
+    snapshot = client.latency.snapshot()
+    assert snapshot['summary:ok']['count'] == 1
+    assert snapshot['summary:first_token']['count'] == 1
+    # 스트림 종료 후 동시 호출 슬롯 반환
+    assert client._semaphore.acquire(timeout=0)
+
+def test_stream_error_event_raises(stub_server):
+    body = 'event: error\ndata: {"type": "error", "error": {"type": "overloaded_error"}}\n\n'
+    stub_server.responses = [lambda h: h.send_chunks([body])]
+    client = _client(stub_server)
+    with pytest.raises(LLMError, match='overloaded_error'):
+        list(client.stream({'messages': []}))
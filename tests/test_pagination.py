@@ -0,0 +1,24 @@
+import pytest
+
+# 키셋 커서: 다음 페이지 연결, 잘못된 커서는 고정 메시지로 400
+@pytest.mark.parametrize('path', ['/api/activities', '/api/costs'])
+def test_cursor_pages_cover_all_rows(client, seed, path):
+    seed(4)
+    ids, cursor = [], None
+    while True:
+        query = f'{path}?limit=3' + (f'&cursor={cursor}' if cursor else '')
+        page = client.get(query).get_json()
+        ids.extend(row['id'] for row in page['items'])
+        cursor = page['next_cursor']
+        if not cursor:
+            break
+    assert ids == sorted(set(ids)) and len(ids) == len(client.get(path).get_json())
+
+@pytest.mark.parametrize('path', ['/api/activities', '/api/costs'])
+@pytest.mark.parametrize('options', ['limit=3', 'stream=1', 'format=columnar&limit=3'])
+@pytest.mark.parametrize('cursor', ['abc', '2025-01-01', '2025-13-40:1', '2025-01-01:x', ':', 'MjAyNS0wMS0wMToz', '2025-01-01:1:2'])
+def test_malformed_cursor_returns_stable_error(client, seed, path, options, cursor):
+    seed(2)
+    response = client.get(f'{path}?{options}&cursor={cursor}')
+    assert response.status_code == 400
+    assert response.get_json() == {'error': 'invalid cursor'}
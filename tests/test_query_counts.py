@@ -0,0 +1,21 @@
+import pytest
+from models import db
+
+# 목록 API의 SQL 실행 수는 행 수와 무관해야 함 (관계 lazy 로딩 N+1 회귀 방지)
+LIST_ROUTES = ['/api/activities', '/api/projects', '/api/personnel']
+
+def _statements_for(client, seed, count_statements, path, size):
+    seed(size)
+    with count_statements() as counter:
+        response = client.get(path)
+    assert response.status_code == 200
+    return counter.count, len(response.get_json())
+
+@pytest.mark.parametrize('path', LIST_ROUTES)
+def test_list_route_statement_count_is_constant(client, seed, count_statements, path):
+    small, small_rows = _statements_for(client, seed, count_statements, path, 2)
+    db.drop_all()
+    db.create_all()
+    large, large_rows = _statements_for(client, seed, count_statements, path, 20)
+    assert large_rows > small_rows
+    assert large == small
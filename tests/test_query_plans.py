@@ -0,0 +1,45 @@
+import pytest
+from models import db
+from rollups import rebuild_rollups
+
+# 주요 조회 라우트가 실제로 보내는 SQL의 실행 계획 검사 — 큰 테이블(원본/일별 집계)을
+# 전체 SCAN하지 않고 인덱스로 SEARCH해야 함 (라우트/인덱스 변경 시 회귀 방지)
+LARGE_TABLES = ('activities', 'costs', 'activity_daily_rollups', 'cost_daily_rollups')
+
+ROUTES = [
+    '/api/activities?start_date=2025-01-01&end_date=2025-03-31',
+    '/api/activities?lab_id=1&start_date=2025-01-01',
+    '/api/costs?start_date=2025-01-01&end_date=2025-03-31',
+    '/api/costs?project_id=1',
+    '/api/dashboard',
+    '/api/labs/stats',
+    '/api/labs/stats?start_date=2025-01-01&end_date=2025-03-31&project_id=1',
+    '/api/labs/1/stats?start_date=2025-01-01',
+    '/api/lab-connections?start_date=2025-01-01&end_date=2025-03-31',
+    '/api/lab-connections?project_id=1',
+    '/api/analytics/timeseries?bucket=month&start_date=2025-01-01&end_date=2025-03-31',
+    '/api/analytics/timeseries?bucket=week&lab_id=1&group_by=activity_type',
+    '/api/analytics/timeseries?bucket=day&project_id=1',
+]
+
+def _query_plan(statement, parameters):
+    return [row[-1] for row in db.session.connection().exec_driver_sql(f'EXPLAIN QUERY PLAN {statement}', parameters)]
+
+@pytest.mark.parametrize('path', ROUTES)
+def test_route_queries_search_large_tables_by_index(client, seed, count_statements, path):
+    seed(20)
+    rebuild_rollups()
+    db.session.commit()
+    with count_statements() as counter:
+        response = client.get(path)
+    assert response.status_code == 200
+
+    checked = 0
+    for statement, parameters in counter.executed:
+        if not statement.lstrip().upper().startswith(('SELECT', 'WITH')):
+            continue
+        plan = _query_plan(statement, parameters)
+        scans = [detail for detail in plan for table in LARGE_TABLES if detail.split(' USING ')[0] == f'SCAN {table}']
+        assert not scans, (statement, plan)
+        checked += any(f'SEARCH {table} ' in detail for detail in plan for table in LARGE_TABLES)
+    assert checked, f'{path}: 큰 테이블을 조회하는 SQL이 없음'
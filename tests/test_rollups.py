@@ -0,0 +1,18 @@
+from datetime import date, timedelta
+from models import db
+from rollups import rebuild_rollups
+
+# 집계 재구축 후 집계 기반 응답(대시보드 캐시, ETag)이 갱신되어야 함
+def test_rebuild_rollups_invalidates_caches(client, seed):
+    seed(5, start=date.today() - timedelta(days=60))  # 샘플 데이터는 집계 없이 원본 테이블에만 기록됨
+    before = client.get('/api/dashboard?window=365')
+    assert before.status_code == 200
+    assert before.get_json()['total_hours'] == 0
+
+    rebuild_rollups()
+    db.session.commit()
+
+    revalidated = client.get('/api/dashboard?window=365', headers={'If-None-Match': before.headers['ETag']})
+    assert revalidated.status_code == 200
+    assert revalidated.headers['ETag'] != before.headers['ETag']
+    assert revalidated.get_json()['total_hours'] > 0
@@ -0,0 +1,49 @@
+import os
+import sqlite3
+import subprocess
+import sys
+
+from migrations import SCHEMA_VERSION
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 새 프로세스에서 app import (gunicorn app:app 기동과 같은 경로)
+def _import_app(db_path, schema_check=None):
+    env = {**os.environ, 'DATABASE_PATH': db_path}
+    env.pop('SCHEMA_CHECK', None)
+    if schema_check:
+        env['SCHEMA_CHECK'] = schema_check
+    return subprocess.run([sys.executable, '-c', 'import app'], cwd=ROOT, env=env,
+                          capture_output=True, text=True, timeout=60)
+
+def _user_version(db_path):
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute('PRAGMA user_version').fetchone()[0]
+
+def test_import_fails_fast_on_unmigrated_db(tmp_path):
+    db_path = str(tmp_path / 'old.db')
+    sqlite3.connect(db_path).close()
+
+    result = _import_app(db_path)
+
+    assert result.returncode != 0
+    assert 'MigrationError' in result.stderr
+    assert 'upgrade_db.py' in result.stderr
+    assert _user_version(db_path) == 0
+
+def test_import_applies_pending_migrations_when_requested(tmp_path):
+    db_path = str(tmp_path / 'old.db')
+    sqlite3.connect(db_path).close()
+
+    result = _import_app(db_path, schema_check='migrate')
+
+    assert result.returncode == 0, result.stderr
+    assert _user_version(db_path) == SCHEMA_VERSION
+    # 업그레이드 후에는 기본 설정(fail)으로도 기동
+    assert _import_app(db_path).returncode == 0
+
+def test_import_rejects_unknown_schema_check(tmp_path):
+    result = _import_app(str(tmp_path / 'any.db'), schema_check='maybe')
+
+    assert result.returncode != 0
+    assert 'SCHEMA_CHECK' in result.stderr
@@ -0,0 +1,31 @@
+import argparse
+import os
+os.environ['SCHEMA_CHECK'] = 'off'  # 구 스키마 DB도 열 수 있도록 (이 스크립트가 마이그레이션 적용)
+from app import app, db
+from migrations import SCHEMA_VERSION, get_schema_version, pending_migrations, run_migrations
+
+def upgrade_database():
+    """기존 데이터베이스 업그레이드 (데이터 삭제 없이 대기 중인 마이그레이션 적용)"""
+    parser = argparse.ArgumentParser(description='DB 스키마 마이그레이션')
+    parser.add_argument('--check', action='store_true', help='적용하지 않고 대기 중인 마이그레이션만 출력 (있으면 종료 코드 1)')
+    args = parser.parse_args()
+
+    with app.app_context():
+        current = get_schema_version(db.engine)
+        if args.check:
+            pending = pending_migrations(db.engine)
+            print(f"스키마 버전 {current} / 최신 {SCHEMA_VERSION}")
+            for version, description, _ in pending:
+                print(f"  대기: {version} {description}")
+            if pending:
+                raise SystemExit(1)
+            return
+
+        applied = run_migrations(db.engine, progress=print)
+        if applied:
+            print(f"데이터베이스 업그레이드 완료! (스키마 버전 {current} → {applied[-1]})")
+        else:
+            print(f"이미 최신 스키마입니다. (버전 {current})")
+
+if __name__ == '__main__':
+    upgrade_database()
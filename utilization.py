@@ -0,0 +1,215 @@
+import os
+from datetime import date, timedelta
+from sqlalchemy import Integer, String, case, cast, func, literal, select, type_coerce, union_all
+from models import db, ActivityDailyRollup, Personnel, personnel_labs
+
+# 인원별 가동률 / 과다 배정·공백 감지 (GET /api/personnel/utilization)
+# 일별 집계 테이블에서 인원 × 일 합계(daily)를 한 번 구하고, 같은 쿼리 안에서
+# 주 합계(weekly), 활동일 사이 공백(LAG 윈도 함수, 기간 시작/끝 경계 포함)을 집합 연산으로 계산한다.
+# 인원별 요약 1회 + 상세(과다 배정 일/주, 공백 구간) 1회, 총 2개 쿼리로 인원 수와 무관하게 처리.
+
+UTILIZATION_DAILY_CAPACITY = float(os.environ.get('UTILIZATION_DAILY_CAPACITY', 8))  # 1일 기준 시간
+UTILIZATION_WEEKLY_CAPACITY = float(os.environ.get('UTILIZATION_WEEKLY_CAPACITY', 40))  # 1주 기준 시간
+UTILIZATION_GAP_DAYS = int(os.environ.get('UTILIZATION_GAP_DAYS', 14))  # 이 일수(달력 기준) 이상 활동이 없으면 공백
+UTILIZATION_DEFAULT_DAYS = 90  # 기간 미지정 시 오늘까지 최근 N일
+UTILIZATION_MAX_DETAILS = 1000  # 상세 목록(과다 배정 일/주, 공백) 종류별 최대 건수
+
+# 기간 내 평일 수 (양 끝 포함, 공휴일 미반영)
+def business_days(start_date, end_date):
+    days = (end_date - start_date).days + 1
+    if days <= 0:
+        return 0
+    weeks, rest = divmod(days, 7)
+    return weeks * 5 + sum(1 for offset in range(rest) if (start_date.weekday() + offset) % 7 < 5)
+
+def _utilization_ctes(start_date, end_date, personnel_id=None, lab_id=None):
+    rollup = ActivityDailyRollup.__table__
+
+    # 대상 인원 (재직 중, 랩 소속/인원 필터)
+    people = select(Personnel.id.label('personnel_id')).where(Personnel.is_active.is_(True))
+    if personnel_id is not None:
+        people = people.where(Personnel.id == personnel_id)
+    if lab_id is not None:
+        people = people.where(Personnel.id.in_(
+            select(personnel_labs.c.personnel_id).where(personnel_labs.c.lab_id == lab_id)
+        ))
+    people = people.cte('people')
+
+    # 인원 × 일 합계 (모든 랩/프로젝트 합산)
+    daily = select(
+        rollup.c.personnel_id,
+        rollup.c.activity_date,
+        func.sum(rollup.c.total_hours).label('hours'),
+        func.count(func.distinct(rollup.c.lab_id)).label('lab_count'),
+    ).where(
+        rollup.c.activity_date >= start_date,
+        rollup.c.activity_date <= end_date,
+        rollup.c.personnel_id.in_(select(people.c.personnel_id)),
+    ).group_by(rollup.c.personnel_id, rollup.c.activity_date).cte('daily')
+
+    # 인원 × 주(월요일 시작) 합계
+    week_start = func.date(daily.c.activity_date, 'weekday 0', '-6 days')
+    weekly = select(
+        daily.c.personnel_id,
+        week_start.label('week_start'),
+        func.sum(daily.c.hours).label('hours'),
+    ).group_by(daily.c.personnel_id, week_start).cte('weekly')
+
+    # 활동일 + 기간 앞뒤 경계일 → 직전 활동일과의 간격 (활동이 전혀 없으면 기간 전체가 공백)
+    marks = union_all(
+        select(people.c.personnel_id, literal(start_date - timedelta(days=1)).label('day')),
+        select(people.c.personnel_id, literal(end_date + timedelta(days=1)).label('day')),
+        select(daily.c.personnel_id, daily.c.activity_date.label('day')),
+    ).cte('marks')
+    spans = select(
+        marks.c.personnel_id,
+        marks.c.day,
+        func.lag(marks.c.day).over(partition_by=marks.c.personnel_id, order_by=marks.c.day).label('previous'),
+    ).cte('spans')
+    gaps = select(
+        spans.c.personnel_id,
+        func.date(spans.c.previous, '+1 day').label('gap_start'),
+        func.date(spans.c.day, '-1 day').label('gap_end'),
+        cast(func.julianday(spans.c.day) - func.julianday(spans.c.previous) - 1, Integer).label('days'),
+    ).where(spans.c.previous.isnot(None)).cte('gaps')
+    return people, daily, weekly, gaps
+
+def compute_utilization(start_date=None, end_date=None, daily_capacity=UTILIZATION_DAILY_CAPACITY,
+                        weekly_capacity=UTILIZATION_WEEKLY_CAPACITY, gap_days=UTILIZATION_GAP_DAYS,
+                        personnel_id=None, lab_id=None, flagged_only=False, limit=UTILIZATION_MAX_DETAILS):
+    end_date = end_date or date.today()
+    start_date = start_date or end_date - timedelta(days=UTILIZATION_DEFAULT_DAYS - 1)
+    if start_date > end_date:
+        raise ValueError('start_date는 end_date보다 늦을 수 없습니다.')
+    if daily_capacity <= 0 or weekly_capacity <= 0:
+        raise ValueError('capacity, weekly_capacity는 0보다 커야 합니다.')
+    if gap_days < 1:
+        raise ValueError('gap_days는 1 이상이어야 합니다.')
+    limit = min(max(limit, 0), UTILIZATION_MAX_DETAILS)
+
+    people, daily, weekly, gaps = _utilization_ctes(start_date, end_date, personnel_id, lab_id)
+
+    daily_stats = select(
+        daily.c.personnel_id,
+        func.sum(daily.c.hours).label('total_hours'),
+        func.count().label('active_days'),
+        func.max(daily.c.hours).label('peak_day_hours'),
+        func.sum(case((daily.c.hours > daily_capacity, 1), else_=0)).label('over_days'),
+        func.max(daily.c.lab_count).label('max_labs_per_day'),
+        func.max(daily.c.activity_date).label('last_activity_date'),
+    ).group_by(daily.c.personnel_id).subquery()
+    weekly_stats = select(
+        weekly.c.personnel_id,
+        func.max(weekly.c.hours).label('peak_week_hours'),
+        func.sum(case((weekly.c.hours > weekly_capacity, 1), else_=0)).label('over_weeks'),
+    ).group_by(weekly.c.personnel_id).subquery()
+    gap_stats = select(
+        gaps.c.personnel_id,
+        func.max(gaps.c.days).label('longest_gap'),
+        func.sum(case((gaps.c.days >= gap_days, 1), else_=0)).label('gap_count'),
+    ).group_by(gaps.c.personnel_id).subquery()
+
+    over_days = func.coalesce(daily_stats.c.over_days, 0)
+    over_weeks = func.coalesce(weekly_stats.c.over_weeks, 0)
+    gap_count = func.coalesce(gap_stats.c.gap_count, 0)
+    total_hours = func.coalesce(daily_stats.c.total_hours, 0.0)
+    summary = select(
+        Personnel.id, Personnel.employee_id, Personnel.name,
+        total_hours.label('total_hours'),
+        func.coalesce(daily_stats.c.active_days, 0).label('active_days'),
+        func.coalesce(daily_stats.c.peak_day_hours, 0.0).label('peak_day_hours'),
+        over_days.label('over_days'),
+        func.coalesce(daily_stats.c.max_labs_per_day, 0).label('max_labs_per_day'),
+        func.coalesce(weekly_stats.c.peak_week_hours, 0.0).label('peak_week_hours'),
+        over_weeks.label('over_weeks'),
+        func.coalesce(gap_stats.c.longest_gap, 0).label('longest_gap'),
+        gap_count.label('gap_count'),
+        type_coerce(daily_stats.c.last_activity_date, String).label('last_activity_date'),
+    ).select_from(
+        people.join(Personnel, Personnel.id == people.c.personnel_id)
+        .outerjoin(daily_stats, daily_stats.c.personnel_id == people.c.personnel_id)
+        .outerjoin(weekly_stats, weekly_stats.c.personnel_id == people.c.personnel_id)
+        .outerjoin(gap_stats, gap_stats.c.personnel_id == people.c.personnel_id)
+    ).order_by(total_hours.desc(), Personnel.id)
+    if flagged_only:
+        summary = summary.where((over_days > 0) | (over_weeks > 0) | (gap_count > 0))
+
+    # 상세: 기준 초과 일/주, 공백 구간 (종류별 큰 순서로 limit건)
+    over_day_rows = select(
+        literal('day').label('kind'), daily.c.personnel_id,
+        type_coerce(daily.c.activity_date, String).label('start_date'),
+        type_coerce(daily.c.activity_date, String).label('end_date'),
+        daily.c.hours, daily.c.lab_count.label('value'),
+    ).where(daily.c.hours > daily_capacity).order_by(daily.c.hours.desc(), daily.c.personnel_id).limit(limit).subquery()
+    over_week_rows = select(
+        literal('week').label('kind'), weekly.c.personnel_id,
+        weekly.c.week_start.label('start_date'),
+        func.date(weekly.c.week_start, '+6 days').label('end_date'),
+        weekly.c.hours, literal(None).label('value'),
+    ).where(weekly.c.hours > weekly_capacity).order_by(weekly.c.hours.desc(), weekly.c.personnel_id).limit(limit).subquery()
+    gap_rows = select(
+        literal('gap').label('kind'), gaps.c.personnel_id,
+        gaps.c.gap_start.label('start_date'),
+        gaps.c.gap_end.label('end_date'),
+        literal(None).label('hours'), gaps.c.days.label('value'),
+    ).where(gaps.c.days >= gap_days).order_by(gaps.c.days.desc(), gaps.c.personnel_id).limit(limit).subquery()
+    details = union_all(*(select(rows) for rows in (over_day_rows, over_week_rows, gap_rows)))
+
+    workdays = business_days(start_date, end_date)
+    capacity_hours = workdays * daily_capacity
+    personnel = []
+    names = {}
+    for row in db.session.execute(summary):
+        names[row.id] = row.name
+        flags = [flag for flag, hit in (
+            ('over_daily', row.over_days > 0), ('over_weekly', row.over_weeks > 0), ('gap', row.gap_count > 0)
+        ) if hit]
+        personnel.append({
+            'personnel_id': row.id,
+            'employee_id': row.employee_id,
+            'name': row.name,
+            'total_hours': float(row.total_hours),
+            'active_days': row.active_days,
+            'utilization': float(row.total_hours) / capacity_hours if capacity_hours else None,
+            'avg_hours_per_active_day': float(row.total_hours) / row.active_days if row.active_days else 0.0,
+            'peak_day_hours': float(row.peak_day_hours),
+            'over_allocated_days': row.over_days,
+            'max_labs_per_day': row.max_labs_per_day,
+            'peak_week_hours': float(row.peak_week_hours),
+            'over_allocated_weeks': row.over_weeks,
+            'longest_gap_days': row.longest_gap,
+            'gap_count': row.gap_count,
+            'last_activity_date': row.last_activity_date,
+            'flags': flags,
+        })
+
+    detail = {'day': [], 'week': [], 'gap': []}
+    for row in db.session.execute(details) if limit else ():
+        item = {'personnel_id': row.personnel_id, 'name': names.get(row.personnel_id)}
+        if row.kind == 'day':
+            item.update(date=row.start_date, hours=float(row.hours), lab_count=row.value)
+        elif row.kind == 'week':
+            item.update(week_start=row.start_date, week_end=row.end_date, hours=float(row.hours))
+        else:
+            item.update(start_date=row.start_date, end_date=row.end_date, days=row.value)
+        detail[row.kind].append(item)
+    detail['day'].sort(key=lambda item: (-item['hours'], item['personnel_id']))
+    detail['week'].sort(key=lambda item: (-item['hours'], item['personnel_id']))
+    detail['gap'].sort(key=lambda item: (-item['days'], item['personnel_id']))
+
+    return {
+        'start_date': start_date,
+        'end_date': end_date,
+        'capacity': {'daily': daily_capacity, 'weekly': weekly_capacity, 'gap_days': gap_days},
+        'business_days': workdays,
+        'summary': {
+            'personnel': len(personnel),
+            'total_hours': sum(person['total_hours'] for person in personnel),
+            'over_allocated': sum(1 for person in personnel if {'over_daily', 'over_weekly'} & set(person['flags'])),
+            'with_gaps': sum(1 for person in personnel if 'gap' in person['flags']),
+        },
+        'personnel': personnel,
+        'over_allocated_days': detail['day'],
+        'over_allocated_weeks': detail['week'],
+        'gaps': detail['gap'],
+    }